@@ -1,29 +1,33 @@
 # Imports
 
 from argparse import ArgumentParser, RawDescriptionHelpFormatter
-# noinspection PyCompatibility
-import commands
 from datetime import datetime
 import os
 import random
+import socket
 import sys
 from datetime_machine import DateTime
-from library.constants import BASE_ENVIRONMENT, DEFAULT_SCM, DEVELOPMENT, ENVIRONMENTS, EXIT_OK, EXIT_INPUT, \
-    EXIT_OTHER, EXIT_USAGE, IMAGE_CATEGORIES, LICENSE_CHOICES
+from library.caches import memory_cache
+from library.constants import BASE_ENVIRONMENT, DEFAULT_SCM, DEVELOPMENT, DIRTY_FULL, DIRTY_MODES, ENVIRONMENTS, \
+    EXIT_OK, EXIT_INPUT, EXIT_OTHER, EXIT_USAGE, IMAGE_CATEGORIES, LICENSE_CHOICES
 from library.docs import Entry as DocumentationEntry
-from library.exceptions import OutputError
+from library.exceptions import OutputError, ResourceUnavailable
 from library.issues import Issue
 from library.projects import autoload_project, format_projects_for_csv, format_projects_for_html, \
-    format_projects_for_shell, get_distinct_project_attributes, get_projects, Project
+    format_projects_for_shell, get_all_projects, get_distinct_project_attributes, get_project_facets, \
+    get_project_suggestions, get_projects, iter_all_projects, iter_projects_for_csv, iter_projects_for_html, \
+    iter_projects_for_shell, watch_all_projects, Project
 from library.organizations import BaseOrganization, Business, Client
 from library.passwords import RandomPassword
 from library.releases import Version
 from library.repos import create_local_repo, create_remote_repo, get_repos, BaseRepo
-from library.shell import Command
-from library.shortcuts import find_file, get_input, make_dir, parse_template, print_error, print_info, print_warning, \
-    write_file
+from library.servers import is_server_running, CommandServer
+from library.shell import getstatusoutput, Command
+from library.shortcuts import bytes_to_human, find_file, get_input, make_dir, parse_template, print_error, print_info, \
+    print_warning, write_file, write_lines
+from library.tracing import trace_iter, tracer
 from library.variables import BITBUCKET_USER, DOCUMENTATION_HOME, GITHUB_ENABLED, GITHUB_PASSWORD, GITHUB_USER, \
-    PROJECT_ARCHIVE, PROJECT_HOME, PROJECTS_ON_HOLD, REPO_META_PATH
+    PROJECT_ARCHIVE, PROJECT_HOME, PROJECT_SERVER_SOCKET, PROJECTS_ON_HOLD, REPO_META_PATH
 
 # Exports
 
@@ -43,6 +47,7 @@ __all__ = (
     "lorem_image_command",
     "lorem_text_command",
     "project_help_command",
+    "project_server_command",
     "random_password_command",
     "stat_documentation_command",
     "stat_project_command",
@@ -66,7 +71,7 @@ committing the changes.
     # Define options and arguments.
     parser = ArgumentParser(description=__doc__, epilog=__help__, formatter_class=RawDescriptionHelpFormatter)
 
-    # TODO: Implement auto completion for archiveproject command. See #15 and #21.
+    # Project names are completed by the completeproject command. See #15 and #21.
 
     parser.add_argument(
         "project_name",
@@ -88,6 +93,13 @@ committing the changes.
         help="Path to where projects are stored. Defaults to %s" % PROJECT_HOME
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -109,13 +121,16 @@ committing the changes.
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Create the archive directory as needed.
     if not os.path.exists(PROJECT_ARCHIVE):
         print_info("Creating the archive directory: %s" % PROJECT_ARCHIVE)
         os.makedirs(PROJECT_ARCHIVE)
 
-    # Load the project and make sure it exists.
-    project = autoload_project(args.project_name, path=args.project_home)
+    # Load the project and make sure it exists. The index is not used because the repo must be checked for dirtiness.
+    project = autoload_project(args.project_name, path=args.project_home, use_index=False)
     if not project.exists:
         print_error("Project does not exist: %s" % args.project_name, EXIT_INPUT)
 
@@ -141,7 +156,7 @@ committing the changes.
     # Move the project.
     cmd = "mv %s %s/" % (project.root, archive_path)
     print_info("Moving %s to %s" % (project.name, archive_path))
-    (status, output) = commands.getstatusoutput(cmd)
+    (status, output) = getstatusoutput(cmd)
 
     # Exit.
     sys.exit(status)
@@ -239,6 +254,13 @@ current project name.
         help="Path to the version.py template you would like to use. Use ? to see the default."
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -260,6 +282,9 @@ current project name.
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Display the default version.py template.
     if args.template == "?":
         print(Version.get_template())
@@ -398,6 +423,13 @@ You may also specify the ``DEFAULT_SCM`` environment variable to automatically u
         help="The user name for the provider. Overrides environment variables."
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -419,6 +451,9 @@ You may also specify the ``DEFAULT_SCM`` environment variable to automatically u
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Don't do anything if the project directory already exists.
     locations = (
         ("project", os.path.join(args.project_home, args.repo_name)),
@@ -602,6 +637,13 @@ work is done, the command is tired.
         help="Indicates the wiki should be enabled for the repo."
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -623,6 +665,9 @@ work is done, the command is tired.
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Get the project name.
     if args.project_name:
         project_name = args.project_name
@@ -698,7 +743,7 @@ def enable_project_command():
     # Define options and arguments.
     parser = ArgumentParser(description=__doc__, epilog=__help__, formatter_class=RawDescriptionHelpFormatter)
 
-    # TODO: Implement auto completion for enableproject command. See #15 and #21.
+    # Project names are completed by the completeproject command. See #15 and #21.
 
     parser.add_argument(
         "project_name",
@@ -713,6 +758,13 @@ def enable_project_command():
         help="Path to where projects are stored. Defaults to %s" % PROJECT_HOME
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -734,6 +786,9 @@ def enable_project_command():
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Make sure the project isn't already in PROJECT_HOME.
     to_path = os.path.join(args.project_home, args.project_name)
     if os.path.exists(to_path):
@@ -761,7 +816,7 @@ def enable_project_command():
     cmd = "mv %s %s/" % (from_path, to_path)
     print_info("Moving %s to %s/%s" % (args.project_name, to_path, args.project_name))
 
-    (status, output) = commands.getstatusoutput(cmd)
+    (status, output) = getstatusoutput(cmd)
 
     # Exit.
     sys.exit(status)
@@ -824,6 +879,13 @@ We look for labels of ready, in progress, on hold, and review to determine the i
              "command."
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -859,6 +921,9 @@ We look for labels of ready, in progress, on hold, and review to determine the i
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Set the columns.
     columns = [
         "Item",
@@ -1110,7 +1175,7 @@ committing the changes.
     # Define options and arguments.
     parser = ArgumentParser(description=__doc__, epilog=__help__, formatter_class=RawDescriptionHelpFormatter)
 
-    # TODO: Implement auto completion for holdproject command. See #15 and #21.
+    # Project names are completed by the completeproject command. See #15 and #21.
 
     parser.add_argument(
         "project_name",
@@ -1132,6 +1197,13 @@ committing the changes.
         help="Path to where projects are stored. Defaults to %s" % PROJECT_HOME
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -1153,13 +1225,16 @@ committing the changes.
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Create the hold directory as needed.
     if not os.path.exists(PROJECTS_ON_HOLD):
         print_info("Creating the hold directory: %s" % PROJECTS_ON_HOLD)
         os.makedirs(PROJECTS_ON_HOLD)
 
-    # Load the project and make sure it exists.
-    project = autoload_project(args.project_name, path=args.project_home)
+    # Load the project and make sure it exists. The index is not used because the repo must be checked for dirtiness.
+    project = autoload_project(args.project_name, path=args.project_home, use_index=False)
     if not project.exists:
         print_error("Project does not exist: %s" % args.project_name, EXIT_INPUT)
 
@@ -1180,7 +1255,7 @@ committing the changes.
     # Move the project.
     cmd = "mv %s %s/" % (project.root, PROJECTS_ON_HOLD)
     print_info("Moving %s to %s/%s" % (project.name, PROJECTS_ON_HOLD, project.name))
-    (status, output) = commands.getstatusoutput(cmd)
+    (status, output) = getstatusoutput(cmd)
 
     # Exit.
     sys.exit(status)
@@ -1291,6 +1366,13 @@ def init_project_command():
         help='Specify the project type. Defaults to "project".'
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -1311,6 +1393,9 @@ def init_project_command():
     # Parse arguments. Help, version, and usage errors are automatically handled.
     args = parser.parse_args()
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Deal with templates and template questions.
     templates = dict()
     if args.templates:
@@ -1502,6 +1587,13 @@ def list_dependencies_command():
         help="Path to where projects are stored. Defaults to %s" % PROJECT_HOME
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -1522,6 +1614,9 @@ def list_dependencies_command():
     # Parse arguments.
     args = parser.parse_args()
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Load the project.
     project = autoload_project(args.project_name, args.project_home)
     if not project:
@@ -1704,6 +1799,15 @@ The special --hold option may be used to list only projects that are on hold. Se
         help="Only show projects with dirty repos."
     )
 
+    parser.add_argument(
+        "--dirty-mode=",
+        choices=DIRTY_MODES,
+        default=DIRTY_FULL,
+        dest="dirty_mode",
+        help="How to determine whether a git repo is dirty: full includes untracked files, tracked ignores them, and "
+             "index compares tracked files with the git index, ignoring staged changes. Defaults to %s." % DIRTY_FULL
+    )
+
     parser.add_argument(
         "-d",
         "--disk",
@@ -1720,6 +1824,13 @@ The special --hold option may be used to list only projects that are on hold. Se
         help="Specify filter in the form of key:value. This may be repeated. Use ? to list available values."
     )
 
+    parser.add_argument(
+        "--facets",
+        action="store_true",
+        dest="show_facets",
+        help="List the available values of category, org, stage, status, tag, and type, then exit."
+    )
+
     parser.add_argument(
         "--format=",
         choices=["csv", "html", "shell"],
@@ -1756,6 +1867,15 @@ The special --hold option may be used to list only projects that are on hold. Se
         help="Creates links to documentation or the project root for HTML output."
     )
 
+    parser.add_argument(
+        "-j=",
+        "--jobs=",
+        default=1,
+        dest="jobs",
+        help="The number of projects to load at the same time. Defaults to 1.",
+        type=int
+    )
+
     parser.add_argument(
         "--lines",
         action="store_true",
@@ -1770,6 +1890,20 @@ The special --hold option may be used to list only projects that are on hold. Se
         help="Do NOT display the list in color-coded format."
     )
 
+    parser.add_argument(
+        "--no-index",
+        action="store_false",
+        dest="use_index",
+        help="Load every project from scratch rather than using the project index."
+    )
+
+    parser.add_argument(
+        "-O=",
+        "--output=",
+        dest="output_file",
+        help="Path to the output file, if any. Color is disabled when writing to a file."
+    )
+
     parser.add_argument(
         "-p=",
         "--path=",
@@ -1778,6 +1912,20 @@ The special --hold option may be used to list only projects that are on hold. Se
         help="Path to where projects are stored. Defaults to %s" % PROJECT_HOME
     )
 
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        dest="watch",
+        help="Keep running and list the projects again whenever one changes. Requires Linux."
+    )
+
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -1799,6 +1947,9 @@ The special --hold option may be used to list only projects that are on hold. Se
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Get the path to where projects are stored.
     if args.list_archive:
         project_home = PROJECT_ARCHIVE
@@ -1809,6 +1960,7 @@ The special --hold option may be used to list only projects that are on hold. Se
 
     # Capture (and validate) filtering options.
     criteria = dict()
+    facets = list()
     if args.criteria:
         for c in args.criteria:
 
@@ -1819,20 +1971,31 @@ The special --hold option may be used to list only projects that are on hold. Se
                 print_warning('Filter must be given in "key:value" format: %s' % c)
                 sys.exit(EXIT_INPUT)
 
-            # Handle requests to display available values by which filtering may occur. Otherwise, set criteria.
+            # Collect requests to display available values by which filtering may occur. Otherwise, set criteria.
             if value == "?":
-                print(key)
-                print("-" * 80)
+                facets.append(key)
+            else:
+                criteria[key] = value
 
-                d = get_distinct_project_attributes(key, path=project_home)
-                for name, count in d.items():
-                    print("%s (%s)" % (name, count))
+    # Display available values. All of the requested attributes are counted at the same time.
+    if facets or args.show_facets:
+        results = get_project_facets(
+            attributes=facets or None,
+            path=project_home,
+            jobs=args.jobs,
+            use_index=args.use_index
+        )
 
-                print("")
+        for key, d in results.items():
+            print(key)
+            print("-" * 80)
 
-                sys.exit(EXIT_OK)
-            else:
-                criteria[key] = value
+            for name, count in d.items():
+                print("%s (%s)" % (name, count))
+
+            print("")
+
+        sys.exit(EXIT_OK)
 
     # Add criteria not included with the --filter option.
     if args.show_dirty:
@@ -1851,95 +2014,94 @@ The special --hold option may be used to list only projects that are on hold. Se
     if "type" in criteria:
         heading += " (%s)" % criteria['type']
 
-    # Get the projects.
+    # Get the projects. Projects are loaded as the output is produced.
     if args.list_active:
-        projects = get_projects(
-            project_home,
-            criteria=criteria,
-            include_disk=args.include_disk,
-            show_all=args.show_all
-        )
+        paths = (project_home,)
     elif args.list_archive:
-        projects = get_projects(
-            PROJECT_ARCHIVE,
-            criteria=criteria,
-            include_disk=args.include_disk,
-            show_all=args.show_all
-        )
+        paths = (PROJECT_ARCHIVE,)
     elif args.list_on_hold:
-        projects = get_projects(
-            PROJECTS_ON_HOLD,
-            criteria=criteria,
-            include_disk=args.include_disk,
-            show_all=args.show_all
-        )
+        paths = (PROJECTS_ON_HOLD,)
     else:
-        projects = get_projects(
-            project_home,
-            criteria=criteria,
-            include_disk=args.include_disk,
-            show_all=args.show_all
-        )
+        paths = (project_home, PROJECTS_ON_HOLD, PROJECT_ARCHIVE)
 
-        projects += get_projects(
-            PROJECTS_ON_HOLD,
+    if args.watch:
+        results = watch_all_projects(
+            paths=paths,
             criteria=criteria,
+            dirty_mode=args.dirty_mode,
             include_disk=args.include_disk,
-            show_all=args.show_all
+            jobs=args.jobs,
+            show_all=args.show_all,
+            use_index=args.use_index
         )
-
-        projects += get_projects(
-            PROJECT_ARCHIVE,
+    else:
+        results = [iter_all_projects(
+            paths=paths,
             criteria=criteria,
+            dirty_mode=args.dirty_mode,
             include_disk=args.include_disk,
-            show_all=args.show_all
-        )
-
-    # Get the rows, placing projects in alphabetical order.
-    names = list()
-    rows = list()
-
-    for p in projects:
-        if p.name not in names:
-            names.append(p.name)
-
-    names.sort()
-
-    for name in names:
-        for p in projects:
-            if name != p.name:
-                continue
-
-            rows.append(p)
+            jobs=args.jobs,
+            show_all=args.show_all,
+            use_index=args.use_index
+        )]
 
     # Deal with color logic.
     color_enabled = True
-    if args.color_disabled:
+    if args.color_disabled or args.output_file:
         color_enabled = False
 
-    # Output according to the desired format.
-    if args.output_format == "csv":
-        output = format_projects_for_csv(rows, include_columns=args.include_columns)
-    elif args.output_format == "html":
-        output = format_projects_for_html(
-            rows,
-            css_classes=args.css_classes,
-            color_enabled=color_enabled,
-            heading=heading,
-            include_columns=args.include_columns,
-            links_enabled=args.links_enabled,
-            wrapped=args.wrapped
-        )
-    else:
-        output = format_projects_for_shell(
-            rows,
-            color_enabled=color_enabled,
-            heading=heading,
-            lines_enabled=args.lines_enabled,
-            show_branch=args.show_branch
-        )
+    # When watching, the output is produced again each time a project changes.
+    try:
+        for projects in results:
+
+            if args.watch and not args.output_file and sys.stdout.isatty():
+                sys.stdout.write("\033[2J\033[H")
+
+            # Output according to the desired format.
+            if args.output_format == "csv":
+                lines = iter_projects_for_csv(projects, include_columns=args.include_columns)
+            elif args.output_format == "html":
+                lines = iter_projects_for_html(
+                    projects,
+                    css_classes=args.css_classes,
+                    color_enabled=color_enabled,
+                    heading=heading,
+                    include_columns=args.include_columns,
+                    links_enabled=args.links_enabled,
+                    wrapped=args.wrapped
+                )
+            else:
+                lines = iter_projects_for_shell(
+                    projects,
+                    color_enabled=color_enabled,
+                    heading=heading,
+                    lines_enabled=args.lines_enabled,
+                    show_branch=args.show_branch
+                )
+
+            # Projects are loaded as the lines are produced, so only the time not spent in the other phases is counted.
+            lines = trace_iter("format", lines)
+
+            # Each line is written as soon as it is available.
+            result = None
+            if args.output_file:
+                try:
+                    result = write_lines(args.output_file, lines)
+                except OutputError as e:
+                    print_error(e.message, EXIT_OTHER)
 
-    print(output)
+                if not result:
+                    print("Could not write to: %s" % args.output_file)
+                    sys.exit(EXIT_OTHER)
+            else:
+                for line in lines:
+                    print(line)
+                    sys.stdout.flush()
+    except ResourceUnavailable as e:
+        print_error(e.message, EXIT_OTHER)
+    except KeyboardInterrupt:
+        if not args.watch:
+            raise
 
 
 # This is the original command before we started experimenting with showing all projects and stage versus status.
@@ -2085,6 +2247,13 @@ The special --hold option may be used to list only projects that are on hold. Se
         help="Path to where projects are stored. Defaults to %s" % PROJECT_HOME
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -2106,6 +2275,9 @@ The special --hold option may be used to list only projects that are on hold. Se
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Get the path to where projects are stored.
     if args.list_archive:
         project_home = PROJECT_ARCHIVE
@@ -2249,6 +2421,13 @@ Use the -f/--filter option to by most project attributes:
         help="Path to the documentation library. Defaults to %s" % DOCUMENTATION_HOME
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -2270,6 +2449,9 @@ Use the -f/--filter option to by most project attributes:
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Make sure DOCUMENTATION_HOME exists.
     if not os.path.exists(args.documentation_home):
         print_error("DOCUMENTATION_HOME does not exist: %s" % args.documentation_home, exit_code=EXIT_OTHER)
@@ -2355,7 +2537,7 @@ Use the -f/--filter option to by most project attributes:
 
         print(
             "%-30s %-20s %-20s %-30s %-10s %-10s"
-            % (title, e.category, e.type, org, e.disk, config_exists)
+            % (title, e.category, e.type, org, bytes_to_human(e.disk), config_exists)
         )
 
     if len(entries) == 1:
@@ -2431,6 +2613,13 @@ Use the -f/--filter option to by most project attributes:
     #     help="Path to where repo meta data is stored. Defaults to %s" % PYPROJECTUTILS_CONFIG
     # )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -2452,6 +2641,9 @@ Use the -f/--filter option to by most project attributes:
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # TODO: Get the path to where repo meta data is stored.
     path = REPO_META_PATH
 
@@ -2607,6 +2799,13 @@ def lorem_image_command():
         help="Width of the image."
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -2628,6 +2827,9 @@ def lorem_image_command():
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Deal with random category.
     image_category = args.image_category
     if image_category == "*":
@@ -2723,6 +2925,13 @@ def lorem_text_command():
         help="Number of sections to generate."
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -2744,6 +2953,9 @@ def lorem_text_command():
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Define text.
     lorem_text = "Lorem ipsum dolor sit amet, consectetuer adipiscing elit. Nulla sed mauris id felis fermentum " \
                  "cursus. Proin vulputate. Maecenas lobortis. Nullam ornare lacinia diam. Quisque lobortis metus " \
@@ -2827,6 +3039,13 @@ def project_help_command():
     # Define options and arguments.
     parser = ArgumentParser(description=__doc__, epilog=__help__, formatter_class=RawDescriptionHelpFormatter)
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -2849,6 +3068,9 @@ def project_help_command():
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Iterate through the commands.
     total_commands = 0
     for command_name in __all__:
@@ -2953,6 +3175,13 @@ The special --hold option may be used to list only projects that are on hold. Se
         help="Path to where projects are stored. Defaults to %s" % PROJECT_HOME
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -2976,6 +3205,9 @@ The special --hold option may be used to list only projects that are on hold. Se
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Get the path to where projects are stored.
     if args.list_on_hold:
         project_home = PROJECTS_ON_HOLD
@@ -3088,7 +3320,7 @@ The special --hold option may be used to list only projects that are on hold. Se
 
         print(
             "%-30s %-20s %-15s %-5s %-10s %-15s %-10s %-4s %-1s"
-            % (title, p.category, p.type, p.org, p.version, p.status, p.disk, scm, config_exists)
+            % (title, p.category, p.type, p.org, p.version, p.status, bytes_to_human(p.disk), scm, config_exists)
         )
 
     if len(projects) == 1:
@@ -3119,6 +3351,127 @@ The special --hold option may be used to list only projects that are on hold. Se
     sys.exit(EXIT_OK)
 
 
+def project_server_command():
+    """Run a server that answers commands from memory."""
+
+    __author__ = "Shawn Davis <shawn@develmaycare.com>"
+    __date__ = "2026-10-17"
+    __help__ = """
+The server keeps the library loaded and holds projects, repos, and
+documentation entries in memory. While it is running, these commands are
+forwarded to it:
+
+- lsdocumentation
+- lsprojects (except with --watch)
+- lsrepos
+- statdocumentation
+- statproject
+
+Commands fall back to running on their own when the server is not running.
+Press Ctrl-C to stop the server.
+    """
+    __version__ = "0.1.0-d"
+
+    # Define options and arguments.
+    parser = ArgumentParser(description=__doc__, epilog=__help__, formatter_class=RawDescriptionHelpFormatter)
+
+    parser.add_argument(
+        "--no-preload",
+        action="store_false",
+        dest="preload",
+        help="Do not load projects, repos, and documentation until they are first requested."
+    )
+
+    parser.add_argument(
+        "--socket=",
+        default=PROJECT_SERVER_SOCKET,
+        dest="socket_path",
+        help="Path to the server's socket. Defaults to %s" % PROJECT_SERVER_SOCKET
+    )
+
+    parser.add_argument(
+        "--status",
+        action="store_true",
+        dest="show_status",
+        help="Report whether the server is running, then exit."
+    )
+
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
+    # Access to the version number requires special consideration, especially
+    # when using sub parsers. The Python 3.3 behavior is different. See this
+    # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
+    # parser.add_argument('--version', action='version', version='%(prog)s 2.0')
+    parser.add_argument(
+        "-v",
+        action="version",
+        help="Show version number and exit.",
+        version=__version__
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        help="Show verbose version information and exit.",
+        version="%(prog)s" + " %s %s by %s" % (__version__, __date__, __author__)
+    )
+
+    # This will display help or input errors as needed.
+    args = parser.parse_args()
+
+    if args.trace_enabled:
+        tracer.enable()
+
+    if args.show_status:
+        if is_server_running(args.socket_path):
+            print_info("The server is running at: %s" % args.socket_path)
+            sys.exit(EXIT_OK)
+        else:
+            print_warning("The server is not running.", exit_code=EXIT_OTHER)
+
+    commands = {
+        'lsdocumentation': list_documentation_command,
+        'lsprojects': list_projects_command,
+        'lsrepos': list_repos_command,
+        'statdocumentation': stat_documentation_command,
+        'statproject': stat_project_command,
+    }
+
+    try:
+        server = CommandServer(commands, path=args.socket_path)
+    except (OSError, socket.error) as e:
+        print_error("Could not start the server: %s" % e, exit_code=EXIT_OTHER)
+
+    # Loaded objects are kept for as long as the server is running.
+    memory_cache.enabled = True
+
+    if args.preload:
+        get_all_projects(preload=("scm",))
+
+        if os.path.exists(REPO_META_PATH):
+            get_repos(path=REPO_META_PATH)
+
+        if os.path.exists(DOCUMENTATION_HOME):
+            DocumentationEntry.fetch(path=DOCUMENTATION_HOME)
+
+    print_info("Listening on %s. Press Ctrl-C to stop." % args.socket_path)
+
+    # noinspection PyUnboundLocalVariable
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    # Quit.
+    sys.exit(EXIT_OK)
+
+
 def random_password_command():
     """Generate a random password."""
 
@@ -3149,6 +3502,13 @@ that. Install pyprojectutils during deployment to create passwords on the fly.
         help="Avoid ambiguous characters."
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -3170,6 +3530,9 @@ that. Install pyprojectutils during deployment to create passwords on the fly.
     args = parser.parse_args()
     # print args
 
+    if args.trace_enabled:
+        tracer.enable()
+
     password_length = 10
     if args.strong:
         password_length = 20
@@ -3234,6 +3597,13 @@ Name may be partially matched and is case insensitive.
         help="Path to the documentation library. Defaults to %s" % DOCUMENTATION_HOME
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -3254,6 +3624,9 @@ Name may be partially matched and is case insensitive.
     # Parse arguments. Help, version, and usage errors are automatically handled.
     args = parser.parse_args()
 
+    if args.trace_enabled:
+        tracer.enable()
+
     # Make sure DOCUMENTATION_HOME exists.
     if not os.path.exists(args.documentation_home):
         print_error("DOCUMENTATION_HOME does not exist: %s" % args.documentation_home, exit_code=EXIT_OTHER)
@@ -3305,7 +3678,7 @@ def stat_project_command():
         "--cloc",
         action="store_true",
         dest="include_cloc",
-        help="Include information on lines of code. Takes longer to run."
+        help="Include information on lines of code. Takes longer the first time."
     )
 
     parser.add_argument(
@@ -3331,6 +3704,13 @@ def stat_project_command():
         help="Path to where projects are stored. Defaults to %s" % PROJECT_HOME
     )
 
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace_enabled",
+        help="Write a summary of where the command spends its time to standard error on exit."
+    )
+
     # Access to the version number requires special consideration, especially
     # when using sub parsers. The Python 3.3 behavior is different. See this
     # answer: http://stackoverflow.com/questions/8521612/argparse-optional-subparser-for-version
@@ -3351,6 +3731,9 @@ def stat_project_command():
     # Parse arguments. Help, version, and usage errors are automatically handled.
     args = parser.parse_args()
 
+    if args.trace_enabled:
+        tracer.enable()
+
     project = autoload_project(
         args.project_name,
         include_cloc=args.include_cloc,
@@ -3365,6 +3748,18 @@ def stat_project_command():
         if project.has_error:
             print_error("Error: %s" % project.get_error())
 
+        if not project.exists:
+            suggestions = get_project_suggestions(args.project_name, path=args.project_home)
+            if suggestions:
+                print("")
+                print("Did you mean:")
+                print("")
+
+                for name, title, root in suggestions:
+                    print("    %-30s %s" % (name, title))
+
+                print("")
+
         sys.exit(EXIT_OTHER)
 
     if args.output_format == "csv":
@@ -0,0 +1,76 @@
+"""
+.. versionadded:: 0.36.0-d
+
+Entry points for the commands that may be answered by the project server. See the ``projectserver`` command.
+
+.. note::
+    These functions forward the command to the server when it is running and only import the command line interface
+    (along with GitPython, jinja2, and PyGithub) when it is not.
+
+"""
+# Imports
+
+import sys
+from library.servers import forward_command
+
+# Exports
+
+__all__ = (
+    "list_documentation_command",
+    "list_projects_command",
+    "list_repos_command",
+    "stat_documentation_command",
+    "stat_project_command",
+)
+
+# Commands
+
+
+def list_documentation_command():
+    """Forward ``lsdocumentation`` to the server if it is running."""
+    _run("lsdocumentation", "list_documentation_command")
+
+
+def list_projects_command():
+    """Forward ``lsprojects`` to the server if it is running. Watching for changes always runs on its own."""
+    _run("lsprojects", "list_projects_command", forward="--watch" not in sys.argv)
+
+
+def list_repos_command():
+    """Forward ``lsrepos`` to the server if it is running."""
+    _run("lsrepos", "list_repos_command")
+
+
+def stat_documentation_command():
+    """Forward ``statdocumentation`` to the server if it is running."""
+    _run("statdocumentation", "stat_documentation_command")
+
+
+def stat_project_command():
+    """Forward ``statproject`` to the server if it is running."""
+    _run("statproject", "stat_project_command")
+
+# Functions
+
+
+def _run(name, function_name, forward=True):
+    """Run a command on the server or, failing that, in the current process.
+
+    :param name: The name of the command.
+    :type name: str
+
+    :param function_name: The name of the command function in ``cli.py``.
+    :type function_name: str
+
+    :param forward: Indicates whether the command may be forwarded.
+    :type forward: bool
+
+    """
+    # A trace must be of the command itself rather than of forwarding it.
+    if forward and "--trace" not in sys.argv:
+        exit_code = forward_command(name)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    import cli
+    getattr(cli, function_name)()
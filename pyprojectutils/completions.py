@@ -0,0 +1,140 @@
+"""
+.. versionadded:: 0.36.0-d
+
+Shell completion of project names.
+
+.. note::
+    This module is loaded each time the tab key is pressed, so it intentionally avoids importing the command line
+    interface and the heavier library modules. Names are taken from the ``NameIndex``, which only scans a location when
+    a project has been added, removed, or renamed.
+
+"""
+# Imports
+
+import os
+import sys
+from library.constants import EXIT_OK
+from library.indexes import NameIndex
+from library.variables import PROJECT_ARCHIVE, PROJECT_HOME, PROJECTS_ON_HOLD
+
+# Exports
+
+__all__ = (
+    "COMPLETED_COMMANDS",
+    "complete_project_command",
+    "get_completions",
+)
+
+# Constants
+
+COMPLETED_COMMANDS = {
+    'archiveproject': (PROJECT_HOME, PROJECTS_ON_HOLD),
+    'bumpversion': (PROJECT_HOME, PROJECTS_ON_HOLD, PROJECT_ARCHIVE),
+    'enableproject': (PROJECT_ARCHIVE, PROJECTS_ON_HOLD),
+    'holdproject': (PROJECT_HOME,),
+    'statproject': (PROJECT_HOME, PROJECTS_ON_HOLD, PROJECT_ARCHIVE),
+}
+"""The commands that may be completed and the locations of the projects that each command accepts."""
+
+PATH_OPTIONS = ("-p", "--path")
+"""The options that take the path to where projects are stored as the next word."""
+
+PATH_VALUE_OPTIONS = ("-p=", "--path=")
+"""The path options as declared by the command line interface, which may be followed by the path."""
+
+# Functions
+
+
+def complete_project_command():
+    """Complete project names for the shell.
+
+    When called by bash (``complete -C``), the names of the projects that match the word being completed are printed,
+    one per line. Otherwise, the ``complete`` statement to be added to ``~/.bashrc`` is printed.
+
+    """
+    # Bash sets COMP_LINE when calling the command.
+    if "COMP_LINE" not in os.environ:
+        print("complete -C %s %s" % (os.path.basename(sys.argv[0]), " ".join(sorted(COMPLETED_COMMANDS.keys()))))
+        sys.exit(EXIT_OK)
+
+    # Bash passes the name of the command, the word being completed, and the previous word.
+    try:
+        command = os.path.basename(sys.argv[1])
+    except IndexError:
+        sys.exit(EXIT_OK)
+
+    try:
+        prefix = sys.argv[2]
+    except IndexError:
+        prefix = ""
+
+    try:
+        previous = sys.argv[3]
+    except IndexError:
+        previous = ""
+
+    line = os.environ['COMP_LINE']
+    try:
+        line = line[:int(os.environ['COMP_POINT'])]
+    except (KeyError, ValueError):
+        pass
+
+    # Options, and the value of the path option, are not completed. Bash splits "--path=" into "--path" and "=", so
+    # the text before the word being completed is checked as well as the previous word.
+    before = line[:len(line) - len(prefix)].rstrip()
+    if prefix.startswith("-") or previous in PATH_OPTIONS or before.endswith(PATH_VALUE_OPTIONS):
+        sys.exit(EXIT_OK)
+
+    # Honor the path option if it has already been given, either as "--path=PATH" or as "-p PATH"/"--path PATH".
+    path = None
+    words = os.environ['COMP_LINE'].split()
+    for i, word in enumerate(words):
+        if word in PATH_OPTIONS or word in PATH_VALUE_OPTIONS:
+            if i + 1 < len(words):
+                path = os.path.expanduser(words[i + 1])
+        elif word.startswith("--path="):
+            path = os.path.expanduser(word[len("--path="):])
+
+    for name in get_completions(command, prefix, path=path):
+        print(name)
+
+    sys.exit(EXIT_OK)
+
+
+def get_completions(command, prefix="", path=None):
+    """Get the project names that may be used to complete a command.
+
+    :param command: The name of the command.
+    :type command: str
+
+    :param prefix: The beginning of the project name.
+    :type prefix: str
+
+    :param path: The path to where projects are stored, if other than ``PROJECT_HOME``.
+    :type path: str
+
+    :rtype: list[str]
+    :returns: The directory names of the matching projects in alphabetical order. The list is empty if the command is
+              not one of the ``COMPLETED_COMMANDS``.
+
+    """
+    try:
+        locations = COMPLETED_COMMANDS[command]
+    except KeyError:
+        return list()
+
+    if path:
+        locations = [path if location == PROJECT_HOME else location for location in locations]
+
+    index = NameIndex()
+    index.load()
+
+    if index.refresh(locations):
+        index.save()
+
+    names = list()
+    for name in index.get_directories(locations):
+        if name.startswith(prefix):
+            names.append(name)
+
+    return names
@@ -0,0 +1,137 @@
+"""
+.. versionadded:: 0.36.0-d
+
+Keep loaded objects in memory for re-use by a long-lived process, such as the project server started by the
+``projectserver`` command.
+
+The cache is disabled by default. A command that runs once and exits gains nothing from it, so only a long-lived
+process should enable it:
+
+.. code-block:: python
+
+    from library.caches import memory_cache
+
+    memory_cache.enabled = True
+
+Each object is stored with a fingerprint, typically the modification times of the files from which it was loaded.
+The object is only re-used while the fingerprint remains the same.
+
+.. note::
+    This module intentionally depends only upon the standard library.
+
+"""
+# Imports
+
+import os
+from threading import Lock
+
+# Exports
+
+__all__ = (
+    "get_fingerprint",
+    "memory_cache",
+    "MemoryCache",
+)
+
+# Functions
+
+
+def get_fingerprint(*paths):
+    """Get the modification times and sizes of the given paths.
+
+    :rtype: tuple
+    :returns: A tuple with a ``(mtime, size)`` tuple for each path. Missing paths are ``None``.
+
+    """
+    fingerprint = list()
+    for path in paths:
+        try:
+            info = os.stat(path)
+            fingerprint.append((info.st_mtime, info.st_size))
+        except OSError:
+            fingerprint.append(None)
+
+    return tuple(fingerprint)
+
+# Classes
+
+
+class MemoryCache(object):
+    """A cache of loaded objects, keyed by an identifier such as the path from which the object was loaded."""
+
+    def __init__(self, enabled=False):
+        """Initialize the cache.
+
+        :param enabled: Indicates whether the cache is used. When ``False``, ``get()`` always returns ``None`` and
+                        ``set()`` does nothing.
+        :type enabled: bool
+
+        """
+        self.enabled = enabled
+        self._entries = dict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all objects from the cache."""
+        with self._lock:
+            self._entries = dict()
+
+    def get(self, key, fingerprint):
+        """Get an object from the cache.
+
+        :param key: The identifier of the object.
+        :type key: str | tuple
+
+        :param fingerprint: The current fingerprint of the object. See ``get_fingerprint()``.
+        :type fingerprint: tuple
+
+        :returns: The object or ``None`` if it is not in the cache or the fingerprint has changed.
+
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            cached_fingerprint, value = self._entries[key]
+        except KeyError:
+            return None
+
+        if cached_fingerprint != fingerprint:
+            return None
+
+        return value
+
+    def remove(self, key):
+        """Remove an object from the cache.
+
+        :param key: The identifier of the object.
+        :type key: str | tuple
+
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def set(self, key, fingerprint, value):
+        """Add or replace an object in the cache.
+
+        :param key: The identifier of the object.
+        :type key: str | tuple
+
+        :param fingerprint: The fingerprint of the object when it was loaded.
+        :type fingerprint: tuple
+
+        :param value: The object.
+
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (fingerprint, value)
+
+
+memory_cache = MemoryCache()
+"""The cache shared by the library. See the module documentation."""
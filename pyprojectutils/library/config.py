@@ -1,10 +1,109 @@
 # Imports
 
 # noinspection PyCompatibility
-from ConfigParser import InterpolationMissingOptionError, ParsingError, RawConfigParser, SafeConfigParser
+from ConfigParser import InterpolationDepthError, InterpolationMissingOptionError, InterpolationSyntaxError, \
+    MAX_INTERPOLATION_DEPTH, ParsingError, RawConfigParser
 from os.path import exists as path_exists
+import re
 from .shortcuts import write_file
 
+# Constants
+
+INTERPOLATION_PATTERN = re.compile(r"%\(([^)]+)\)s")
+"""Matches a reference such as ``%(GITHUB)s`` at the start of a string."""
+
+# Functions
+
+
+def _copy_values(values):
+    """Copy the values of a section, including the list of tags.
+
+    :param values: The values.
+    :type values: dict
+
+    :rtype: dict
+
+    """
+    values = dict(values)
+
+    if "tags" in values:
+        values['tags'] = list(values['tags'])
+
+    return values
+
+
+def _interpolate(section, option, value, values, context, depth=1):
+    """Resolve the references in a value without merging the context into the section.
+
+    :param section: The name of the section.
+    :type section: str
+
+    :param option: The name of the option.
+    :type option: str
+
+    :param value: The raw value.
+    :type value: str
+
+    :param values: The raw values of the section, which take precedence over the context.
+    :type values: dict
+
+    :param context: Additional values that may be referenced, keyed by lower case name.
+    :type context: dict
+
+    :param depth: The current depth of nested references.
+    :type depth: int
+
+    :rtype: str
+    :raises: InterpolationDepthError, InterpolationMissingOptionError, InterpolationSyntaxError
+
+    """
+    if depth > MAX_INTERPOLATION_DEPTH:
+        raise InterpolationDepthError(option, section, value)
+
+    if "%" not in value:
+        return value
+
+    a = list()
+    rest = value
+    while rest:
+        position = rest.find("%")
+        if position < 0:
+            a.append(rest)
+            break
+
+        if position > 0:
+            a.append(rest[:position])
+            rest = rest[position:]
+
+        character = rest[1:2]
+        if character == "%":
+            a.append("%")
+            rest = rest[2:]
+        elif character == "(":
+            match = INTERPOLATION_PATTERN.match(rest)
+            if match is None:
+                raise InterpolationSyntaxError(option, section, "bad interpolation variable reference %r" % rest)
+
+            name = match.group(1).lower()
+            rest = rest[match.end():]
+
+            if name in values:
+                reference = values[name]
+            elif name in context:
+                reference = context[name]
+            else:
+                raise InterpolationMissingOptionError(option, section, rest, name)
+
+            if reference is None:
+                reference = ""
+
+            a.append(_interpolate(section, option, str(reference), values, context, depth + 1))
+        else:
+            raise InterpolationSyntaxError(option, section,
+                                           "'%%' must be followed by '%%' or '(', found: %r" % rest)
+
+    return "".join(a)
+
 # Classes
 
 
@@ -58,45 +157,69 @@ class Config(object):
         """
         return name in self._sections
 
-    def load(self, context=None):
+    def load(self, context=None, cache=None):
         """Attempt to load configuration from the current given path.
 
         :param context: Context to be interpolated.
         :type context: dict
 
+        :param cache: The index in which parsed files are cached, if any. The file is only parsed if it has changed
+                      since it was cached or the ``context`` is different.
+        :type cache: ConfigIndex
+
         :rtype: bool
         :returns: Returns ``True`` if the path could be loaded. Also sets ``is_loaded``.
 
         .. versionchanged:: 0.28.0-d
             Added ``context`` parameter and support for interpolation in the config.
 
+        .. versionchanged:: 0.36.0-d
+            Added ``cache`` parameter. The ``context`` is no longer added to the values of every section. It is only
+            used to resolve references, which are otherwise interpolated as ``SafeConfigParser`` does.
+
         """
+        cache_key = None
+        if cache is not None:
+            try:
+                cache_key = cache.get_key(self.path, context)
+            except OSError:
+                pass
+
+            sections = None
+            if cache_key is not None:
+                sections = cache.get(self.path, cache_key)
+
+            if sections is not None:
+                for section_name, kwargs in sections:
+                    self._load_section(section_name, _copy_values(kwargs))
+
+                self.is_loaded = True
+                return True
+
         if not path_exists(self.path):
             self.is_loaded = False
             self._error = "Configuration file does not exist: %s" % self.path
             return False
 
-        # Load the config without interpolation.
-        if isinstance(context, dict):
-            ini = SafeConfigParser(defaults=context)
+        # Load the config without interpolation. References are resolved below, using the values of each section
+        # and then the context.
+        ini = RawConfigParser()
 
-            try:
-                ini.read(self.path)
-            except ParsingError as e:
-                self.is_loaded = False
-                self._error = e.message
-                return False
-        else:
-            ini = RawConfigParser()
+        try:
+            ini.read(self.path)
+        except ParsingError as e:
+            self.is_loaded = False
+            self._error = e.message
+            return False
 
-            try:
-                ini.read(self.path)
-            except ParsingError as e:
-                self.is_loaded = False
-                self._error = e.message
-                return False
+        if isinstance(context, dict):
+            # Names are not case sensitive.
+            context = dict((key.lower(), value) for key, value in context.items())
+        else:
+            context = None
 
-        # Iterate through the sections.
+        # Iterate through the sections, keeping a copy of the values for the cache because sections may change them.
+        sections = list()
         for section_name in ini.sections():
 
             # Values will be passed as kwargs to the Section instance.
@@ -104,7 +227,11 @@ class Config(object):
 
             # Tags are handled specifically for all configurations.
             try:
-                for key, value in ini.items(section_name):
+                values = dict(ini.items(section_name))
+                for key, value in values.items():
+                    if context is not None:
+                        value = _interpolate(section_name, key, value, values, context)
+
                     if key == "tags":
                         kwargs['tags'] = value.split(",")
                     else:
@@ -114,9 +241,14 @@ class Config(object):
                 self._error = e.message
                 return False
 
+            sections.append((section_name, _copy_values(kwargs)))
+
             # Load the section. This allows section initialization to be customized in child classes.
             self._load_section(section_name, kwargs)
 
+        if cache_key is not None:
+            cache.set(self.path, cache_key, sections)
+
         self.is_loaded = True
         return True
 
@@ -10,6 +10,10 @@ __all__ = (
     "DEFAULT_SCM",
     "DEVELOPMENT",
     "DEVELOPMENT_ENVIRONMENT",
+    "DIRTY_FULL",
+    "DIRTY_INDEX",
+    "DIRTY_MODES",
+    "DIRTY_TRACKED",
     "ENVIRONMENTS",
     "EXIT_ENV",
     "EXIT_INPUT",
@@ -112,6 +116,24 @@ EXIT_ENV = 3
 EXIT_OTHER = 4
 """All other (unsuccessful) exits."""
 
+# Ways of determining whether a git repo has uncommitted changes.
+DIRTY_FULL = "full"
+"""Changes to tracked files (staged or not) and untracked files that are not ignored. The slowest, but most thorough."""
+
+DIRTY_TRACKED = "tracked"
+"""Changes to tracked files, whether staged or not. Untracked files are not considered."""
+
+DIRTY_INDEX = "index"
+"""Tracked files that have been modified or removed according to a comparison with the git index, made in process.
+Staged changes and untracked files are not considered. The fastest."""
+
+DIRTY_MODES = (
+    DIRTY_FULL,
+    DIRTY_INDEX,
+    DIRTY_TRACKED,
+)
+"""The available dirty modes."""
+
 # Support for source code repo meta data.
 BITBUCKET_SCM = "bitbucket.org"
 """The domain for Bitbucket."""
@@ -11,11 +11,14 @@ This may even be extended to cover training materials, e-books, etc.
 # Imports
 
 from collections import OrderedDict
-import commands
 import os
+from .caches import get_fingerprint, memory_cache
 from .config import Config, Section
 from .constants import AUTHOR, PUBLISHER
+from .files import get_disk_usage
 from .organizations import BaseOrganization
+from .shell import getstatusoutput
+from .shortcuts import bytes_to_human
 from .variables import DOCUMENTATION_HOME
 
 # Exports
@@ -26,6 +29,42 @@ __all__ = (
     "Publisher",
 )
 
+# Functions
+
+
+def _load_entry(name, include_disk=False, path=DOCUMENTATION_HOME):
+    """Load a documentation entry, re-using the one in the ``memory_cache`` if the entry's ``info.ini`` has not changed.
+
+    :param name: The name of the entry as it exists on disk.
+    :type name: str
+
+    :param include_disk: Whether to calculate disk usage. Entries that include disk usage are always loaded again.
+    :type include_disk: bool
+
+    :param path: The path to where documentation entries are stored.
+    :type path: str
+
+    :rtype: Entry
+
+    .. versionadded:: 0.36.0-d
+
+    """
+    root = os.path.join(path, name)
+    fingerprint = get_fingerprint(root, os.path.join(root, "info.ini"))
+
+    if not include_disk:
+        entry = memory_cache.get(("entry", root), fingerprint)
+        if entry is not None:
+            return entry
+
+    entry = Entry(name, path=path)
+    entry.load(include_disk=include_disk)
+
+    if not include_disk:
+        memory_cache.set(("entry", root), fingerprint, entry)
+
+    return entry
+
 # Classes
 
 
@@ -111,7 +150,7 @@ class Entry(Config):
         self.category = None or "uncategorized"
         self.config_exists = None
         self.description = None
-        self.disk = "TBD"
+        self.disk = None
         self.is_loaded = False
         self.license = None
         self.name = name
@@ -186,8 +225,7 @@ class Entry(Config):
                 continue
 
             # Load the entry.
-            entry = Entry(entry_name, path=path)
-            entry.load(include_disk=include_disk)
+            entry = _load_entry(entry_name, include_disk=include_disk, path=path)
             # print(entry)
 
             # We skip the display of the entry if a entry config does not exist and show_all is False.
@@ -240,9 +278,7 @@ class Entry(Config):
         for name in names:
             root_path = os.path.join(path, name)
             if os.path.exists(root_path):
-                entry = Entry(name, path=path)
-                entry.load(include_disk=include_disk)
-                return entry
+                return _load_entry(name, include_disk=include_disk, path=path)
 
         return Entry(name, path=path)
 
@@ -373,7 +409,7 @@ class Entry(Config):
 
         a.append("**Category**: %s  " % self.category)
         a.append("**Type**: %s  " % self.type)
-        a.append("**Disk Usage**: %s  " % self.disk)
+        a.append("**Disk Usage**: %s  " % bytes_to_human(self.disk))
 
         if self.tags:
             a.append("**Tags**: %s" % ", ".join(self.tags))
@@ -408,7 +444,7 @@ class Entry(Config):
         a.append("")
         a.append("The files below are included in the package:")
         a.append("")
-        status, output = commands.getstatusoutput("cd %s && tree" % self.root)
+        status, output = getstatusoutput("cd %s && tree" % self.root)
         for line in output.split("\n"):
             a.append("    %s" % line)
 
@@ -432,7 +468,7 @@ class Entry(Config):
 
         a.append("Category: %s" % self.category)
         a.append("Type: %s" % self.type)
-        a.append("Disk Usage: %s" % self.disk)
+        a.append("Disk Usage: %s" % bytes_to_human(self.disk))
 
         if self.tags:
             a.append("Tags: %s" % ", ".join(self.tags))
@@ -459,7 +495,7 @@ class Entry(Config):
             a.append("")
 
         # Include the manifest.
-        status, output = commands.getstatusoutput("cd %s && tree" % self.root)
+        status, output = getstatusoutput("cd %s && tree" % self.root)
         a.append("")
         a.append(output)
         a.append("")
@@ -468,9 +504,16 @@ class Entry(Config):
         return "\n".join(a)
 
     def _get_disk(self):
-        cmd = "du -hs %s | awk -F ' ' '{print $1}'" % self.root
-        (status, output) = commands.getstatusoutput(cmd)
-        return output.strip()
+        """Get the disk space used by the entry.
+
+        :rtype: int | None
+        :returns: The number of bytes or ``None`` if the disk space could not be determined.
+
+        .. versionchanged:: 0.36.0-d
+            Disk space is now calculated in process and returned as a number of bytes.
+
+        """
+        return get_disk_usage(self.root)
 
     def _get_org(self):
         """Get the organization identifier.
@@ -0,0 +1,297 @@
+"""
+.. versionadded:: 0.36.0-d
+
+Walk the file system in process rather than running commands such as ``tree`` and ``du``.
+
+.. note::
+    This module intentionally depends only upon the standard library. ``os.scandir()`` (or the ``scandir`` package on
+    older versions of Python) is used when available because it avoids a ``stat()`` call for most entries.
+
+"""
+# Imports
+
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+import os
+from stat import S_ISDIR, S_ISLNK, S_ISREG
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        # noinspection PyPackageRequirements
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+# Exports
+
+__all__ = (
+    "count_files",
+    "get_disk_usage",
+    "iter_entries",
+    "DirEntry",
+)
+
+# Functions
+
+
+def count_files(path, follow_links=False, show_hidden=False):
+    """Count the directories and files below a given path using the same rules as the ``tree`` command.
+
+    :param path: The path to count.
+    :type path: str
+
+    :param follow_links: Descend into symbolic links to directories. Links that lead back to a directory that has
+                         already been visited are counted but not followed again.
+    :type follow_links: bool
+
+    :param show_hidden: Include files and directories whose names begin with a dot.
+    :type show_hidden: bool
+
+    :rtype: tuple(int, int)
+    :returns: The number of directories and files. Like ``tree``, the given path is not included in the directory
+              count and a link to a directory is counted as a directory.
+
+    """
+    directories = 0
+    files = 0
+
+    # Directories are identified by device and inode so that loops created by symbolic links are only walked once.
+    visited = set()
+    if follow_links:
+        try:
+            info = os.stat(path)
+            visited.add((info.st_dev, info.st_ino))
+        except OSError:
+            return directories, files
+
+    stack = [path]
+    while stack:
+        current = stack.pop()
+
+        try:
+            entries = list(iter_entries(current))
+        except OSError:
+            continue
+
+        for entry in entries:
+            if not show_hidden and entry.name[0] == ".":
+                continue
+
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if not is_dir:
+                files += 1
+                continue
+
+            directories += 1
+
+            if follow_links:
+                try:
+                    info = entry.stat()
+                except OSError:
+                    continue
+
+                key = (info.st_dev, info.st_ino)
+                if key in visited:
+                    continue
+
+                visited.add(key)
+            elif entry.is_symlink():
+                continue
+
+            stack.append(entry.path)
+
+    return directories, files
+
+
+def get_disk_usage(path, jobs=None):
+    """Get the disk space used by a given path, similar to ``du -s``.
+
+    :param path: The path to the file or directory.
+    :type path: str
+
+    :param jobs: The number of top-level sub directories to walk at the same time. Defaults to the number of CPUs.
+    :type jobs: int
+
+    :rtype: int | None
+    :returns: The number of bytes used or ``None`` if the path could not be read.
+
+    .. note::
+        Space is calculated from the blocks allocated to each file where the platform supports it. Like ``du``, files
+        with more than one hard link are only counted once and symbolic links are not followed.
+
+    """
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return None
+
+    if not S_ISDIR(info.st_mode):
+        return _get_allocated_size(info)
+
+    # The top-level files are counted here while sub directories are handed out to the workers.
+    total, linked = _get_disk_usage(path, recursive=False)
+
+    directories = list()
+    try:
+        for entry in iter_entries(path):
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+            except OSError:
+                pass
+    except OSError:
+        return total
+
+    if jobs is None:
+        jobs = cpu_count()
+
+    if jobs > 1 and len(directories) > 1:
+        pool = ThreadPool(min(jobs, len(directories)))
+        try:
+            results = pool.map(_get_disk_usage, directories)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = map(_get_disk_usage, directories)
+
+    # Files with more than one link are merged by device and inode so that each is counted once.
+    for subtotal, sublinked in results:
+        total += subtotal
+        linked.update(sublinked)
+
+    return total + sum(linked.values())
+
+
+def iter_entries(path):
+    """Iterate over the entries of a directory.
+
+    :param path: The path to the directory.
+    :type path: str
+
+    :rtype: collections.Iterable[DirEntry]
+    :raises: OSError
+
+    .. note::
+        The entries have the same interface as those produced by ``os.scandir()``, which is used if it is available.
+
+    """
+    if scandir is not None:
+        return scandir(path)
+
+    return (DirEntry(path, name) for name in os.listdir(path))
+
+
+def _get_allocated_size(info):
+    """Get the space allocated to a file.
+
+    :param info: The result of ``stat()`` or ``lstat()``.
+
+    :rtype: int
+
+    """
+    try:
+        return info.st_blocks * 512
+    except AttributeError:
+        return info.st_size
+
+
+def _get_disk_usage(path, recursive=True):
+    """Walk a directory and add up the space used.
+
+    :param path: The directory.
+    :type path: str
+
+    :param recursive: Also walk sub directories. When ``False``, only the directory itself and the files it contains
+                      are counted.
+    :type recursive: bool
+
+    :rtype: tuple(int, dict)
+    :returns: The number of bytes used by entries with a single link and a dictionary of the number of bytes used by
+              entries with more than one link, keyed by device and inode.
+
+    """
+    total = 0
+    linked = dict()
+
+    try:
+        total += _get_allocated_size(os.lstat(path))
+    except OSError:
+        return total, linked
+
+    stack = [path]
+    while stack:
+        current = stack.pop()
+
+        try:
+            entries = list(iter_entries(current))
+        except OSError:
+            continue
+
+        for entry in entries:
+            try:
+                info = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if S_ISDIR(info.st_mode):
+                if recursive:
+                    total += _get_allocated_size(info)
+                    stack.append(entry.path)
+            elif info.st_nlink > 1:
+                linked[(info.st_dev, info.st_ino)] = _get_allocated_size(info)
+            else:
+                total += _get_allocated_size(info)
+
+    return total, linked
+
+# Classes
+
+
+class DirEntry(object):
+    """A minimal stand-in for the entries produced by ``os.scandir()``."""
+
+    def __init__(self, directory, name):
+        self.name = name
+        self.path = os.path.join(directory, name)
+        self._lstat = None
+        self._stat = None
+
+    def inode(self):
+        return self.stat(follow_symlinks=False).st_ino
+
+    def is_dir(self, follow_symlinks=True):
+        try:
+            return S_ISDIR(self.stat(follow_symlinks=follow_symlinks).st_mode)
+        except OSError:
+            return False
+
+    def is_file(self, follow_symlinks=True):
+        try:
+            return S_ISREG(self.stat(follow_symlinks=follow_symlinks).st_mode)
+        except OSError:
+            return False
+
+    def is_symlink(self):
+        try:
+            return S_ISLNK(self.stat(follow_symlinks=False).st_mode)
+        except OSError:
+            return False
+
+    def stat(self, follow_symlinks=True):
+        if self._lstat is None:
+            self._lstat = os.lstat(self.path)
+
+        if not follow_symlinks or not S_ISLNK(self._lstat.st_mode):
+            return self._lstat
+
+        if self._stat is None:
+            self._stat = os.stat(self.path)
+
+        return self._stat
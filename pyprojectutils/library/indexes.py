@@ -0,0 +1,1040 @@
+"""
+.. versionadded:: 0.36.0-d
+
+Indexes store information that is expensive to collect so that it may be re-used by subsequent commands.
+
+.. note::
+    This module intentionally depends only upon the standard library and ``variables`` so that it may be imported
+    without the overhead of the other library modules.
+
+"""
+# Imports
+
+from array import array
+from collections import OrderedDict
+
+# noinspection PyCompatibility
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+# noinspection PyCompatibility
+from ConfigParser import Error as ConfigParserError, RawConfigParser
+from hashlib import md5
+import marshal
+import os
+import re
+from threading import Lock
+from .variables import PROJECT_INDEX
+
+# Exports
+
+__all__ = (
+    "COMMAND_STATE_FILES",
+    "INDEXED_FILES",
+    "get_similarity",
+    "get_trigrams",
+    "BaseIndex",
+    "CommandIndex",
+    "ConfigIndex",
+    "LineIndex",
+    "NameIndex",
+    "ProjectIndex",
+)
+
+# Constants
+
+COMMAND_STATE_FILES = (
+    os.path.join(".git", "HEAD"),
+    os.path.join(".git", "index"),
+    os.path.join(".hg", "branch"),
+    os.path.join(".hg", "dirstate"),
+    os.path.join(".svn", "wc.db"),
+)
+"""The files, relative to the directory in which a command is run, that determine whether the cached result of the
+command is current. These are written by the SCM when the branch or the state of the working copy changes."""
+
+INDEXED_FILES = (
+    "project.ini",
+    "VERSION.txt",
+    os.path.join(".git", "HEAD"),
+    os.path.join(".git", "index"),
+)
+"""The files, relative to the project root, whose modification times determine whether an index entry is current."""
+
+WORD_SEPARATOR_PATTERN = re.compile(r"[\W_]+", re.UNICODE)
+"""Matches the punctuation and white space that separates the words of a name."""
+
+# Functions
+
+
+def get_similarity(a, b):
+    """Get the similarity of two sets of trigrams.
+
+    :param a: The first set.
+    :type a: set
+
+    :param b: The second set.
+    :type b: set
+
+    :rtype: float
+    :returns: A number from ``0`` (nothing in common) to ``1`` (identical).
+
+    """
+    if not a and not b:
+        return 0.0
+
+    return 2.0 * len(a & b) / (len(a) + len(b))
+
+
+def get_trigrams(value):
+    """Get the trigrams of a value.
+
+    :param value: The value.
+    :type value: str
+
+    :rtype: set
+    :returns: The three character sequences of the value. The value is converted to lower case, and punctuation is
+              treated as a space. The value is padded so that the start and end of the value carry more weight.
+
+    """
+    value = WORD_SEPARATOR_PATTERN.sub(" ", value.lower()).strip()
+    if not value:
+        return set()
+
+    value = "  %s " % value
+
+    return set(value[i:i + 3] for i in range(len(value) - 2))
+
+# Classes
+
+
+class BaseIndex(object):
+    """Base class for indexes that are stored in a single file.
+
+    .. versionadded:: 0.36.0-d
+
+    """
+
+    version = 1
+    """The format of the index. An index file written in a different format is ignored when loaded."""
+
+    def __init__(self, path):
+        """Initialize the index.
+
+        :param path: The path to the index file.
+        :type path: str
+
+        """
+        self.is_loaded = False
+        self.path = path
+        self._entries = dict()
+        self._has_changes = False
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def has_changes(self):
+        """Indicates whether the index has been changed since it was loaded.
+
+        :rtype: bool
+
+        """
+        return self._has_changes
+
+    def load(self):
+        """Load the index from disk.
+
+        :rtype: bool
+        :returns: ``True`` if the index file was loaded. An index that does not exist or cannot be read is treated as
+                  empty.
+
+        """
+        try:
+            with open(self.path, "rb") as f:
+                version, entries = self._read(f)
+        except (EnvironmentError, EOFError, TypeError, ValueError, pickle.UnpicklingError):
+            self.is_loaded = False
+            return False
+
+        if version != self.version or not isinstance(entries, dict):
+            self.is_loaded = False
+            return False
+
+        self._entries = entries
+        self.is_loaded = True
+        return True
+
+    def save(self):
+        """Write the index to disk.
+
+        :rtype: bool
+        :returns: ``True`` if the index was written.
+
+        .. note::
+            The index is written to a temporary file which then replaces the existing index so that concurrent commands
+            never read a partially written file.
+
+        """
+        directory = os.path.dirname(self.path)
+        temp_path = "%s.%s" % (self.path, os.getpid())
+
+        with self._lock:
+            try:
+                if not os.path.exists(directory):
+                    os.makedirs(directory)
+
+                with open(temp_path, "wb") as f:
+                    self._write(f)
+
+                os.rename(temp_path, self.path)
+            except EnvironmentError:
+                return False
+
+            self._has_changes = False
+
+        return True
+
+    def _read(self, f):
+        """Read the index from an open file. Child classes may override this to use a different format.
+
+        :param f: The file.
+
+        :rtype: tuple(int, dict)
+        :returns: The version and entries.
+
+        """
+        return pickle.load(f)
+
+    def _write(self, f):
+        """Write the version and entries of the index to an open file.
+
+        :param f: The file.
+
+        """
+        pickle.dump((self.version, self._entries), f, pickle.HIGHEST_PROTOCOL)
+
+
+class CommandIndex(BaseIndex):
+    """A persistent cache of the results of commands, keyed by the command and the directory in which it was run.
+
+    A result remains valid until the fingerprint of the directory changes. The default fingerprint is cheap: the
+    modification time and size of the directory itself and of the ``COMMAND_STATE_FILES``. Commands whose output may
+    change without affecting these files should be given a fingerprint of their own or not be cached at all.
+
+    The index holds at most ``limit`` results. The least recently used results are removed first.
+
+    .. versionadded:: 0.36.0-d
+
+    .. note::
+        Using a result moves it to the end of the line in memory, but does not cause the index to be written. The
+        order is saved along with the next new result.
+
+    """
+
+    def __init__(self, path=None, limit=1000, max_output=65536):
+        """Initialize the index.
+
+        :param path: The path to the index file. Defaults to ``commands.idx`` in ``PROJECT_INDEX``.
+        :type path: str
+
+        :param limit: The maximum number of results to keep.
+        :type limit: int
+
+        :param max_output: Results with more output than this number of bytes are not cached.
+        :type max_output: int
+
+        """
+        super(CommandIndex, self).__init__(path or os.path.join(PROJECT_INDEX, "commands.idx"))
+
+        self.limit = limit
+        self.max_output = max_output
+        self._entries = OrderedDict()
+
+    def get(self, command, path, fingerprint=None):
+        """Get the cached result of a command.
+
+        :param command: The command.
+        :type command: str
+
+        :param path: The directory in which the command is run.
+        :type path: str
+
+        :param fingerprint: The current fingerprint. Defaults to the result of ``get_fingerprint(path)``.
+        :type fingerprint: tuple
+
+        :rtype: tuple(int, str) | None
+        :returns: The exit status and output, or ``None`` if the result is not cached or is out of date.
+
+        """
+        if fingerprint is None:
+            fingerprint = self.get_fingerprint(path)
+
+        key = (command, os.path.abspath(path))
+
+        with self._lock:
+            try:
+                entry = self._entries.pop(key)
+            except KeyError:
+                return None
+
+            if entry[0] != fingerprint:
+                self._has_changes = True
+                return None
+
+            self._entries[key] = entry
+
+        return entry[1], entry[2]
+
+    @staticmethod
+    def get_fingerprint(path):
+        """Get the modification times and sizes of a directory and its ``COMMAND_STATE_FILES``.
+
+        :param path: The directory.
+        :type path: str
+
+        :rtype: tuple
+        :returns: A tuple with a ``(mtime, size)`` tuple for the directory and each of the files. Missing paths are
+                  ``None``.
+
+        """
+        fingerprint = list()
+        for name in ("",) + COMMAND_STATE_FILES:
+            try:
+                info = os.stat(os.path.join(path, name))
+                fingerprint.append((info.st_mtime, info.st_size))
+            except OSError:
+                fingerprint.append(None)
+
+        return tuple(fingerprint)
+
+    def load(self):
+        """Load the index from disk.
+
+        :rtype: bool
+
+        """
+        if not super(CommandIndex, self).load():
+            self._entries = OrderedDict()
+            return False
+
+        if not isinstance(self._entries, OrderedDict):
+            self._entries = OrderedDict(self._entries)
+
+        return True
+
+    def set(self, command, path, status, output, fingerprint=None):
+        """Add or replace the result of a command.
+
+        :param command: The command.
+        :type command: str
+
+        :param path: The directory in which the command was run.
+        :type path: str
+
+        :param status: The exit status.
+        :type status: int
+
+        :param output: The output.
+        :type output: str
+
+        :param fingerprint: The fingerprint of the directory from before the command was run. Defaults to the result of
+                            ``get_fingerprint(path)``.
+        :type fingerprint: tuple
+
+        """
+        if output is not None and len(output) > self.max_output:
+            return
+
+        if fingerprint is None:
+            fingerprint = self.get_fingerprint(path)
+
+        key = (command, os.path.abspath(path))
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (fingerprint, status, output)
+
+            while len(self._entries) > self.limit:
+                self._entries.popitem(last=False)
+
+            self._has_changes = True
+
+
+class ConfigIndex(BaseIndex):
+    """A persistent index of parsed configuration files, such as ``project.ini``, keyed by path.
+
+    An entry remains valid while the size and modification time of the file, and the context used to interpolate its
+    values, remain the same. The index holds nothing but strings, lists, and dictionaries, so it is stored with
+    ``marshal``, which loads much faster than ``pickle``.
+
+    .. versionadded:: 0.36.0-d
+
+    """
+
+    # Version 2 no longer includes the interpolation context in the values of each section.
+    version = 2
+
+    def __init__(self, path=None):
+        """Initialize the index.
+
+        :param path: The path to the index file. Defaults to ``configs.idx`` in ``PROJECT_INDEX``.
+        :type path: str
+
+        """
+        super(ConfigIndex, self).__init__(path or os.path.join(PROJECT_INDEX, "configs.idx"))
+
+    def get(self, path, key):
+        """Get the parsed sections of a file.
+
+        :param path: The path to the file.
+        :type path: str
+
+        :param key: The key returned by ``get_key()``.
+        :type key: tuple
+
+        :rtype: list[tuple(str, dict)] | None
+        :returns: The name and values of each section, or ``None`` if the file is not indexed or has changed.
+
+        """
+        try:
+            cached_key, sections = self._entries[path]
+        except KeyError:
+            return None
+
+        if cached_key != key:
+            return None
+
+        return sections
+
+    @staticmethod
+    def get_key(path, context=None):
+        """Get the key that identifies the current content of a file.
+
+        :param path: The path to the file.
+        :type path: str
+
+        :param context: The context used to interpolate values, if any.
+        :type context: dict
+
+        :rtype: tuple
+        :returns: The size and modification time of the file, and a hash of the context.
+        :raises: OSError
+
+        """
+        info = os.stat(path)
+
+        if isinstance(context, dict):
+            context_hash = md5(repr(sorted(context.items()))).hexdigest()
+        else:
+            context_hash = None
+
+        return info.st_size, info.st_mtime, context_hash
+
+    def set(self, path, key, sections):
+        """Add or update the parsed sections of a file.
+
+        :param path: The path to the file.
+        :type path: str
+
+        :param key: The key returned by ``get_key()`` before the file was parsed.
+        :type key: tuple
+
+        :param sections: The name and values of each section.
+        :type sections: list[tuple(str, dict)]
+
+        """
+        with self._lock:
+            self._entries[path] = (key, sections)
+            self._has_changes = True
+
+    def prune(self):
+        """Remove the files that no longer exist."""
+        with self._lock:
+            for path in [path for path in self._entries if not os.path.exists(path)]:
+                del self._entries[path]
+                self._has_changes = True
+
+    def save(self):
+        """Overridden to prune the files that no longer exist before the index is written."""
+        self.prune()
+
+        return super(ConfigIndex, self).save()
+
+    def _read(self, f):
+        """Read the index from an open file with ``marshal``.
+
+        :param f: The file.
+
+        :rtype: tuple(int, dict)
+        :returns: The version and entries.
+
+        """
+        return marshal.load(f)
+
+    def _write(self, f):
+        """Write the version and entries of the index to an open file with ``marshal``.
+
+        :param f: The file.
+
+        """
+        marshal.dump((self.version, self._entries), f)
+
+
+class LineIndex(BaseIndex):
+    """A persistent index of the lines of code of each file of a project.
+
+    The counts of a file remain valid until its size or modification time changes. Each project has an index file of
+    its own, so that counting one project does not require the counts of every other project to be loaded.
+
+    .. versionadded:: 0.36.0-d
+
+    """
+
+    def __init__(self, root, path=None):
+        """Initialize the index.
+
+        :param root: The project root.
+        :type root: str
+
+        :param path: The path to the index file. Defaults to a file in ``PROJECT_INDEX/lines`` that is named for the
+                     project root.
+        :type path: str
+
+        """
+        self.root = os.path.abspath(root)
+
+        if path is None:
+            path = os.path.join(PROJECT_INDEX, "lines", "%s.idx" % md5(self.root).hexdigest())
+
+        super(LineIndex, self).__init__(path)
+
+    def get(self, path, key):
+        """Get the counts of a file.
+
+        :param path: The path to the file.
+        :type path: str
+
+        :param key: The ``(size, mtime)`` of the file.
+        :type key: tuple
+
+        :rtype: tuple | None
+        :returns: The language and the number of blank, comment, and code lines, or ``None`` if the file is not indexed
+                  or has changed.
+
+        """
+        try:
+            cached_key, counts = self._entries[path]
+        except KeyError:
+            return None
+
+        if cached_key != key:
+            return None
+
+        return counts
+
+    def prune(self, paths):
+        """Remove the files that no longer exist.
+
+        :param paths: The paths of the files that exist.
+        :type paths: list[str]
+
+        """
+        paths = set(paths)
+
+        with self._lock:
+            for path in [path for path in self._entries if path not in paths]:
+                del self._entries[path]
+                self._has_changes = True
+
+    def set(self, path, key, counts):
+        """Add or update the counts of a file.
+
+        :param path: The path to the file.
+        :type path: str
+
+        :param key: The ``(size, mtime)`` of the file when it was counted.
+        :type key: tuple
+
+        :param counts: The language and the number of blank, comment, and code lines.
+        :type counts: tuple
+
+        """
+        with self._lock:
+            self._entries[path] = (key, tuple(counts))
+            self._has_changes = True
+
+
+class NameIndex(BaseIndex):
+    """A persistent index of project directory names, slugs, and titles, used to find the root of a project.
+
+    The directories of each location are only scanned again when the modification time of the location changes, that
+    is, when a project is added, removed, or renamed. Titles are read from each ``project.ini`` file and are re-read
+    when the file is modified. The trigrams of each name are also stored so that similar names may be suggested.
+
+    .. versionadded:: 0.36.0-d
+
+    """
+
+    def __init__(self, path=None):
+        """Initialize the index.
+
+        :param path: The path to the index file. Defaults to ``names.idx`` in ``PROJECT_INDEX``.
+        :type path: str
+
+        """
+        super(NameIndex, self).__init__(path or os.path.join(PROJECT_INDEX, "names.idx"))
+
+    def find(self, name, locations):
+        """Find the root of a project.
+
+        :param name: The directory name, slug, or title of the project. The comparison is not case sensitive, and
+                     variations of the name using underscores or hyphens instead of dots or spaces are also tried.
+        :type name: str
+
+        :param locations: The paths where projects are stored, in order of precedence.
+        :type locations: list | tuple
+
+        :rtype: str | None
+        :returns: The path to the project root or ``None`` if the project could not be found.
+
+        .. note::
+            Directory names are matched first, then slugs, then titles. The ``project.ini`` of every project is only
+            checked for changes if the project is not found otherwise.
+
+        """
+        self.refresh(locations)
+
+        root_path = self._find(name, locations)
+        if root_path is not None:
+            return root_path
+
+        # The title of a project may have changed without the location being modified.
+        if self.refresh(locations, check_files=True):
+            return self._find(name, locations)
+
+        return None
+
+    def get_directories(self, locations):
+        """Get the directory names of the projects in the given locations.
+
+        :param locations: The paths where projects are stored.
+        :type locations: list | tuple
+
+        :rtype: list[str]
+        :returns: The distinct directory names in alphabetical order.
+
+        .. note::
+            The index is not refreshed.
+
+        """
+        directories = set()
+        for location in locations:
+            try:
+                directories.update(self._entries[os.path.abspath(location)][1].keys())
+            except KeyError:
+                pass
+
+        return sorted(directories)
+
+    @staticmethod
+    def get_keys(name):
+        """Get the keys that are used to look up a name.
+
+        :param name: The name.
+        :type name: str
+
+        :rtype: list[str]
+
+        """
+        name = name.lower()
+
+        keys = list()
+        for key in (name, name.replace(".", "_"), name.replace(" ", "-"), name.replace(" ", "_")):
+            if key not in keys:
+                keys.append(key)
+
+        return keys
+
+    def get_names(self, locations):
+        """Get the directory names, slugs, and titles of the projects in the given locations.
+
+        :param locations: The paths where projects are stored, in order of precedence.
+        :type locations: list | tuple
+
+        :rtype: dict
+        :returns: ``(precedence, root)`` tuples keyed by lower case directory name, slug, and title. A lower precedence
+                  wins.
+
+        .. note::
+            The index is not refreshed.
+
+        """
+        names = dict()
+
+        # A directory name always takes precedence over a slug, which takes precedence over a title. Earlier locations
+        # take precedence over later ones.
+        precedence = 0
+        for position in range(3):
+            for location in locations:
+                location = os.path.abspath(location)
+
+                try:
+                    projects = self._entries[location][1]
+                except KeyError:
+                    continue
+
+                for directory, values in projects.items():
+                    key = (directory, values[1], values[2])[position].lower()
+                    if key not in names:
+                        names[key] = (precedence, os.path.join(location, directory))
+
+                precedence += 1
+
+        return names
+
+    def refresh(self, locations, check_files=False):
+        """Scan the locations that have changed since the index was last updated.
+
+        :param locations: The paths where projects are stored.
+        :type locations: list | tuple
+
+        :param check_files: Also check whether each ``project.ini`` has been modified.
+        :type check_files: bool
+
+        :rtype: bool
+        :returns: ``True`` if the index was changed.
+
+        """
+        has_changes = False
+
+        for location in locations:
+            location = os.path.abspath(location)
+
+            try:
+                mtime = os.stat(location).st_mtime
+            except OSError:
+                mtime = None
+
+            entry = self._entries.get(location)
+            if entry is not None and entry[0] == mtime and not check_files:
+                continue
+
+            if mtime is None:
+                projects = dict()
+            elif entry is not None:
+                projects = self._scan(location, entry[1])
+            else:
+                projects = self._scan(location, dict())
+
+            if entry is None or entry[:2] != (mtime, projects):
+                directories, postings, sizes = self._get_postings(projects)
+
+                with self._lock:
+                    self._entries[location] = (mtime, projects, directories, postings, sizes)
+                    self._has_changes = True
+
+                has_changes = True
+
+        return has_changes
+
+    def suggest(self, name, locations, limit=5, threshold=0.3):
+        """Suggest projects with a directory name, slug, or title that is similar to the given name.
+
+        :param name: The name.
+        :type name: str
+
+        :param locations: The paths where projects are stored, in order of precedence.
+        :type locations: list | tuple
+
+        :param limit: The maximum number of suggestions.
+        :type limit: int
+
+        :param threshold: The minimum similarity, from ``0`` to ``1``. See ``get_similarity()``.
+        :type threshold: float
+
+        :rtype: list[tuple(float, str, str)]
+        :returns: A list of ``(similarity, root, title)`` tuples, most similar first. When projects with the same
+                  directory name are found in more than one location, only the first is included.
+
+        """
+        self.refresh(locations)
+
+        query = get_trigrams(name)
+        if not query:
+            return list()
+
+        results = list()
+        for location in locations:
+            location = os.path.abspath(location)
+
+            try:
+                mtime, projects, directories, postings, sizes = self._entries[location]
+            except KeyError:
+                continue
+
+            # Count the trigrams that each directory name, slug, and title shares with the query.
+            shared = dict()
+            for trigram in query:
+                if trigram not in postings:
+                    continue
+
+                keys = array("I")
+                keys.fromstring(postings[trigram])
+                for key in keys:
+                    shared[key] = shared.get(key, 0) + 1
+
+            lengths = array("H")
+            lengths.fromstring(sizes)
+
+            scores = dict()
+            for key, count in shared.items():
+                directory = directories[key // 3]
+                score = 2.0 * count / (len(query) + lengths[key])
+                if score > scores.get(directory, 0):
+                    scores[directory] = score
+
+            for directory, score in sorted(scores.items()):
+                if score >= threshold:
+                    results.append((score, os.path.join(location, directory), projects[directory][2]))
+
+        # Sort by similarity, then by location and name.
+        results.sort(key=lambda r: -r[0])
+
+        suggestions = list()
+        directories = list()
+        for result in results:
+            directory = os.path.basename(result[1])
+            if directory in directories:
+                continue
+
+            directories.append(directory)
+            suggestions.append(result)
+
+            if len(suggestions) == limit:
+                break
+
+        return suggestions
+
+    def _find(self, name, locations):
+        """Look up a name without refreshing the index.
+
+        :rtype: str | None
+
+        """
+        names = self.get_names(locations)
+
+        matches = list()
+        for key in self.get_keys(name):
+            if key in names:
+                matches.append(names[key])
+
+        if matches:
+            return min(matches)[1]
+
+        return None
+
+    @staticmethod
+    def _get_postings(projects):
+        """Get the trigram postings for the projects of a location.
+
+        :param projects: The projects as returned by ``_scan()``.
+        :type projects: dict
+
+        :rtype: tuple(tuple, dict, str)
+        :returns: The directory names in order, a dictionary of postings by trigram, and the number of trigrams for
+                  each key. A key identifies the directory name, slug, or title of the project at a given position in
+                  the directory names and is equal to ``position * 3 + field``.
+
+        .. note::
+            Postings are stored as packed arrays of keys rather than lists so that the index loads quickly.
+
+        """
+        directories = tuple(sorted(projects.keys()))
+
+        postings = dict()
+        sizes = array("H")
+        for position, directory in enumerate(directories):
+            ini_mtime, slug, title = projects[directory]
+
+            for field, value in enumerate((directory, slug, title)):
+                trigrams = get_trigrams(value)
+                sizes.append(min(len(trigrams), 65535))
+
+                for trigram in trigrams:
+                    postings.setdefault(trigram, array("I")).append(position * 3 + field)
+
+        for trigram in postings.keys():
+            postings[trigram] = postings[trigram].tostring()
+
+        return directories, postings, sizes.tostring()
+
+    @staticmethod
+    def _read_title(path):
+        """Read the title from a ``project.ini`` file.
+
+        :param path: The path to the file.
+        :type path: str
+
+        :rtype: str | None
+
+        """
+        config = RawConfigParser()
+
+        try:
+            config.read(path)
+            return config.get("project", "title")
+        except (ConfigParserError, EnvironmentError):
+            return None
+
+    def _scan(self, location, projects):
+        """Scan a location for projects.
+
+        :param location: The path where projects are stored.
+        :type location: str
+
+        :param projects: The projects previously found in the location. The title of a project is only read again when
+                         its ``project.ini`` has been modified.
+        :type projects: dict
+
+        :rtype: dict
+        :returns: A dictionary of ``(ini_mtime, slug, title)`` tuples keyed by directory name.
+
+        """
+        results = dict()
+
+        try:
+            entries = os.listdir(location)
+        except OSError:
+            return results
+
+        for directory in entries:
+
+            # Ignore dot directories.
+            if directory[0] == ".":
+                continue
+
+            root_path = os.path.join(location, directory)
+            if not os.path.isdir(root_path):
+                continue
+
+            ini_path = os.path.join(root_path, "project.ini")
+            try:
+                ini_mtime = os.stat(ini_path).st_mtime
+            except OSError:
+                ini_mtime = None
+
+            previous = projects.get(directory)
+            if previous is not None and previous[0] == ini_mtime:
+                results[directory] = previous
+                continue
+
+            title = None
+            if ini_mtime is not None:
+                title = self._read_title(ini_path)
+
+            # The slug is derived from the title in the same way as Project.load().
+            title = title or directory
+            slug = title.replace(" ", "-").lower()
+
+            results[directory] = (ini_mtime, slug, title)
+
+        return results
+
+
+class ProjectIndex(BaseIndex):
+    """A persistent index of loaded project attributes, keyed by project root.
+
+    An entry remains valid until the modification time of one of the ``INDEXED_FILES`` changes.
+
+    """
+
+    # Version 2 no longer includes the interpolation context in the values of each section.
+    version = 2
+
+    def __init__(self, path=None):
+        """Initialize the index.
+
+        :param path: The path to the index file. Defaults to ``projects.idx`` in ``PROJECT_INDEX``.
+        :type path: str
+
+        """
+        super(ProjectIndex, self).__init__(path or os.path.join(PROJECT_INDEX, "projects.idx"))
+
+    def get(self, root):
+        """Get the indexed attributes of a project.
+
+        :param root: The project root.
+        :type root: str
+
+        :rtype: dict | None
+        :returns: The attributes or ``None`` if the project is not indexed or the entry is out of date.
+
+        """
+        try:
+            fingerprint, attributes = self._entries[os.path.abspath(root)]
+        except KeyError:
+            return None
+
+        if fingerprint != self.get_fingerprint(root):
+            return None
+
+        return attributes
+
+    @staticmethod
+    def get_fingerprint(root):
+        """Get the modification times of the indexed files for a project.
+
+        :param root: The project root.
+        :type root: str
+
+        :rtype: tuple
+        :returns: A tuple with one modification time for each of the ``INDEXED_FILES``. Missing files are ``None``.
+
+        """
+        mtimes = list()
+        for name in INDEXED_FILES:
+            try:
+                mtimes.append(os.stat(os.path.join(root, name)).st_mtime)
+            except OSError:
+                mtimes.append(None)
+
+        return tuple(mtimes)
+
+    def remove(self, root):
+        """Remove a project from the index.
+
+        :param root: The project root.
+        :type root: str
+
+        """
+        with self._lock:
+            if self._entries.pop(os.path.abspath(root), None) is not None:
+                self._has_changes = True
+
+    def set(self, root, attributes):
+        """Add or update a project in the index.
+
+        :param root: The project root.
+        :type root: str
+
+        :param attributes: The project attributes.
+        :type attributes: dict
+
+        .. note::
+            The index is not marked as changed when the entry is already current, so loading projects from the index
+            does not cause it to be written again.
+
+        """
+        entry = (self.get_fingerprint(root), attributes)
+        key = os.path.abspath(root)
+
+        with self._lock:
+            if self._entries.get(key) == entry:
+                return
+
+            self._entries[key] = entry
+            self._has_changes = True
@@ -45,18 +45,19 @@ class Issue(object):
         # TODO: Create an issue using the GitHub API rather than the hub command.
 
         # Create the base command.
-        cmd = 'hub issue create -m "%s"' % self.title
+        tokens = ["hub", "issue", "create", "-m", self.title]
 
         # Add labels.
-        if self.labels:
-            cmd += " -l " + " -l ".join(self.labels)
+        for label in self.labels:
+            tokens += ["-l", label]
+
+        command = Command(tokens)
 
         # Return the command if requested.
         if debug:
-            return cmd
+            return command.preview()
 
         # Run the command.
-        command = Command(cmd)
 
         if command.run():
             return True
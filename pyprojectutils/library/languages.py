@@ -0,0 +1,459 @@
+"""
+.. versionadded:: 0.36.0-d
+
+Count lines of code by language in process rather than running ``cloc``.
+
+Files are identified by extension, file name, or (for files without an extension) the ``#!`` line. Each line is
+counted as blank, comment, or code; a line with both code and a comment is counted as code. Files are spread across
+processes when there are enough of them, and the counts of each file may be stored in a :py:class:`LineIndex` so that
+only files that have changed are read again.
+
+.. code-block:: python
+
+    from library.indexes import LineIndex
+    from library.languages import count_lines_of_code
+
+    index = LineIndex(root)
+    index.load()
+
+    languages = count_lines_of_code(root, index=index)
+
+    if index.has_changes:
+        index.save()
+
+.. note::
+    The counts are close to, but not always the same as, those of ``cloc``. In particular, comment markers inside of
+    strings are not recognized as such and Python docstrings are counted as comments.
+
+"""
+# Imports
+
+from collections import OrderedDict
+from multiprocessing import cpu_count, Pool
+import os
+from stat import S_ISDIR, S_ISREG
+from .files import iter_entries
+
+# Exports
+
+__all__ = (
+    "EXCLUDED_DIRECTORIES",
+    "LANGUAGES",
+    "count_file",
+    "count_lines_of_code",
+    "get_language",
+)
+
+# Constants
+
+EXCLUDED_DIRECTORIES = (
+    ".bzr",
+    ".git",
+    ".hg",
+    ".svn",
+    "CVS",
+)
+"""The directories that are never counted."""
+
+C_COMMENTS = (("//",), (("/*", "*/"),))
+HASH_COMMENTS = (("#",), ())
+HTML_COMMENTS = ((), (("<!--", "-->"),))
+NO_COMMENTS = ((), ())
+SQL_COMMENTS = (("--",), (("/*", "*/"),))
+
+LANGUAGES = {
+    'Bourne Again Shell': HASH_COMMENTS,
+    'Bourne Shell': HASH_COMMENTS,
+    'C': C_COMMENTS,
+    'C#': C_COMMENTS,
+    'C++': C_COMMENTS,
+    'C/C++ Header': C_COMMENTS,
+    'CSS': ((), (("/*", "*/"),)),
+    'CoffeeScript': (("#",), (("###", "###"),)),
+    'Dockerfile': HASH_COMMENTS,
+    'Go': C_COMMENTS,
+    'HTML': HTML_COMMENTS,
+    'INI': ((";", "#"), ()),
+    'JSON': NO_COMMENTS,
+    'Java': C_COMMENTS,
+    'JavaScript': C_COMMENTS,
+    'Jinja Template': ((), (("{#", "#}"), ("<!--", "-->"))),
+    'LESS': C_COMMENTS,
+    'Lua': (("--",), (("--[[", "]]"),)),
+    'Markdown': NO_COMMENTS,
+    'PHP': (("//", "#"), (("/*", "*/"),)),
+    'Perl': HASH_COMMENTS,
+    'Python': (("#",), (('"""', '"""'), ("'''", "'''"))),
+    'Ruby': HASH_COMMENTS,
+    'Rust': C_COMMENTS,
+    'SASS': C_COMMENTS,
+    'SQL': SQL_COMMENTS,
+    'Swift': C_COMMENTS,
+    'TypeScript': C_COMMENTS,
+    'XML': HTML_COMMENTS,
+    'YAML': HASH_COMMENTS,
+    'make': HASH_COMMENTS,
+    'reStructuredText': NO_COMMENTS,
+}
+"""The line comment markers and ``(start, end)`` block comment markers of each language, keyed by name. The names are
+the same as those used by ``cloc``."""
+
+EXTENSIONS = {
+    'bash': "Bourne Again Shell",
+    'c': "C",
+    'cc': "C++",
+    'cfg': "INI",
+    'coffee': "CoffeeScript",
+    'cpp': "C++",
+    'cs': "C#",
+    'css': "CSS",
+    'cxx': "C++",
+    'go': "Go",
+    'h': "C/C++ Header",
+    'hpp': "C/C++ Header",
+    'htm': "HTML",
+    'html': "HTML",
+    'ini': "INI",
+    'j2': "Jinja Template",
+    'java': "Java",
+    'jinja': "Jinja Template",
+    'jinja2': "Jinja Template",
+    'js': "JavaScript",
+    'json': "JSON",
+    'jsx': "JavaScript",
+    'less': "LESS",
+    'lua': "Lua",
+    'markdown': "Markdown",
+    'md': "Markdown",
+    'mk': "make",
+    'php': "PHP",
+    'pl': "Perl",
+    'pm': "Perl",
+    'py': "Python",
+    'rb': "Ruby",
+    'rs': "Rust",
+    'rst': "reStructuredText",
+    'sass': "SASS",
+    'scss': "SASS",
+    'sh': "Bourne Shell",
+    'sql': "SQL",
+    'swift': "Swift",
+    'ts': "TypeScript",
+    'tsx': "TypeScript",
+    'xml': "XML",
+    'yaml': "YAML",
+    'yml': "YAML",
+}
+"""Languages keyed by file extension, without the dot and in lower case."""
+
+FILE_NAMES = {
+    'Dockerfile': "Dockerfile",
+    'GNUmakefile': "make",
+    'Makefile': "make",
+    'makefile': "make",
+}
+"""Languages of files that are identified by their full name."""
+
+INTERPRETERS = {
+    'bash': "Bourne Again Shell",
+    'node': "JavaScript",
+    'perl': "Perl",
+    'python': "Python",
+    'python2': "Python",
+    'python3': "Python",
+    'ruby': "Ruby",
+    'sh': "Bourne Shell",
+}
+"""Languages of files without an extension, keyed by the interpreter given on the ``#!`` line."""
+
+MIN_FILES_PER_JOB = 64
+"""Files are only spread across processes when each process would count at least this many."""
+
+# Functions
+
+
+def count_file(path, language=None):
+    """Count the blank, comment, and code lines of a file.
+
+    :param path: The path to the file.
+    :type path: str
+
+    :param language: The name of the language. When ``None``, the language is identified from the ``#!`` line.
+    :type language: str
+
+    :rtype: tuple(str | None, int, int, int)
+    :returns: The language and the number of blank, comment, and code lines. The language is ``None`` (and the counts
+              are zero) if the file is not source code or could not be read.
+
+    """
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+    except EnvironmentError:
+        return None, 0, 0, 0
+
+    # Like cloc, skip binary files.
+    if "\0" in content[:8000]:
+        return None, 0, 0, 0
+
+    if language is None:
+        language = _get_interpreter_language(content)
+        if language is None:
+            return None, 0, 0, 0
+
+    line_comments, block_comments = LANGUAGES[language]
+
+    blank = 0
+    comment = 0
+    code = 0
+
+    block_end = None
+    for line in content.splitlines():
+        text = line.strip()
+        if not text:
+            blank += 1
+            continue
+
+        has_code, has_comment, block_end = _scan_line(text, line_comments, block_comments, block_end)
+
+        if has_code:
+            code += 1
+        elif has_comment:
+            comment += 1
+
+    return language, blank, comment, code
+
+
+def count_lines_of_code(root, index=None, jobs=None):
+    """Count lines of code by language.
+
+    :param root: The directory to count.
+    :type root: str
+
+    :param index: The index in which the counts of each file are stored, if any. Files whose size and modification time
+                  have not changed since they were counted are not read again.
+    :type index: LineIndex
+
+    :param jobs: The number of processes used to count the files. Defaults to the number of CPUs.
+    :type jobs: int
+
+    :rtype: OrderedDict
+    :returns: A ``(files, code, blank, comment)`` tuple for each language, keyed by language, with the most lines of
+              code first.
+
+    """
+    counts = list()
+    pending = list()
+    paths = list()
+
+    for path, language, info in _iter_source_files(root):
+        paths.append(path)
+
+        key = (info.st_size, info.st_mtime)
+
+        if index is not None:
+            cached = index.get(path, key)
+            if cached is not None:
+                counts.append(cached)
+                continue
+
+        pending.append((path, language, key))
+
+    if jobs is None:
+        jobs = cpu_count()
+
+    jobs = min(jobs, len(pending) // MIN_FILES_PER_JOB)
+    if jobs > 1:
+        pool = Pool(jobs)
+        try:
+            results = pool.map(_count_file, [(path, language) for path, language, key in pending], chunksize=16)
+        finally:
+            # Unlike threads, the worker processes must be waited for so that they do not linger.
+            pool.close()
+            pool.join()
+    else:
+        results = [count_file(path, language) for path, language, key in pending]
+
+    for (path, language, key), result in zip(pending, results):
+        counts.append(result)
+
+        if index is not None:
+            index.set(path, key, result)
+
+    if index is not None:
+        index.prune(paths)
+
+    totals = dict()
+    for language, blank, comment, code in counts:
+        if language is None:
+            continue
+
+        files, total_code, total_blank, total_comment = totals.get(language, (0, 0, 0, 0))
+        totals[language] = (files + 1, total_code + code, total_blank + blank, total_comment + comment)
+
+    return OrderedDict(sorted(totals.items(), key=lambda item: (-item[1][1], item[0])))
+
+
+def get_language(path):
+    """Get the language of a file from its name.
+
+    :param path: The path to the file.
+    :type path: str
+
+    :rtype: str | None
+    :returns: The name of the language, ``""`` if the file has no extension (in which case the language may be
+              identified from the ``#!`` line), or ``None`` if the file is not recognized.
+
+    """
+    name = os.path.basename(path)
+
+    if name in FILE_NAMES:
+        return FILE_NAMES[name]
+
+    base, extension = os.path.splitext(name)
+    if not extension or not base:
+        return ""
+
+    return EXTENSIONS.get(extension[1:].lower())
+
+
+def _count_file(args):
+    """Count a file. This is a module-level function taking a single argument so that it may be handed to a pool."""
+    return count_file(*args)
+
+
+def _get_interpreter_language(content):
+    """Get the language of a script from its ``#!`` line.
+
+    :param content: The content of the file.
+    :type content: str
+
+    :rtype: str | None
+
+    """
+    if not content.startswith("#!"):
+        return None
+
+    tokens = content.split("\n", 1)[0][2:].split()
+    if not tokens:
+        return None
+
+    # For example, #!/usr/bin/env python
+    interpreter = os.path.basename(tokens[0])
+    if interpreter == "env" and len(tokens) > 1:
+        interpreter = tokens[1]
+
+    return INTERPRETERS.get(interpreter)
+
+
+def _iter_source_files(root):
+    """Find the files that may contain source code.
+
+    :param root: The directory.
+    :type root: str
+
+    :rtype: collections.Iterable[tuple(str, str | None, os.stat_result)]
+    :returns: The path, the language (``None`` when it is identified from the ``#!`` line), and the result of
+              ``lstat()`` for each file. Symbolic links are not followed.
+
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+
+        try:
+            entries = list(iter_entries(current))
+        except OSError:
+            continue
+
+        for entry in entries:
+            if entry.name in EXCLUDED_DIRECTORIES:
+                continue
+
+            try:
+                info = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if S_ISDIR(info.st_mode):
+                stack.append(entry.path)
+                continue
+
+            if not S_ISREG(info.st_mode):
+                continue
+
+            language = get_language(entry.name)
+            if language is None:
+                continue
+
+            yield entry.path, language or None, info
+
+
+def _scan_line(text, line_comments, block_comments, block_end=None):
+    """Determine whether a line contains code and/or a comment.
+
+    :param text: The line, stripped of white space.
+    :type text: str
+
+    :param line_comments: The markers that begin a comment that runs to the end of the line.
+    :type line_comments: tuple
+
+    :param block_comments: The ``(start, end)`` markers of comments that may span lines.
+    :type block_comments: tuple
+
+    :param block_end: The end marker of the block comment that is open at the start of the line, if any.
+    :type block_end: str
+
+    :rtype: tuple(bool, bool, str | None)
+    :returns: Whether the line has code, whether it has a comment, and the end marker of the block comment that is
+              still open at the end of the line.
+
+    """
+    has_code = False
+    has_comment = False
+
+    position = 0
+    length = len(text)
+    while position < length:
+        if block_end is not None:
+            has_comment = True
+
+            end = text.find(block_end, position)
+            if end == -1:
+                return has_code, has_comment, block_end
+
+            position = end + len(block_end)
+            block_end = None
+            continue
+
+        # Find the marker that comes first. When two markers start at the same position, the longer one wins, so that
+        # a block marker that begins with a line marker, such as --[[ in Lua or ### in CoffeeScript, opens the block.
+        found = None
+        markers = [(marker, None) for marker in line_comments] + list(block_comments)
+        for marker, end_marker in markers:
+            start = text.find(marker, position)
+            if start == -1:
+                continue
+
+            if found is None or start < found[0] or (start == found[0] and len(marker) > len(found[1])):
+                found = (start, marker, end_marker)
+
+        if found is None:
+            if text[position:].strip():
+                has_code = True
+
+            break
+
+        start, marker, end_marker = found
+        if text[position:start].strip():
+            has_code = True
+
+        has_comment = True
+
+        if end_marker is None:
+            break
+
+        block_end = end_marker
+        position = start + len(marker)
+
+    return has_code, has_comment, block_end
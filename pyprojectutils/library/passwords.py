@@ -1,10 +1,10 @@
 # Imports
 
-import commands
 import crypt
 import hashlib
 import random
 import string
+from .shell import getstatusoutput
 
 # Exports
 
@@ -114,7 +114,7 @@ class RandomPassword(object):
         """
         # output = fakeusername:$apr1$kX1KneAK$ooLH2LLsyoel.8iOTyLtl/
         cmd = "htpasswd -nb fakeusername %s" % self.plain_text
-        (status, output) = commands.getstatusoutput(cmd)
+        (status, output) = getstatusoutput(cmd)
 
         return output.split("fakeusername:")[1].strip()
 
@@ -0,0 +1,336 @@
+"""
+.. versionadded:: 0.36.0-d
+
+Probe the state of Mercurial and Subversion working copies, and of git repos through GitPython.
+
+The state of Mercurial and Subversion working copies is read from their meta data on disk (see ``scm``) when possible.
+The ``hg`` or ``svn`` command is only run for what could not be read, such as a file whose modification time has
+changed but whose size has not. Each command takes a noticeable amount of time, so the probes of many working copies
+are run at the same time by a :py:class:`ProbePool`, subject to a limit on the number of concurrent commands and a
+timeout for each command.
+
+No more than ``PROBE_JOBS`` probe commands or GitPython repos are active at the same time in the whole process, no
+matter how many pools or threads request them, so the number of child processes and open files stays the same however
+many repos are scanned.
+
+.. code-block:: python
+
+    pool = ProbePool()
+    try:
+        for root in roots:
+            pool.start(root, "hg")
+
+        for root in roots:
+            branch, is_dirty = pool.get(root)
+    finally:
+        pool.close()
+
+.. note::
+    This module intentionally depends only upon the standard library, GitPython, ``scm``, ``shell``, and
+    ``variables``.
+
+"""
+# Imports
+
+from git import Repo as GitRepo
+from multiprocessing.pool import ThreadPool
+import os
+from threading import BoundedSemaphore
+from .scm import get_hg_branch, get_svn_branch, is_hg_dirty, is_svn_dirty
+from .shell import Command
+from .variables import PROBE_JOBS, PROBE_TIMEOUT
+
+# Exports
+
+__all__ = (
+    "CACHED_PROBES",
+    "PROBES",
+    "close_git_repo",
+    "get_git_state",
+    "get_scm_state",
+    "run_probe_command",
+    "ProbePool",
+)
+
+# Constants
+
+PROBES = {
+    'hg': (
+        ("branch", ["hg", "branch"]),
+        ("is_dirty", ["hg", "identify", "--id"]),
+    ),
+    'svn': (
+        ("is_dirty", ["svn", "status"]),
+    ),
+}
+"""The commands that are run to probe each type of SCM when the meta data could not be read, keyed by the value that
+is parsed from the output."""
+
+CACHED_PROBES = ("branch",)
+"""The values whose probe commands may be cached. The branch only changes when the SCM writes its meta data, but
+whether a working copy is dirty changes as soon as a file is edited, which no cache fingerprint would notice."""
+
+PROBE_SEMAPHORE = BoundedSemaphore(max(1, PROBE_JOBS))
+"""Limits the number of probes that run at the same time, across all threads."""
+
+# Functions
+
+
+def close_git_repo(repo):
+    """Stop the persistent processes of a GitPython repo and release its memory maps.
+
+    :param repo: The repo.
+    :type repo: git.Repo
+
+    """
+    # Repo.close() is not available in older versions of GitPython.
+    if hasattr(repo, "close"):
+        repo.close()
+    else:
+        repo.git.clear_cache()
+
+
+def get_git_state(root, branch=True, dirty=True, untracked_files=True):
+    """Get the current branch and dirty state of a git repo through GitPython.
+
+    The repo is closed before returning, so that its persistent ``git cat-file`` processes (and the files they hold
+    open) do not accumulate when many repos are probed. Only plain values are returned.
+
+    :param root: The root of the working tree.
+    :type root: str
+
+    :param branch: Get the name of the current branch.
+    :type branch: bool
+
+    :param dirty: Determine whether the repo has uncommitted changes.
+    :type dirty: bool
+
+    :param untracked_files: Consider untracked files that are not ignored to be uncommitted changes.
+    :type untracked_files: bool
+
+    :rtype: tuple(str | None, bool | None)
+    :returns: The branch name (``unknown`` if the ``HEAD`` is detached) and whether the repo is dirty. Values that were
+              not requested are ``None``.
+    :raises: git.InvalidGitRepositoryError
+
+    """
+    branch_name = None
+    is_dirty = None
+
+    with PROBE_SEMAPHORE:
+        repo = GitRepo(root)
+        try:
+            if branch:
+                try:
+                    branch_name = repo.active_branch.name
+                except TypeError:
+                    # The HEAD is detached.
+                    branch_name = "unknown"
+
+            if dirty:
+                is_dirty = repo.is_dirty(untracked_files=untracked_files)
+        finally:
+            close_git_repo(repo)
+
+    return branch_name, is_dirty
+
+
+def get_scm_state(root, scm, cache=None, timeout=PROBE_TIMEOUT):
+    """Probe a single working copy.
+
+    :param root: The root of the working copy.
+    :type root: str
+
+    :param scm: The type of SCM; ``hg`` or ``svn``.
+    :type scm: str
+
+    :param cache: The index in which the results of the ``CACHED_PROBES`` are cached, if any.
+    :type cache: CommandIndex
+
+    :param timeout: The number of seconds after which a command is stopped.
+    :type timeout: float
+
+    :rtype: tuple(str | None, bool | None)
+    :returns: The current branch and whether the working copy has uncommitted changes. Either may be ``None`` if it
+              could not be determined.
+
+    """
+    if scm not in PROBES:
+        return None, None
+
+    return _probe(root, scm, cache=cache, timeout=timeout)
+
+
+def run_probe_command(args, path, cache=None, timeout=PROBE_TIMEOUT):
+    """Run a probe command.
+
+    :param args: The command and its arguments.
+    :type args: list[str]
+
+    :param path: The directory in which the command is run.
+    :type path: str
+
+    :param cache: The index in which the result of the command is cached, if any.
+    :type cache: CommandIndex
+
+    :param timeout: The number of seconds after which the command is stopped.
+    :type timeout: float
+
+    :rtype: tuple(int | None, str)
+    :returns: The exit status and output of the command. The status is ``None`` if the command could not be run or did
+              not finish before the timeout.
+
+    """
+    command = Command(args, path=path, cache=cache, quiet=True, timeout=timeout)
+    with PROBE_SEMAPHORE:
+        command.run()
+
+    return command.status, command.output or ""
+
+
+def _parse_output(name, args, status, output):
+    """Get a value from the output of a probe command.
+
+    :param name: The name of the value; ``branch`` or ``is_dirty``.
+    :type name: str
+
+    :param args: The command and its arguments.
+    :type args: list[str]
+
+    :param status: The exit status of the command.
+    :type status: int | None
+
+    :param output: The output of the command.
+    :type output: str
+
+    :rtype: str | bool | None
+
+    """
+    if status != 0:
+        return None
+
+    output = output.strip()
+
+    if name == "branch":
+        return output or None
+
+    # The identifier ends with + when there are uncommitted changes. See http://stackoverflow.com/a/11012582/241720
+    if args[:2] == ["hg", "identify"]:
+        if not output:
+            return None
+
+        return output.endswith("+")
+
+    return len(output) > 0
+
+
+def _probe(root, scm, cache=None, timeout=PROBE_TIMEOUT):
+    """Get the state of a working copy from its meta data, running commands only for the values that could not be read.
+
+    :param root: The root of the working copy.
+    :type root: str
+
+    :param scm: The type of SCM; ``hg`` or ``svn``.
+    :type scm: str
+
+    :param cache: The index in which the results of the commands are cached, if any. Only the ``CACHED_PROBES`` use
+                  it.
+    :type cache: CommandIndex
+
+    :param timeout: The number of seconds after which a command is stopped.
+    :type timeout: float
+
+    :rtype: tuple(str | None, bool | None)
+
+    """
+    if scm == "hg":
+        state = {'branch': get_hg_branch(root), 'is_dirty': is_hg_dirty(root)}
+    else:
+        state = {'branch': get_svn_branch(root), 'is_dirty': is_svn_dirty(root)}
+
+    for name, args in PROBES[scm]:
+        if state[name] is None:
+            status, output = run_probe_command(args, root, cache=cache if name in CACHED_PROBES else None,
+                                               timeout=timeout)
+            state[name] = _parse_output(name, args, status, output)
+
+    return state['branch'], state['is_dirty']
+
+# Classes
+
+
+class ProbePool(object):
+    """Run the probe commands of many working copies at the same time."""
+
+    def __init__(self, cache=None, jobs=PROBE_JOBS, timeout=PROBE_TIMEOUT):
+        """Initialize the pool.
+
+        :param cache: The index in which the results of the ``CACHED_PROBES`` are cached, if any.
+        :type cache: CommandIndex
+
+        :param jobs: The maximum number of commands that run at the same time.
+        :type jobs: int
+
+        :param timeout: The number of seconds after which a command is stopped.
+        :type timeout: float
+
+        """
+        self.cache = cache
+        self.jobs = max(1, jobs or 1)
+        self.timeout = timeout
+        self._pool = None
+        self._probes = dict()
+
+    def __contains__(self, root):
+        return os.path.abspath(root) in self._probes
+
+    def close(self):
+        """Release the pool. Commands that have already started are allowed to finish."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def get(self, root):
+        """Get the state of a working copy, waiting for its commands to finish.
+
+        :param root: The root of the working copy.
+        :type root: str
+
+        :rtype: tuple(str | None, bool | None) | None
+        :returns: The current branch and whether the working copy has uncommitted changes, or ``None`` if the working
+                  copy has not been started.
+
+        """
+        try:
+            result = self._probes[os.path.abspath(root)]
+        except KeyError:
+            return None
+
+        return result.get()
+
+    def start(self, root, scm):
+        """Start the probe of a working copy. The probe is queued if the pool is busy.
+
+        :param root: The root of the working copy.
+        :type root: str
+
+        :param scm: The type of SCM; ``hg`` or ``svn``. Other types are ignored.
+        :type scm: str
+
+        :rtype: bool
+        :returns: ``True`` if the probe was started.
+
+        """
+        if scm not in PROBES:
+            return False
+
+        root = os.path.abspath(root)
+        if root in self._probes:
+            return True
+
+        if self._pool is None:
+            self._pool = ThreadPool(self.jobs)
+
+        self._probes[root] = self._pool.apply_async(_probe, (root, scm, self.cache, self.timeout))
+
+        return True
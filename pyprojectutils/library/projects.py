@@ -1,41 +1,124 @@
 # Imports
 
 from collections import OrderedDict
+from functools import partial
+from itertools import chain
+from multiprocessing.pool import ThreadPool
 import os
-from git import Repo as GitRepo, InvalidGitRepositoryError
+from git import InvalidGitRepositoryError
+from .caches import memory_cache
 from .colors import cyan, green, red, yellow
 from .config import Config, Section
-from .constants import BITBUCKET_SCM, ENVIRONMENTS, GITHUB_SCM, LINK_CATEGORIES
+from .constants import BITBUCKET_SCM, DIRTY_FULL, DIRTY_INDEX, ENVIRONMENTS, GITHUB_SCM, LINK_CATEGORIES
+from .files import count_files, get_disk_usage
+from .indexes import CommandIndex, ConfigIndex, LineIndex, NameIndex, ProjectIndex
+from .languages import count_lines_of_code
 from .links import Link
 from .organizations import Business, Client
 from .packaging import PackageConfig
+from .probes import get_git_state, get_scm_state, ProbePool
 from .repos import BaseRepo, BitbucketRepo, GitHubRepo
+from .scm import get_git_branch, get_git_fingerprint, is_git_dirty, read_git_index
 from .shell import Command
-from .shortcuts import bool_to_yes_no, find_file, parse_jinja_template, read_file, write_file, print_info
+from .shortcuts import bool_to_yes_no, bytes_to_human, find_file, parse_jinja_template, read_file, write_file, \
+    print_info
+from .tracing import trace
 from .variables import BITBUCKET_USER, GITHUB_USER, GITIGNORE_TEMPLATE, DEVELOPER_CODE, DEVELOPER_NAME, \
     MANIFEST_TEMPLATE, PROJECT_ARCHIVE, PROJECT_HOME, PROJECT_INI_TEMPLATE, PROJECTS_ON_HOLD, README_TEMPLATE, \
     REQUIREMENTS_TEMPLATE
+from .watchers import ProjectWatcher
 
 # Exports
 
 __all__ = (
+    "FACETS",
+    "INDEXED_ATTRIBUTES",
+    "LAZY_ATTRIBUTES",
+    "LAZY_INDEXED_ATTRIBUTES",
     "autoload_project",
     "find_current_project",
     "find_project",
+    "get_all_projects",
     "get_clients",
     "get_distinct_project_attributes",
+    "get_project_facets",
+    "get_project_suggestions",
     "get_projects",
     "format_projects_for_csv",
     "format_projects_for_html",
     "format_projects_for_shell",
+    "iter_all_projects",
+    "iter_projects_for_csv",
+    "iter_projects_for_html",
+    "iter_projects_for_shell",
+    "watch_all_projects",
     "Project",
     "Tools",
 )
 
+# Constants
+
+FACETS = (
+    "category",
+    "org",
+    "stage",
+    "status",
+    "tag",
+    "type",
+)
+"""The project attributes that are counted by ``get_project_facets()`` by default. ``tag`` counts each of the project's
+tags."""
+
+INDEXED_ATTRIBUTES = (
+    "description_exists",
+    "gitignore_exists",
+    "is_loaded",
+    "license_exists",
+    "makefile_exists",
+    "manifest_exists",
+    "org",
+    "readme_exists",
+    "requirements_exists",
+    "setup_exists",
+    "slug",
+    "stage",
+    "status",
+    "title",
+    "version",
+    "version_exists",
+    "version_py",
+    "version_txt",
+    "_error",
+)
+"""The project attributes, set by ``Project.load()``, that are stored in the project index."""
+
+LAZY_ATTRIBUTES = (
+    "branch",
+    "disk",
+    "is_dirty",
+    "languages",
+    "scm",
+    "total_directories",
+    "total_files",
+)
+"""The project attributes that are expensive to collect. These are calculated on first access rather than by
+``Project.load()``."""
+
+LAZY_INDEXED_ATTRIBUTES = (
+    "_dirty_fingerprint",
+    "branch",
+    "is_dirty",
+    "scm",
+    "total_directories",
+    "total_files",
+)
+"""The lazy attributes that are stored in the project index once they have been calculated. Disk usage and lines of
+code are never indexed. The state of a git repo is only re-used while its ``_dirty_fingerprint`` remains the same."""
+
 # Functions
 
 
-def autoload_project(name, include_cloc=False, include_disk=False, path=None):
+def autoload_project(name, include_cloc=False, include_disk=False, path=None, use_index=True):
     """Attempt to automatically load the project configuration based on the name and path.
 
     :param name: The project name, or possible name.
@@ -50,6 +133,9 @@ def autoload_project(name, include_cloc=False, include_disk=False, path=None):
     :param path: The path where projects are located.
     :type path: str
 
+    :param use_index: Use (and update) the project index rather than always loading the project from scratch.
+    :type use_index: bool
+
     :rtype: Project
     :returns: ``is_loaded`` will be ``True`` on the ``Project`` instance if the project was found.
 
@@ -60,42 +146,34 @@ def autoload_project(name, include_cloc=False, include_disk=False, path=None):
 
         ``include_cloc`` was also added in support of the ``statproject`` command.
 
-    """
-    # Automatically handle different names for the project.
-    name = name.lower()
-    names = (
-        name,
-        name.replace(".", "_"),
-        name.replace(" ", "-"),
-        name.replace(" ", "_"),
-    )
-
-    # Find the project on the given path or in PROJECT_HOME using the provided names.
-    for name in names:
-        root_path = os.path.join(path or PROJECT_HOME, name)
-        if os.path.exists(root_path):
-            project = Project(root_path)
-            project.load(include_cloc=include_cloc, include_disk=include_disk)
-            return project
+    .. versionchanged:: 0.36.0-d
+        Added ``use_index`` parameter.
 
-    # If the project is not found above attempt to find it in PROJECTS_ON_HOLD.
-    for name in names:
-        root_path = os.path.join(PROJECTS_ON_HOLD, name)
-        if os.path.exists(root_path):
-            project = Project(root_path)
-            project.load(include_cloc=include_cloc, include_disk=include_disk)
-            return project
+        The project is now found using a :py:class:`NameIndex`, so the name may also be the slug or title of the
+        project. Directory names take precedence over slugs, which take precedence over titles.
 
-    # Last, looking the PROJECT_ARCHIVE.
-    for name in names:
-        root_path = os.path.join(PROJECT_ARCHIVE, name)
-        if os.path.exists(root_path):
-            project = Project(root_path)
-            project.load(include_cloc=include_cloc, include_disk=include_disk)
-            return project
+    """
+    # Find the project on the given path or in PROJECT_HOME. If the project is not found there, attempt to find it in
+    # PROJECTS_ON_HOLD and last, look in the PROJECT_ARCHIVE. The name index automatically handles different names for
+    # the project.
+    names = NameIndex()
+    names.load()
+    root_path = names.find(name, (path or PROJECT_HOME, PROJECTS_ON_HOLD, PROJECT_ARCHIVE))
+    _save_index(names)
+
+    if root_path is not None:
+        index = _get_index(use_index)
+        command_index = _get_command_index(use_index)
+        config_index = _get_config_index(use_index)
+        project = _load_project(root_path, include_cloc=include_cloc, include_disk=include_disk, index=index,
+                                command_index=command_index, config_index=config_index)
+        _save_index(index)
+        _save_index(command_index)
+        _save_index(config_index)
+        return project
 
     # If no project is found, we will still return a project instance.
-    return Project(name)
+    return Project(name.lower())
 
 
 def find_current_project():
@@ -124,7 +202,7 @@ def find_current_project():
     return None
 
 
-def find_project(name, path=None):
+def find_project(name, path=None, fuzzy=False):
     """Find a project using by name, regardless of where the user is in the current directory structure.
 
     :param name: The name of the project.
@@ -134,18 +212,225 @@ def find_project(name, path=None):
                  searched (in that order).
     :type path: str
 
+    :param fuzzy: When no project matches the name exactly, use the most similar project as returned by
+                  :py:func:`get_project_suggestions`. Off by default so that a misspelled name is never silently
+                  replaced with a different project; callers that enable it should tell the user which project was
+                  used.
+    :type fuzzy: bool
+
     :rtype: Project
     :returns: A ``Project`` instance or ``None`` if the project could not be found.
 
     .. versionadded:: 0.27.2-d
 
+    .. versionchanged:: 0.36.0-d
+        Added ``fuzzy`` parameter.
+
     """
     # If a path is given, we will only look for the project on that path. Otherwise, let autload_project() do it's
     # thing.
     if path:
-        return autoload_project(name, path=path)
+        project = autoload_project(name, path=path)
     else:
-        return autoload_project(name)
+        project = autoload_project(name)
+
+    if project.exists or not fuzzy:
+        return project
+
+    # Fall back to the closest match, if any.
+    suggestions = get_project_suggestions(name, limit=1, path=path)
+    if suggestions:
+        index = _get_index()
+        project = _load_project(suggestions[0][2], index=index)
+        _save_index(index)
+
+    return project
+
+
+def get_all_projects(paths=None, criteria=None, dirty_mode=DIRTY_FULL, include_disk=False, jobs=None,
+                     preload=("disk", "scm"), show_all=False, use_index=True):
+    """Get a list of projects from several paths at once.
+
+    :param paths: The paths where projects are stored. Defaults to ``PROJECT_HOME``, ``PROJECTS_ON_HOLD``, and
+                  ``PROJECT_ARCHIVE``.
+    :type paths: list | tuple
+
+    :param criteria: Criteria used to filter the list, if any.
+    :type criteria: dict
+
+    :param dirty_mode: How to determine whether a git repo has uncommitted changes. See ``DIRTY_MODES``.
+    :type dirty_mode: str
+
+    :param include_disk: Whether to calculate disk space used by the project.
+    :type include_disk: bool
+
+    :param jobs: The number of projects to load at the same time. Projects are loaded one at a time by default.
+    :type jobs: int
+
+    :param preload: The names of ``LAZY_ATTRIBUTES`` to calculate for the returned projects. See
+                    :py:func:`get_projects`.
+    :type preload: list | tuple
+
+    :param show_all: By default, projects without a ``project.ini`` file are omitted. Set this to ``True`` to show all
+                     projects.
+    :type show_all: bool
+
+    :param use_index: Use (and update) the project index rather than always loading projects from scratch.
+    :type use_index: bool
+
+    :rtype: list
+    :returns: The projects in order of their names. When a project with the same name is found on more than one path,
+              only the first one (in the order of ``paths``) is included.
+
+    .. versionadded:: 0.36.0-d
+
+    """
+    return list(iter_all_projects(
+        paths=paths,
+        criteria=criteria,
+        dirty_mode=dirty_mode,
+        include_disk=include_disk,
+        jobs=jobs,
+        preload=preload,
+        show_all=show_all,
+        use_index=use_index
+    ))
+
+
+def iter_all_projects(paths=None, criteria=None, dirty_mode=DIRTY_FULL, include_disk=False, jobs=None,
+                      preload=("disk", "scm"), show_all=False, use_index=True):
+    """Iterate over the projects from several paths at once, yielding each project as soon as it has been loaded.
+
+    The parameters are the same as :py:func:`get_all_projects`.
+
+    :rtype: collections.Iterable[Project]
+    :returns: The projects in order of their names. When a project with the same name is found on more than one path,
+              only the first one (in the order of ``paths``) is included.
+
+    .. versionadded:: 0.36.0-d
+
+    """
+    if paths is None:
+        paths = (PROJECT_HOME, PROJECTS_ON_HOLD, PROJECT_ARCHIVE)
+
+    # Criteria are evaluated at the cheapest stage that is able to answer them so that projects may be rejected before
+    # the more expensive stages run.
+    stages = _get_criteria_stages(criteria)
+
+    # Load the remaining projects. _imap() yields the results in the same order as the candidates, so the order of the
+    # results does not depend on the order in which the projects finish loading.
+    candidates = _get_all_candidates(paths, criteria=stages['name'], show_all=show_all)
+
+    index = _get_index(use_index)
+    command_index = _get_command_index(use_index)
+    config_index = _get_config_index(use_index)
+    probes = _start_probes(candidates, criteria=stages['scm'], preload=preload, command_index=command_index)
+    load = partial(
+        _load_matching_project,
+        criteria=stages['ini'] + stages['scm'],
+        dirty_mode=dirty_mode,
+        include_disk=include_disk,
+        disk_jobs=_get_disk_jobs(jobs),
+        index=index,
+        preload=preload,
+        probes=probes,
+        command_index=command_index,
+        config_index=config_index
+    )
+
+    try:
+        for project in _imap(load, candidates, jobs=jobs):
+            if project is not None:
+                yield project
+    finally:
+        probes.close()
+        _save_index(index)
+        _save_index(command_index)
+        _save_index(config_index)
+
+
+def watch_all_projects(paths=None, criteria=None, dirty_mode=DIRTY_FULL, include_disk=False, jobs=None,
+                       preload=("disk", "scm"), show_all=False, use_index=True, delay=0.25):
+    """Get the projects from several paths, and get them again each time a project changes.
+
+    The paths are watched for projects that are added or removed, and each project is watched for changes to the
+    ``project.ini``, ``VERSION.txt``, and git ``HEAD`` and ``index`` files. Only the projects that have changed are
+    loaded again; the others are re-used as is.
+
+    The parameters are the same as :py:func:`get_all_projects`, with the addition of:
+
+    :param delay: The number of seconds to wait for further changes once a change has been seen.
+    :type delay: float
+
+    :rtype: collections.Iterable[list[Project]]
+    :returns: The current list of projects, first immediately and then after each change. The generator runs until it
+              is closed.
+    :raises: ResourceUnavailable
+
+    .. note::
+        Disk usage is calculated again only when one of the watched files of a project changes.
+
+    .. versionadded:: 0.36.0-d
+
+    """
+    if paths is None:
+        paths = (PROJECT_HOME, PROJECTS_ON_HOLD, PROJECT_ARCHIVE)
+
+    # The watcher reports absolute project roots, so the candidates must be absolute, too.
+    paths = [os.path.abspath(path) for path in paths]
+
+    stages = _get_criteria_stages(criteria)
+
+    watcher = ProjectWatcher(paths)
+
+    index = _get_index(use_index)
+    command_index = _get_command_index(use_index)
+    config_index = _get_config_index(use_index)
+
+    # The results of loading each candidate are kept between changes, including those that do not match.
+    loaded = dict()
+    try:
+        while True:
+            candidates = _get_all_candidates(paths, criteria=stages['name'], show_all=show_all)
+
+            stale = [root_path for root_path in candidates if root_path not in loaded]
+            loaded = dict((root_path, loaded[root_path]) for root_path in candidates if root_path in loaded)
+
+            probes = _start_probes(stale, criteria=stages['scm'], preload=preload, command_index=command_index)
+            load = partial(
+                _load_matching_project,
+                criteria=stages['ini'] + stages['scm'],
+                dirty_mode=dirty_mode,
+                include_disk=include_disk,
+                disk_jobs=_get_disk_jobs(jobs),
+                index=index,
+                preload=preload,
+                probes=probes,
+                command_index=command_index,
+                config_index=config_index
+            )
+
+            try:
+                loaded.update(zip(stale, _map(load, stale, jobs=jobs)))
+            finally:
+                probes.close()
+
+            _save_index(index)
+            _save_index(command_index)
+            _save_index(config_index)
+
+            yield [loaded[root_path] for root_path in candidates if loaded[root_path] is not None]
+
+            for root_path in watcher.wait(delay=delay):
+                loaded.pop(root_path, None)
+
+                if index is not None:
+                    index.remove(root_path)
+    finally:
+        watcher.close()
+        _save_index(index)
+        _save_index(command_index)
+        _save_index(config_index)
 
 
 def get_clients(path):
@@ -183,24 +468,114 @@ def get_distinct_project_attributes(attribute, path=PROJECT_HOME):
         If the given ``attribute`` does not exist on the :py:class:`Project`, the resulting ``AttributeError`` is
         trapped and ``{'Invalid Project Attribute': attribute}`` is returned.
 
+    .. versionchanged:: 0.36.0-d
+        Only the requested attribute is preloaded, so SCM state is no longer collected unless it was asked for. Use
+        :py:func:`get_project_facets` to count more than one attribute at a time.
+
     """
-    d = dict()
-    projects = get_projects(path)
-    for p in projects:
-        try:
-            value = getattr(p, attribute)
-        except AttributeError:
-            return {'Invalid Project Attribute': attribute}
+    return get_project_facets(attributes=(attribute,), path=path)[attribute]
+
+
+def get_project_facets(attributes=None, path=PROJECT_HOME, jobs=None, use_index=True):
+    """Count the distinct values of several attributes in a single pass over the projects.
+
+    :param attributes: The names of the attributes. Defaults to ``FACETS``. ``tag`` counts each of a project's tags
+                       separately.
+    :type attributes: list | tuple
+
+    :param path: The path to where projects are stored.
+    :type path: str
+
+    :param jobs: The number of projects to load at the same time.
+    :type jobs: int
+
+    :param use_index: Use (and update) the project index rather than always loading projects from scratch.
+    :type use_index: bool
+
+    :rtype: OrderedDict
+    :returns: A dictionary, in the order of ``attributes``, where each value is a dictionary of distinct values and
+              their project counts as returned by :py:func:`get_distinct_project_attributes`.
+
+    .. versionadded:: 0.36.0-d
 
-        if value in d.keys():
-            d[value] += 1
+    """
+    if attributes is None:
+        attributes = FACETS
+
+    # Only the lazy attributes that are being counted need to be calculated.
+    preload = [attribute for attribute in attributes if attribute in LAZY_ATTRIBUTES]
+
+    counts = dict()
+    invalid = list()
+    for attribute in attributes:
+        counts[attribute] = dict()
+
+    for p in iter_all_projects(paths=(path,), jobs=jobs, preload=preload, use_index=use_index):
+        for attribute in attributes:
+            if attribute in invalid:
+                continue
+
+            if attribute == "tag":
+                values = p.tags
+            else:
+                try:
+                    values = [getattr(p, attribute)]
+                except AttributeError:
+                    invalid.append(attribute)
+                    continue
+
+            for value in values:
+                if value in counts[attribute]:
+                    counts[attribute][value] += 1
+                else:
+                    counts[attribute][value] = 1
+
+    facets = OrderedDict()
+    for attribute in attributes:
+        if attribute in invalid:
+            facets[attribute] = {'Invalid Project Attribute': attribute}
         else:
-            d[value] = 1
+            facets[attribute] = OrderedDict(sorted(counts[attribute].items(), key=lambda t: t[0]))
 
-    return OrderedDict(sorted(d.items(), key=lambda t: t[0]))
+    return facets
+
+
+def get_project_suggestions(name, limit=5, path=None):
+    """Suggest projects whose names are similar to the given name. This is useful when a project could not be found.
+
+    :param name: The name, which may include typos.
+    :type name: str
 
+    :param limit: The maximum number of suggestions.
+    :type limit: int
 
-def get_projects(path, criteria=None, include_disk=False, show_all=False):
+    :param path: The path to search. By default, ``PROJECT_HOME``, ``PROJECTS_ON_HOLD``, and ``PROJECT_ARCHIVE`` are
+                 searched (in that order).
+    :type path: str
+
+    :rtype: list[tuple(str, str, str)]
+    :returns: A list of ``(name, title, root)`` tuples, most similar first.
+
+    .. note::
+        Directory names, slugs, and titles are compared using the trigrams stored in the :py:class:`NameIndex`.
+
+    .. versionadded:: 0.36.0-d
+
+    """
+    names = NameIndex()
+    names.load()
+    results = names.suggest(name, (path or PROJECT_HOME, PROJECTS_ON_HOLD, PROJECT_ARCHIVE), limit=limit)
+    _save_index(names)
+
+    suggestions = list()
+    for similarity, root, title in results:
+        suggestions.append((os.path.basename(root), title, root))
+
+    return suggestions
+
+
+def get_projects(path, criteria=None, dirty_mode=DIRTY_FULL, include_disk=False, jobs=None, preload=("disk", "scm"),
+                 show_all=False, use_index=True):
     """Get a list of projects.
 
     :param path: Path to where projects are stored.
@@ -212,11 +587,23 @@ def get_projects(path, criteria=None, include_disk=False, show_all=False):
     :param include_disk: Whether to calculate disk space used by the project.
     :type include_disk: bool
 
+    :param jobs: The number of projects to load at the same time. Projects are loaded one at a time by default.
+    :type jobs: int
+
+    :param preload: The names of ``LAZY_ATTRIBUTES`` to calculate for the returned projects. These are calculated
+                    using the same number of ``jobs`` rather than one at a time on first access. ``scm`` also
+                    calculates ``branch`` and ``is_dirty``, while ``disk`` is only calculated when ``include_disk`` is
+                    ``True``.
+    :type preload: list | tuple
+
     :param show_all: By default, projects without a ``project.ini`` file are omitted. Set this to ``True`` to show all
                      projects.
 
     :type show_all: bool
 
+    :param use_index: Use (and update) the project index rather than always loading projects from scratch.
+    :type use_index: bool
+
     :rtype: list
 
     .. versionchanged:: 0.16.0-d
@@ -226,63 +613,34 @@ def get_projects(path, criteria=None, include_disk=False, show_all=False):
     .. versionchanged:: 0.27.0-d
         Updated for new signature of :py:class:`Project` init.
 
-    """
-    names = list()
-    projects = list()
-
-    try:
-        entries = os.listdir(path)
-    except OSError:
-        return projects
-
-    for project_name in entries:
-
-        # Get the project root path.
-        root_path = os.path.join(path, project_name)
-
-        # Projects are always stored as sub directories of path.
-        if not os.path.isdir(root_path):
-            continue
-
-        # Ignore dot directories.
-        if project_name[0] == ".":
-            continue
+    .. versionchanged:: 0.36.0-d
+        Added ``jobs`` parameter. Projects are returned in order of their directory names regardless of the number of
+        jobs.
 
-        # Skip projects we've already found.
-        if project_name in names:
-            continue
+        Added ``use_index`` parameter. Projects that have not changed since they were last loaded are taken from the
+        index.
 
-        # Load the project.
-        project = Project(root_path)
-        project.load(include_disk=include_disk)
-        # print(project)
+        Added ``preload`` and ``dirty_mode`` parameters.
 
-        # We skip the display of the project if a project config does not exist and show_all is False.
-        if not project.config_exists and not show_all:
-            continue
+        Each criterion is evaluated as soon as the information it needs is available: ``name`` is matched against the
+        directory name before the project is loaded, attributes from ``project.ini`` are matched after the project is
+        loaded, and SCM and file system attributes are only calculated for projects that have matched everything else.
+        A project must now match *all* of the given criteria.
 
-        # Filter based on criteria, which should be a dict.
-        if criteria:
-            for field, search in criteria.items():
-
-                # Handle the name and description attributes differently.
-                if field in ("description", "name"):
-                    value = getattr(project, field).lower()
-                    search = search.lower()
-                    if search in value:
-                        projects.append(project)
-                elif field == "tag":
-                    tags = getattr(project, "tags")
-                    if search in tags:
-                        projects.append(project)
-                else:
-                    value = getattr(project, field)
-                    if search == value:
-                        projects.append(project)
-        else:
-            projects.append(project)
+    .. note::
+        Use :py:func:`get_all_projects` to get the projects from more than one path at the same time.
 
-    return projects
+    """
+    return get_all_projects(
+        paths=(path,),
+        criteria=criteria,
+        dirty_mode=dirty_mode,
+        include_disk=include_disk,
+        jobs=jobs,
+        preload=preload,
+        show_all=show_all,
+        use_index=use_index
+    )
 
 
 def format_projects_for_csv(projects, include_columns=True):
@@ -296,23 +654,11 @@ def format_projects_for_csv(projects, include_columns=True):
 
     :rtype: str
 
-    """
-
-    count = 0
-    output = list()
-    for p in projects:
-        if count == 0:
-            if include_columns:
-                output.append(p.to_csv(include_header=True))
-            else:
-                output.append(p.to_csv())
-
-            continue
-
-        count += 1
-        output.append(p.to_csv())
+    .. versionchanged:: 0.36.0-d
+        Column headings are only included once rather than before every project.
 
-    return "\n".join(output)
+    """
+    return "\n".join(iter_projects_for_csv(projects, include_columns=include_columns))
 
 
 def format_projects_for_html(projects, css_classes="table table-bordered table-striped", color_enabled=False,
@@ -353,56 +699,301 @@ def format_projects_for_html(projects, css_classes="table table-bordered table-s
         Added support for additional links related to the project.
 
     """
-    output = list()
+    return "\n".join(iter_projects_for_html(
+        projects,
+        css_classes=css_classes,
+        color_enabled=color_enabled,
+        heading=heading,
+        include_columns=include_columns,
+        links_enabled=links_enabled,
+        show_branch=show_branch,
+        wrapped=wrapped
+    ))
+
+
+def format_projects_for_shell(projects, color_enabled=False, heading="Projects", lines_enabled=False, show_all=False,
+                              show_branch=False):
+    """Get project list for output to shell.
+
+    :param projects: The project list as returned by ``get_projects()``.
+    :type projects: list[Project]
+
+    :param color_enabled: Enable output coloring.
+    :type color_enabled: bool
+
+    :param heading: The heading label that appears at the top of the output.
+    :type heading: str
+
+    :param lines_enabled: Separate each project with a dotted line.
+    :type lines_enabled: bool
+
+    :param show_all: Indicates show all projects was requested.
+    :type show_all: bool
+
+    :param show_branch: Show SCM branch.
+    :type show_branch: bool
+
+    :rtype: str
+
+    .. versionadded: 0.27.0-d
+
+    .. versionchanged: 0.31.0-d
+        Added optional ``lines_enabled`` parameter for further visual separation of projects in the list.
+
+    """
+    return "\n".join(iter_projects_for_shell(
+        projects,
+        color_enabled=color_enabled,
+        heading=heading,
+        lines_enabled=lines_enabled,
+        show_all=show_all,
+        show_branch=show_branch
+    ))
+
+
+def iter_projects_for_csv(projects, include_columns=True):
+    """Get the project list for output as CSV, one line at a time.
+
+    :param projects: The projects as returned by ``get_projects()`` or ``iter_all_projects()``.
+    :type projects: collections.Iterable[Project]
+
+    :param include_columns: Include column headings. The headings are taken from the first project.
+    :type include_columns: bool
+
+    :rtype: collections.Iterable[str]
+
+    .. versionadded:: 0.36.0-d
+
+    """
+    count = 0
+    for p in projects:
+        if count == 0 and include_columns:
+            yield p.to_csv(include_header=True)
+        else:
+            yield p.to_csv()
 
+        count += 1
+
+
+def iter_projects_for_html(projects, css_classes="table table-bordered table-striped", color_enabled=False,
+                           heading="Projects", include_columns=True, links_enabled=False, show_branch=False,
+                           wrapped=False):
+    """Get the project list for output as HTML, one line at a time.
+
+    The parameters are the same as :py:func:`format_projects_for_html`, except that ``projects`` may be any iterable
+    (such as the one returned by ``iter_all_projects()``). Each row is produced as soon as its project is available;
+    the totals in the table footer are produced last.
+
+    :rtype: collections.Iterable[str]
+
+    .. versionadded:: 0.36.0-d
+
+    """
     if wrapped:
-        output.append('<html>')
-        output.append('<head>')
-        output.append(
+        yield '<html>'
+        yield '<head>'
+        yield (
             '<link href="https://maxcdn.bootstrapcdn.com/bootstrap/3.3.7/css/bootstrap.min.css" rel="stylesheet">'
         )
-        output.append(
+        yield (
             '<link href="https://maxcdn.bootstrapcdn.com/font-awesome/4.7.0/css/font-awesome.min.css" rel="stylesheet">'
         )
-        output.append('</head>')
-        output.append('<body>')
-        output.append('<div class="container">')
-        output.append('<h2>%s</h2>' % heading)
+        yield '</head>'
+        yield '<body>'
+        yield '<div class="container">'
+        yield '<h2>%s</h2>' % heading
+
+    # We need to know whether there are any projects before the table is started.
+    projects = iter(projects)
+    try:
+        first = next(projects)
+    except StopIteration:
+        first = None
 
     # If there are no projects, just say so.
-    if len(projects) == 0:
-        output.append('<p>No results.</p>')
+    if first is None:
+        yield '<p>No results.</p>'
 
         if wrapped:
-            output.append('</div>')
-            output.append('</body>')
-            output.append('</html>')
+            yield '</div>'
+            yield '</body>'
+            yield '</html>'
 
-        return "\n".join(output)
+        return
 
     # Create the header.
     if css_classes:
-        output.append('<table class="%s">' % css_classes)
+        yield '<table class="%s">' % css_classes
     else:
-        output.append('<table>')
+        yield '<table>'
 
     if include_columns:
-        output.append('<thead>')
-        output.append('<tr>')
+        yield '<thead>'
+        yield '<tr>'
 
         for column in ("Title", "Description", "Category", "Type", "Org", "Version", "Status", "Disk", "SCM", "Tools"):
-            output.append('<th>%s</th>' % column)
+            yield '<th>%s</th>' % column
 
-        output.append('</tr>')
-        output.append('</thead>')
+        yield '</tr>'
+        yield '</thead>'
 
     # Create the table.
-    output.append('<tbody>')
+    yield '<tbody>'
+    dirty_count = 0
+    error_count = 0
+    total_disk = None
+    for p in chain([first], projects):
+
+        if p.disk is not None:
+            total_disk = (total_disk or 0) + p.disk
+
+        if p.config_exists:
+            config_exists = ""
+        else:
+            config_exists = "*"
+
+        if p.has_error:
+            config_exists += " (e)"
+            error_count += 1
+        else:
+            pass
+
+        if p.is_dirty:
+            dirty_count += 1
+            scm = "%s+" % p.scm
+        else:
+            scm = str(p.scm)
+
+        if show_branch:
+            if p.branch:
+                scm += " (%s)" % p.branch
+            else:
+                scm += " (unknown)"
+
+        if color_enabled:
+            if p.has_error:
+                yield '<tr class="danger">'
+            elif p.is_dirty:
+                yield '<tr class="warning">'
+            elif p.status == "live":
+                yield '<tr class="success">'
+            elif p.status == "unknown":
+                yield '<tr class="info">'
+            else:
+                yield '<tr>'
+        else:
+            yield '<tr>'
+
+        if links_enabled:
+            if p.path_exists("docs/build/html/index.html"):
+                url = os.path.join(p.root, "docs/build/html/index.html")
+            elif p.path_exists("README.html"):
+                url = os.path.join(p.root, "README.html")
+            elif p.has_section("urls") and p.urls.has_attribute("project"):
+                url = p.urls.project
+            else:
+                url = p.root
+
+            link = '<a href="%s" target="_blank">%s</a>' % (url, p.title)
+
+            yield '<td>%s</td>' % link
+        else:
+            yield '<td>%s</td>' % p.title
+
+        yield '<td>%s</td>' % p.description
+        yield '<td>%s</td>' % p.category
+        yield '<td>%s</td>' % p.type
+        yield '<td>%s</td>' % p.org
+        yield '<td>%s</td>' % p.version
+        yield '<td>%s</td>' % p.status
+        yield '<td>%s</td>' % bytes_to_human(p.disk)
+        yield '<td>%s</td>' % scm
+
+        if links_enabled:
+            if p.has_section("urls"):
+                links = list()
+
+                if config_exists:
+                    links.append(config_exists)
+
+                for link in p.urls.get_links():
+                    links.append(link.to_html())
+
+                yield '<td>%s</td>' % "&nbsp; ".join(links)
+
+            else:
+                yield '<td>%s</td>' % config_exists
+        else:
+            yield '<td>%s</td>' % config_exists
+
+        yield '</tr>'
+
+    # Close the table.
+    yield '<tfoot>'
+    yield '<tr>'
+    yield '<td></td>'
+    yield '<td></td>'
+    yield '<td></td>'
+    yield '<td></td>'
+    yield '<td></td>'
+    yield '<td></td>'
+    yield '<td></td>'
+    yield '<td>%s</td>' % bytes_to_human(total_disk, default="")
+    yield '<td>%s dirty</td>' % dirty_count
+    yield '<td>%s error(s)</td>' % error_count
+    yield '</tr>'
+    yield '</tfoot>'
+    yield '</tbody>'
+    yield '</table>'
+
+    if wrapped:
+        yield '</div>'
+        yield '</body>'
+        yield '</html>'
+
+
+def iter_projects_for_shell(projects, color_enabled=False, heading="Projects", lines_enabled=False, show_all=False,
+                            show_branch=False):
+    """Get the project list for output to shell, one line at a time.
+
+    The parameters are the same as :py:func:`format_projects_for_shell`, except that ``projects`` may be any iterable
+    (such as the one returned by ``iter_all_projects()``). Each row is produced as soon as its project is available;
+    the totals are produced last.
+
+    :rtype: collections.Iterable[str]
+
+    .. versionadded:: 0.36.0-d
+
+    """
+    yield "=" * 140
+    yield heading
+    yield "=" * 140
+
+    # Print the column headings.
+    yield "%-30s %-20s %-15s %-5s %-10s %-15s %-15s %-10s %-20s" % (
+        "Title", "Category", "Type", "Org", "Version", "Stage", "Status", "Disk", "SCM"
+    )
+    yield "-" * 140
+
+    # Print the rows. The separating line is printed before each project (but the first) because the number of projects
+    # is not known in advance.
     dirty_count = 0
     dirty_list = list()
     error_count = 0
+    total_disk = None
+    total_projects = 0
     for p in projects:
 
+        if lines_enabled and total_projects > 0:
+            yield "." * 130
+
+        total_projects += 1
+
+        title = p.truncated_title()
+
+        if p.disk is not None:
+            total_disk = (total_disk or 0) + p.disk
+
         if p.config_exists:
             config_exists = ""
         else:
@@ -427,235 +1018,538 @@ def format_projects_for_html(projects, css_classes="table table-bordered table-s
             else:
                 scm += " (unknown)"
 
-        if color_enabled:
-            if p.has_error:
-                output.append('<tr class="danger">')
-            elif p.is_dirty:
-                output.append('<tr class="warning">')
-            elif p.status == "live":
-                output.append('<tr class="success">')
-            elif p.status == "unknown":
-                output.append('<tr class="info">')
-            else:
-                output.append('<tr>')
-        else:
-            output.append('<tr>')
+        line = "%-30s %-20s %-15s %-5s %-10s %-15s %-15s %-10s %-4s %-1s" % (
+            title,
+            p.category,
+            p.type,
+            p.org,
+            p.version,
+            p.stage,
+            p.status,
+            bytes_to_human(p.disk),
+            scm,
+            config_exists
+        )
+
+        if color_enabled:
+            if p.has_error:
+                yield red(line)
+            elif p.is_dirty:
+                yield yellow(line, bold=True)
+            elif p.status == "live":
+                yield green(line)
+            elif p.status == "unknown":
+                yield cyan(line)
+            else:
+                yield line
+        else:
+            yield line
+
+    if total_projects == 0:
+        yield ""
+        yield "No results."
+        return
+
+    if total_projects == 1:
+        label = "result"
+    else:
+        label = "results"
+
+    yield "-" * 140
+    yield ""
+    yield "%s %s." % (total_projects, label)
+
+    if total_disk is not None:
+        yield "%s total disk usage." % bytes_to_human(total_disk)
+
+    if show_all:
+        yield "* indicates absence of project.ini file."
+
+    if error_count >= 1:
+        yield "(e) indicates an error parsing the project.ini file. Use the --name switch to find out more."
+
+    if dirty_count == 1:
+        yield "One project with uncommitted changes: %s" % dirty_list[0]
+    elif dirty_count > 1:
+        yield "%s projects with uncommitted changes." % dirty_count
+        yield ""
+
+        for i in dirty_list:
+            yield "    cd %s/%s && git st" % (PROJECT_HOME, i)
+
+        yield ""
+    else:
+        yield "No projects with uncommitted changes."
+
+
+def _get_all_candidates(paths, criteria=None, show_all=False):
+    """Get the projects stored on several paths that match criteria which only require the directory name.
+
+    :param paths: The paths to where projects are stored.
+    :type paths: list[str] | tuple[str]
+
+    :param criteria: A list of ``(field, search)`` tuples that may be evaluated before the project is loaded.
+    :type criteria: list
+
+    :param show_all: Include projects without a ``project.ini`` file.
+    :type show_all: bool
+
+    :rtype: list[str]
+    :returns: The project roots in order of their directory names. When a project with the same name is found on more
+              than one path, only the first one (in the order of ``paths``) is included.
+
+    """
+    paths = list(paths)
+
+    # Scan the paths at the same time. Only the directory names are needed at this stage.
+    scanned = _map(partial(_get_candidates, criteria=criteria, show_all=show_all), paths, jobs=len(paths))
+
+    found = dict()
+    for candidates in scanned:
+        for root_path in candidates:
+            name = os.path.basename(root_path)
+            if name not in found:
+                found[name] = root_path
+
+    return [found[name] for name in sorted(found.keys())]
+
+
+def _get_candidates(path, criteria=None, show_all=False):
+    """Get the projects stored on a given path that match criteria which only require the directory name.
+
+    :param path: Path to where projects are stored.
+    :type path: str
+
+    :param criteria: A list of ``(field, search)`` tuples that may be evaluated before the project is loaded.
+    :type criteria: list
+
+    :param show_all: Include projects without a ``project.ini`` file.
+    :type show_all: bool
+
+    :rtype: list[str]
+    :returns: The project roots in order of their directory names.
+
+    .. note::
+        This is a module-level function so that it may be handed to a worker pool.
+
+    """
+    candidates = list()
+
+    try:
+        entries = sorted(os.listdir(path))
+    except OSError:
+        return candidates
+
+    for project_name in entries:
+
+        # Get the project root path.
+        root_path = os.path.join(path, project_name)
+
+        # Projects are always stored as sub directories of path.
+        if not os.path.isdir(root_path):
+            continue
+
+        # Ignore dot directories.
+        if project_name[0] == ".":
+            continue
+
+        project = Project(root_path)
+
+        # We skip the display of the project if a project config does not exist and show_all is False.
+        if not project.config_exists and not show_all:
+            continue
+
+        if not _match_criteria(project, criteria):
+            continue
+
+        candidates.append(root_path)
+
+    return candidates
+
+
+def _get_criteria_stages(criteria):
+    """Sort filtering criteria by the stage of loading that is able to evaluate them.
+
+    :param criteria: The criteria, if any.
+    :type criteria: dict
+
+    :rtype: dict
+    :returns: A dictionary with ``name``, ``ini``, and ``scm`` keys. Each value is a list of ``(field, search)``
+              tuples.
+
+    """
+    stages = {
+        'ini': list(),
+        'name': list(),
+        'scm': list(),
+    }
+
+    if not criteria:
+        return stages
+
+    for field, search in sorted(criteria.items()):
+        if field == "name":
+            stages['name'].append((field, search))
+        elif field in LAZY_ATTRIBUTES:
+            stages['scm'].append((field, search))
+        else:
+            stages['ini'].append((field, search))
+
+    return stages
+
+
+def _get_command_index(use_index=True):
+    """Get the index in which the results of commands such as ``hg`` and ``svn`` are cached.
+
+    :param use_index: Indicates whether the index should be used at all.
+    :type use_index: bool
+
+    :rtype: CommandIndex | None
+
+    """
+    if not use_index:
+        return None
+
+    index = CommandIndex()
+    index.load()
+
+    return index
+
+
+def _get_config_index(use_index=True):
+    """Get the index in which parsed ``project.ini`` files are cached.
+
+    :param use_index: Indicates whether the index should be used at all.
+    :type use_index: bool
+
+    :rtype: ConfigIndex | None
+
+    """
+    if not use_index:
+        return None
+
+    index = ConfigIndex()
+    index.load()
+
+    return index
+
+
+def _get_disk_jobs(jobs=None):
+    """Get the number of directories to walk at the same time when calculating the disk space used by each project.
+
+    :param jobs: The number of projects loaded at the same time.
+    :type jobs: int
+
+    :rtype: int | None
+    :returns: ``1`` when projects are loaded in a worker pool, so that the number of threads is not multiplied by the
+              number of CPUs, or ``None`` for the default of ``get_disk_usage()``.
+
+    """
+    if jobs and jobs > 1:
+        return 1
+
+    return None
+
+
+def _get_index(use_index=True):
+    """Get the project index.
+
+    :param use_index: Indicates whether the index should be used at all.
+    :type use_index: bool
+
+    :rtype: ProjectIndex | None
+
+    """
+    if not use_index:
+        return None
+
+    index = ProjectIndex()
+    index.load()
+
+    return index
+
+
+def _load_matching_project(root_path, criteria=None, dirty_mode=DIRTY_FULL, include_disk=False, index=None,
+                           preload=None, probes=None, command_index=None, config_index=None, disk_jobs=None):
+    """Load a project, stopping as soon as it fails to match the criteria.
+
+    :param root_path: The path to the project.
+    :type root_path: str
+
+    :param criteria: A list of ``(field, search)`` tuples. Criteria that require lazy attributes should come last.
+    :type criteria: list
+
+    :param dirty_mode: How to determine whether a git repo has uncommitted changes. See ``DIRTY_MODES``.
+    :type dirty_mode: str
+
+    :param include_disk: Whether to calculate disk space used by the project.
+    :type include_disk: bool
+
+    :param index: The project index, if any.
+    :type index: ProjectIndex
+
+    :param preload: The names of lazy attributes to calculate for a matching project.
+    :type preload: list | tuple
+
+    :param probes: The pool in which the state of Mercurial and Subversion repos is being probed, if any.
+    :type probes: ProbePool
+
+    :param command_index: The index in which the results of commands are cached, if any.
+    :type command_index: CommandIndex
+
+    :param config_index: The index in which parsed ``project.ini`` files are cached, if any.
+    :type config_index: ConfigIndex
+
+    :param disk_jobs: The number of directories walked at the same time when calculating disk space.
+    :type disk_jobs: int
+
+    :rtype: Project | None
+    :returns: The project or ``None`` if it does not match.
+
+    .. note::
+        This is a module-level function so that it may be handed to a worker pool.
+
+    """
+    project = _load_project(root_path, include_disk=include_disk, index=index, probes=probes,
+                            command_index=command_index, dirty_mode=dirty_mode, config_index=config_index,
+                            disk_jobs=disk_jobs)
+
+    if not _match_criteria(project, criteria):
+        return None
+
+    return _preload_project(project, attributes=preload, index=index)
+
+
+def _load_project(root_path, include_cloc=False, include_disk=False, index=None, probes=None, command_index=None,
+                  dirty_mode=DIRTY_FULL, config_index=None, disk_jobs=None):
+    """Load the project found at the given root.
+
+    :param root_path: The path to the project.
+    :type root_path: str
+
+    :param include_cloc: Whether to include information on lines of code.
+    :type include_cloc: bool
+
+    :param include_disk: Whether to calculate disk space used by the project.
+    :type include_disk: bool
+
+    :param index: The project index, if any.
+    :type index: ProjectIndex
+
+    :param probes: The pool in which the state of Mercurial and Subversion repos is being probed, if any.
+    :type probes: ProbePool
+
+    :param command_index: The index in which the results of commands are cached, if any.
+    :type command_index: CommandIndex
+
+    :param dirty_mode: How to determine whether a git repo has uncommitted changes. See ``DIRTY_MODES``.
+    :type dirty_mode: str
+
+    :param config_index: The index in which parsed ``project.ini`` files are cached, if any.
+    :type config_index: ConfigIndex
+
+    :param disk_jobs: The number of directories walked at the same time when calculating disk space.
+    :type disk_jobs: int
+
+    :rtype: Project
+
+    .. note::
+        This is a module-level function so that it may be handed to a worker pool.
+
+    .. versionchanged:: 0.36.0-d
+        When the ``memory_cache`` is enabled, a project that has already been loaded is re-used until one of the
+        ``INDEXED_FILES`` changes. The SCM state of a re-used project is checked again when next accessed. Projects
+        that include disk usage or lines of code are always loaded again because these may change at any time.
+
+    """
+    use_cache = memory_cache.enabled and not include_cloc and not include_disk
+
+    if use_cache:
+        fingerprint = ProjectIndex.get_fingerprint(root_path)
+        project = memory_cache.get(("project", root_path, dirty_mode), fingerprint)
+        if project is not None:
+            # The INDEXED_FILES say nothing about the working tree, so the SCM state is checked again.
+            project._probes = probes
+            project._command_index = command_index
+            project._release_scm()
+            return project
+
+    project = Project(root_path)
+    with trace("load", project=project.name):
+        project.load(include_cloc=include_cloc, include_disk=include_disk, index=index, probes=probes,
+                     command_index=command_index, dirty_mode=dirty_mode, config_index=config_index,
+                     disk_jobs=disk_jobs)
+
+    if use_cache:
+        # noinspection PyUnboundLocalVariable
+        memory_cache.set(("project", root_path, dirty_mode), fingerprint, project)
+
+    return project
+
+
+def _imap(function, items, jobs=None):
+    """Apply a function to each item, yielding each result as soon as it is available.
+
+    :param function: The function to apply.
+    :type function: callable
+
+    :param items: The items to process.
+    :type items: list
+
+    :param jobs: The number of items to process at the same time.
+    :type jobs: int
+
+    :rtype: collections.Iterable
+    :returns: The results in the same order as the items.
 
-        if links_enabled:
-            if p.path_exists("docs/build/html/index.html"):
-                url = os.path.join(p.root, "docs/build/html/index.html")
-            elif p.path_exists("README.html"):
-                url = os.path.join(p.root, "README.html")
-            elif p.has_section("urls") and p.urls.has_attribute("project"):
-                url = p.urls.project
-            else:
-                url = p.root
+    """
+    if jobs and jobs > 1 and len(items) > 1:
+        pool = ThreadPool(min(jobs, len(items)))
+        try:
+            for result in pool.imap(function, items):
+                yield result
+        finally:
+            # The pool is not joined. The pool's threads are daemons and joining waits for a thread that only checks
+            # whether it should stop once every tenth of a second, which is slower than loading most projects.
+            pool.close()
+    else:
+        for item in items:
+            yield function(item)
 
-            link = '<a href="%s" target="_blank">%s</a>' % (url, p.title)
 
-            output.append('<td>%s</td>' % link)
-        else:
-            output.append('<td>%s</td>' % p.title)
+def _map(function, items, jobs=None):
+    """Apply a function to each item, using a worker pool when more than one job is requested.
 
-        output.append('<td>%s</td>' % p.description)
-        output.append('<td>%s</td>' % p.category)
-        output.append('<td>%s</td>' % p.type)
-        output.append('<td>%s</td>' % p.org)
-        output.append('<td>%s</td>' % p.version)
-        output.append('<td>%s</td>' % p.status)
-        output.append('<td>%s</td>' % p.disk)
-        output.append('<td>%s</td>' % scm)
+    :param function: The function to apply.
+    :type function: callable
 
-        if links_enabled:
-            if p.has_section("urls"):
-                links = list()
+    :param items: The items to process.
+    :type items: list
 
-                if config_exists:
-                    links.append(config_exists)
+    :param jobs: The number of items to process at the same time.
+    :type jobs: int
 
-                for link in p.urls.get_links():
-                    links.append(link.to_html())
+    :rtype: list
+    :returns: The results in the same order as the items.
 
-                output.append('<td>%s</td>' % "&nbsp; ".join(links))
+    """
+    return list(_imap(function, items, jobs=jobs))
 
-            else:
-                output.append('<td>%s</td>' % config_exists)
-        else:
-            output.append('<td>%s</td>' % config_exists)
 
-        output.append('</tr>')
+def _match_criteria(project, criteria):
+    """Determine whether a project matches all of the given criteria.
 
-    # Close the table.
-    output.append('<tfoot>')
-    output.append('<tr>')
-    output.append('<td></td>')
-    output.append('<td></td>')
-    output.append('<td></td>')
-    output.append('<td></td>')
-    output.append('<td></td>')
-    output.append('<td></td>')
-    output.append('<td></td>')
-    output.append('<td></td>')
-    output.append('<td>%s dirty</td>' % dirty_count)
-    output.append('<td>%s error(s)</td>' % error_count)
-    output.append('</tr>')
-    output.append('</tfoot>')
-    output.append('</tbody>')
-    output.append('</table>')
+    :param project: The project.
+    :type project: Project
 
-    if wrapped:
-        output.append('</div>')
-        output.append('</body>')
-        output.append('</html>')
+    :param criteria: A list of ``(field, search)`` tuples.
+    :type criteria: list
 
-    return "\n".join(output)
+    :rtype: bool
 
+    .. note::
+        ``description`` and ``name`` are matched partially and without regard to case. ``tag`` matches if the project
+        has the given tag. All other fields must be equal to the search value.
 
-def format_projects_for_shell(projects, color_enabled=False, heading="Projects", lines_enabled=False, show_all=False,
-                              show_branch=False):
-    """Get project list for output to shell.
+    """
+    if not criteria:
+        return True
 
-    :param projects: The project list as returned by ``get_projects()``.
-    :type projects: list[Project]
+    for field, search in criteria:
+        if field in ("description", "name"):
+            if search.lower() not in getattr(project, field).lower():
+                return False
+        elif field == "tag":
+            if search not in getattr(project, "tags"):
+                return False
+        else:
+            if getattr(project, field) != search:
+                return False
 
-    :param color_enabled: Enable output coloring.
-    :type color_enabled: bool
+    return True
 
-    :param heading: The heading label that appears at the top of the output.
-    :type heading: str
 
-    :param lines_enabled: Separate each project with a dotted line.
-    :type lines_enabled: bool
+def _preload_project(project, attributes=None, index=None):
+    """Calculate the given lazy attributes of a project.
 
-    :param show_all: Indicates show all projects was requested.
-    :type show_all: bool
+    :param project: The project.
+    :type project: Project
 
-    :param show_branch: Show SCM branch.
-    :type show_branch: bool
+    :param attributes: The names of the attributes to calculate.
+    :type attributes: list | tuple
 
-    :rtype: str
+    :param index: The project index, if any. The project is updated in the index after the attributes are calculated.
+    :type index: ProjectIndex
 
-    .. versionadded: 0.27.0-d
+    :rtype: Project
 
-    .. versionchanged: 0.31.0-d
-        Added optional ``lines_enabled`` parameter for further visual separation of projects in the list.
+    .. note::
+        This is a module-level function so that it may be handed to a worker pool.
 
     """
-    output = list()
-
-    output.append("=" * 140)
-    output.append(heading)
-    output.append("=" * 140)
+    if attributes:
+        for name in attributes:
+            getattr(project, name)
 
-    # Print the column headings.
-    output.append(
-        "%-30s %-20s %-15s %-5s %-10s %-15s %-15s %-10s %-20s"
-        % ("Title", "Category", "Type", "Org", "Version", "Stage", "Status", "Disk", "SCM")
-    )
-    output.append("-" * 140)
+    if index is not None and project.exists:
+        index.set(project.root, project.to_index())
 
-    # Print the rows.
-    if len(projects) == 0:
-        output.append("")
-        output.append("No results.")
-        return "\n".join(output)
+    return project
 
-    dirty_count = 0
-    dirty_list = list()
-    error_count = 0
-    line_number = 1
-    total_projects = len(projects)
-    for p in projects:
 
-        title = p.truncated_title()
+def _start_probes(candidates, criteria=None, preload=None, command_index=None):
+    """Start probing the state of the Mercurial and Subversion repos among the candidates, so that the state is ready
+    (or nearly so) by the time each project is loaded.
 
-        if p.config_exists:
-            config_exists = ""
-        else:
-            config_exists = "*"
+    :param candidates: The project roots.
+    :type candidates: list[str]
 
-        if p.has_error:
-            config_exists += " (e)"
-            error_count += 1
-        else:
-            pass
+    :param criteria: A list of ``(field, search)`` tuples that require SCM state.
+    :type criteria: list
 
-        if p.is_dirty:
-            dirty_count += 1
-            dirty_list.append(p.name)
-            scm = "%s+" % p.scm
-        else:
-            scm = str(p.scm)
+    :param preload: The names of lazy attributes that will be calculated.
+    :type preload: list | tuple
 
-        if show_branch:
-            if p.branch:
-                scm += " (%s)" % p.branch
-            else:
-                scm += " (unknown)"
+    :param command_index: The index in which the results of the probe commands are cached, if any.
+    :type command_index: CommandIndex
 
-        line = "%-30s %-20s %-15s %-5s %-10s %-15s %-15s %-10s %-4s %-1s" % (
-            title,
-            p.category,
-            p.type,
-            p.org,
-            p.version,
-            p.stage,
-            p.status,
-            p.disk,
-            scm,
-            config_exists
-        )
+    :rtype: ProbePool
+    :returns: The pool, which must be closed when the projects have been loaded. Nothing is started unless the SCM
+              state is required by the criteria or ``preload``.
 
-        if color_enabled:
-            if p.has_error:
-                output.append(red(line))
-            elif p.is_dirty:
-                output.append(yellow(line, bold=True))
-            elif p.status == "live":
-                output.append(green(line))
-            elif p.status == "unknown":
-                output.append(cyan(line))
-            else:
-                output.append(line)
+    """
+    probes = ProbePool(cache=command_index)
 
-            if lines_enabled and line_number < total_projects:
-                output.append("." * 130)
-        else:
-            output.append(line)
-            if lines_enabled and line_number < total_projects:
-                output.append("." * 130)
+    if not criteria and not set(preload or ()).intersection(("branch", "is_dirty", "scm")):
+        return probes
 
-        line_number += 1
+    for root_path in candidates:
 
-    if total_projects == 1:
-        label = "result"
-    else:
-        label = "results"
+        # Git is read in process and takes precedence when a project has more than one type of SCM.
+        if os.path.exists(os.path.join(root_path, ".git")):
+            continue
 
-    output.append("-" * 140)
-    output.append("")
-    output.append("%s %s." % (len(projects), label))
+        if os.path.exists(os.path.join(root_path, ".hg")):
+            scm = "hg"
+        elif os.path.exists(os.path.join(root_path, ".svn")):
+            scm = "svn"
+        else:
+            continue
 
-    if show_all:
-        output.append("* indicates absence of project.ini file.")
+        probes.start(root_path, scm)
 
-    if error_count >= 1:
-        output.append("(e) indicates an error parsing the project.ini file. Use the --name switch to find out more.")
+    return probes
 
-    if dirty_count == 1:
-        output.append("One project with uncommitted changes: %s" % dirty_list[0])
-    elif dirty_count > 1:
-        output.append("%s projects with uncommitted changes." % dirty_count)
-        output.append("")
 
-        for i in dirty_list:
-            output.append("    cd %s/%s && git st" % (PROJECT_HOME, i))
+def _save_index(index):
+    """Save an index if it has changed.
 
-        output.append("")
-    else:
-        output.append("No projects with uncommitted changes.")
+    :param index: The index, if any.
+    :type index: BaseIndex
 
-    return "\n".join(output)
+    """
+    if index is not None and index.has_changes:
+        index.save()
 
 # Classes
 
@@ -672,19 +1566,15 @@ class Project(Config):
             The ``name`` parameter was removed. It is now derived from the base name of the ``path``.
 
         """
-        self.branch = None
         self.business = None
         self.category = None or "uncategorized"
         self.client = None
         self.config_exists = None
         self.description = "TODO: Write a brief description of the project."
         self.description_exists = None
-        self.disk = "TBD"
         self.domain = None
         self.gitignore_exists = None
-        self.is_dirty = None
         self.is_loaded = False
-        self.languages = dict()
         self.license = None
         self.license_exists = None
         self.makefile_exists = None
@@ -694,19 +1584,26 @@ class Project(Config):
         self.readme_exists = None
         self.requirements_exists = None
         self.root = path
-        self.scm = None
         self.setup_exists = None
         self.stage = None
         self.status = None
         self.tags = list()
         self.title = None
-        self.total_directories = None
-        self.total_files = None
         self.type = "project"
         self.urls = None
         self.version = "0.1.0-d"
         self.version_exists = None
+        self._include_cloc = False
+        self._include_disk = False
+        self._disk_jobs = None
+        self._lazy = dict()
+        self._probes = None
+        self._command_index = None
+        self._dirty_mode = DIRTY_FULL
+        self._indexed_scm = None
+        self._use_index = False
         self._requirements = list()
+        self._section_values = list()
 
         # Set the default slug. This may be overridden if a title is available during load().
         self.slug = self.name
@@ -723,6 +1620,39 @@ class Project(Config):
     def __str__(self):
         return self.name
 
+    @property
+    def branch(self):
+        """The current SCM branch.
+
+        :rtype: str | None
+
+        .. versionchanged:: 0.36.0-d
+            Calculated on first access along with ``is_dirty`` and ``scm``.
+
+        """
+        return self._get_lazy("branch")
+
+    @branch.setter
+    def branch(self, value):
+        self._lazy['branch'] = value
+
+    @property
+    def disk(self):
+        """The disk space used by the project.
+
+        :rtype: int | None
+        :returns: The number of bytes or ``None`` if disk usage was not requested when the project was loaded.
+
+        .. versionchanged:: 0.36.0-d
+            Calculated on first access.
+
+        """
+        return self._get_lazy("disk")
+
+    @disk.setter
+    def disk(self, value):
+        self._lazy['disk'] = value
+
     @property
     def exists(self):
         """Indicates whether the project root exists.
@@ -905,8 +1835,11 @@ class Project(Config):
         :rtype: str
 
         """
-        command = Command("tree %s" % self.root)
-        if command.run():
+        command = Command(["tree", self.root])
+        with trace("tree", project=self.name):
+            success = command.run()
+
+        if success:
             output = command.output
 
             # Remove the first line which is the path.
@@ -968,7 +1901,7 @@ class Project(Config):
 
     @property
     def has_scm(self):
-        return self._get_scm() is not None
+        return self.scm is not None
 
     def initialize(self, display=True, templates=None):
         """Initialize the project, creating various meta files as needed.
@@ -1068,8 +2001,9 @@ class Project(Config):
                 content = "Copyright (C) %s. All rights reserved." % org
                 write_file(license_path, content)
             else:
-                command = Command('lice --org="%s" --proj="%s" %s > %s' % (org, self.title, self.license, license_path))
-                command.run()
+                command = Command(["lice", "--org=%s" % org, "--proj=%s" % self.title, self.license])
+                if command.run():
+                    write_file(license_path, command.output)
 
         # Create a manifest if this is a Django app.
         if self.category == "django" and self.type == "app":
@@ -1138,8 +2072,43 @@ class Project(Config):
 
         return True
 
+    @property
+    def is_dirty(self):
+        """Indicates whether the project has uncommitted changes.
+
+        :rtype: bool | None
+
+        .. versionchanged:: 0.36.0-d
+            Calculated on first access along with ``branch`` and ``scm``.
+
+        """
+        return self._get_lazy("is_dirty")
+
+    @is_dirty.setter
+    def is_dirty(self, value):
+        self._lazy['is_dirty'] = value
+
+    @property
+    def languages(self):
+        """Lines of code by language.
+
+        :rtype: dict
+        :returns: A dictionary of ``(files, code)`` tuples keyed by language. The dictionary is empty unless lines of
+                  code were requested when the project was loaded.
+
+        .. versionchanged:: 0.36.0-d
+            Calculated on first access.
+
+        """
+        return self._get_lazy("languages")
+
+    @languages.setter
+    def languages(self, value):
+        self._lazy['languages'] = value
+
     # noinspection SpellCheckingInspection
-    def load(self, include_cloc=False, include_disk=False):
+    def load(self, include_cloc=False, include_disk=False, index=None, probes=None, command_index=None,
+             dirty_mode=DIRTY_FULL, config_index=None, disk_jobs=None):
         """Load the project.
 
         :param include_cloc: Whether to include information on lines of code.
@@ -1148,6 +2117,29 @@ class Project(Config):
         :param include_disk: Whether to calculate disk usage.
         :type include_disk: bool
 
+        :param index: The project index. When given, the project is loaded from the index if the entry is current and
+                      the index is updated otherwise.
+        :type index: ProjectIndex
+
+        :param probes: The pool in which the state of the project's Mercurial or Subversion repo may already be
+                       probed. When the project has not been started in the pool, the repo is probed when its state is
+                       first accessed.
+        :type probes: ProbePool
+
+        :param command_index: The index in which the results of the ``hg`` and ``svn`` commands are cached, if any.
+        :type command_index: CommandIndex
+
+        :param dirty_mode: How to determine whether a git repo has uncommitted changes. See ``DIRTY_MODES``.
+        :type dirty_mode: str
+
+        :param config_index: The index in which the parsed ``project.ini`` is cached, if any. It is used when the
+                             project is not current in the project ``index``.
+        :type config_index: ConfigIndex
+
+        :param disk_jobs: The number of directories walked at the same time when calculating disk usage. Defaults to
+                          the number of CPUs. See ``get_disk_usage()``.
+        :type disk_jobs: int
+
         :rtype: bool
         :returns: Returns ``True`` if the project was found and loaded successful. This also sets ``is_loaded`` to
                   ``True``.
@@ -1155,13 +2147,36 @@ class Project(Config):
         .. versionchanged: 0.27.0-d
             Added checks for common meta files. Also added ``include_cloc`` parameter.
 
+        .. versionchanged: 0.36.0-d
+            Added ``index`` parameter. The number of directories and files is now counted in process rather than with
+            the ``tree`` command, so ``total_directories`` and ``total_files`` are integers.
+
+            The ``LAZY_ATTRIBUTES`` are no longer calculated here. ``include_cloc`` and ``include_disk`` now determine
+            whether ``languages`` and ``disk`` are calculated when first accessed. Added ``probes``,
+            ``command_index``, ``dirty_mode``, ``config_index``, and ``disk_jobs`` parameters.
+
         """
+        self._include_cloc = include_cloc
+        self._include_disk = include_disk
+        self._disk_jobs = disk_jobs
+        self._probes = probes
+        self._command_index = command_index
+        self._dirty_mode = dirty_mode
+        self._use_index = index is not None
+
         # We can't do anything if the project root doesn't exist.
         if not self.exists:
             self.is_loaded = False
             self._error = "Project root does not exist: %s" % self.root
             return False
 
+        # Use the index if the project has not changed since it was last loaded.
+        if index is not None:
+            values = index.get(self.root)
+            if values is not None:
+                self._load_index(values)
+                return self.is_loaded
+
         # Assemble context.
         context = {
             'ANSIBLE': "http://docs.ansible.com",
@@ -1178,7 +2193,8 @@ class Project(Config):
         }
 
         # Let the underlying Config do it's thing.
-        super(Project, self).load(context=context)
+        with trace("ini", project=self.name):
+            super(Project, self).load(context=context, cache=config_index)
 
         # Make sure we always have title.
         if not self.title:
@@ -1189,13 +2205,8 @@ class Project(Config):
 
         # Get meta data.
         self.org = self._get_org()
-        self.scm = self._get_scm()
         self._load_version()
 
-        # Calculate disk space.
-        if include_disk:
-            self.disk = self._get_disk()
-
         # Determine if various meta files exist.
         self.description_exists = self.path_exists("DESCRIPTION.txt")
         self.gitignore_exists = self.path_exists(".gitignore")
@@ -1207,20 +2218,6 @@ class Project(Config):
         self.setup_exists = self.path_exists("setup.py")
         self.version_exists = self.path_exists("VERSION.txt")
 
-        # Get the number of files and directories. 4 directories, 63 files
-        command = Command("tree %s | tail -1" % self.root)
-        if command.run():
-            self.total_directories = command.output.split(", ")[0].split(" ")[0]
-            self.total_files = command.output.split(", ")[1].split(" ")[0]
-
-        # command = 'tree | tail -1 | awk -F "," ' + "'{print $1}' | " + 'awk -F " " ' + "'{print $1}'"
-        # status, output = commands.getstatusoutput("cd %s && %s" % (self.root, command))
-        # self.total_directories = output.strip()
-        #
-        # command = 'tree | tail -1 | awk -F "," ' + "'{print $2}' | " + 'awk -F " " ' + "'{print $1}'"
-        # status, output = commands.getstatusoutput("cd %s && %s" % (self.root, command))
-        # self.total_files = output.strip()
-
         # Deal with transition from status and stage.
         if self.stage is None and self.status is not None:
             self.stage = self.status
@@ -1229,41 +2226,9 @@ class Project(Config):
             self.stage = "planning"
             self.status = self._get_status()
 
-        # Get CLOC info.
-        if include_cloc:
-            command = Command("cloc %s --csv --quiet" % self.root)
-            if command.run():
-
-                # The cloc command produces output as below, but also produces extra output even with --quiet. So we
-                # need to clean that up.
-                """
-                files, language, blank, comment, code
-                13,CSS,2300,639,14631
-                12,Javascript,828,393,2200
-                9,HTML,72,155,1030
-                13,SASS,19,22,928
-                12,LESS,18,27,907
-                5,XML,0,0,550
-                3,JSON,0,0,3
-                """
-                for line in command.output.split("\n"):
-
-                    values = line.split(",")
-
-                    if values[0] == "":
-                        continue
-
-                    if values[0] == "files":
-                        continue
-
-                    files = values[0]
-                    language = values[1]
-                    code = values[4]
-
-                    self.languages[language] = (files, code)
-
-            # command = "cloc --csv --quiet %s" % self.root
-            # status, output = commands.getstatusoutput(command)
+        # Update the index.
+        if index is not None:
+            index.set(self.root, self.to_index())
 
         return self.is_loaded
 
@@ -1290,6 +2255,22 @@ class Project(Config):
 
         return read_file(path)
 
+    @property
+    def scm(self):
+        """The type of SCM in use.
+
+        :rtype: str | None
+
+        .. versionchanged:: 0.36.0-d
+            Calculated on first access along with ``branch`` and ``is_dirty``.
+
+        """
+        return self._get_lazy("scm")
+
+    @scm.setter
+    def scm(self, value):
+        self._lazy['scm'] = value
+
     def to_csv(self, include_header=False):
         """Convert project attributes to CSV text output.
 
@@ -1350,7 +2331,7 @@ class Project(Config):
         line.append('"%s"' % bool_to_yes_no(self.description_exists))
         line.append('"%s"' % self.total_directories)
         line.append('"%s"' % bool_to_yes_no(self.is_dirty))
-        line.append('"%s"' % self.disk)
+        line.append('"%s"' % bytes_to_human(self.disk))
         line.append('"%s"' % bool_to_yes_no(self.gitignore_exists))
         line.append('"%s"' % self.total_files)
         line.append('"%s"' % self.license)
@@ -1373,6 +2354,39 @@ class Project(Config):
 
         return "\n".join(lines)
 
+    def to_index(self):
+        """Get the loaded project attributes for storage in the project index.
+
+        :rtype: dict
+
+        .. versionadded:: 0.36.0-d
+
+        """
+        d = dict()
+        for name in INDEXED_ATTRIBUTES:
+            d[name] = getattr(self, name)
+
+        # Lazy attributes are only indexed if they have already been calculated.
+        lazy = dict()
+        for name in LAZY_INDEXED_ATTRIBUTES:
+            if name in self._lazy:
+                lazy[name] = self._lazy[name]
+
+        # The indexed state of a git repo that has not been checked is kept for next time.
+        if self._indexed_scm is not None and "scm" not in self._lazy:
+            lazy.update(self._indexed_scm)
+
+        # None of the INDEXED_FILES change with the state of a Mercurial or Subversion working copy, so the state is
+        # probed again each time rather than indexed.
+        if lazy.get('scm') in ("hg", "svn"):
+            for name in ("branch", "is_dirty", "scm"):
+                lazy.pop(name, None)
+
+        d['lazy'] = lazy
+        d['sections'] = list(self._section_values)
+
+        return d
+
     def to_markdown(self):
         """Output the project as Markdown.
 
@@ -1390,7 +2404,7 @@ class Project(Config):
         a.append("**Status**: %s  " % self.status)
         a.append("**Category**: %s  " % self.category)
         a.append("**Type**: %s  " % self.type)
-        a.append("**Disk Usage**: %s  " % self._get_disk())
+        a.append("**Disk Usage**: %s  " % bytes_to_human(self._get_disk()))
         a.append("**Source Code Management**: %s  " % self.scm)
 
         if self.tags:
@@ -1534,7 +2548,7 @@ class Project(Config):
 
         a.append("Disk")
         a.append("." * 80)
-        a.append("%-40s %s" % ("disk", self.disk))
+        a.append("%-40s %s" % ("disk", bytes_to_human(self.disk)))
         a.append("%-40s %s" % ("directories", self.total_directories))
         a.append("%-40s %s" % ("files", self.total_files))
         a.append("." * 80)
@@ -1594,7 +2608,7 @@ class Project(Config):
         a.append("description file: %s" % bool_to_yes_no(self.description_exists))
         a.append("directories: %s" % self.total_directories)
         a.append("dirty: %s" % bool_to_yes_no(self.is_dirty))
-        a.append("disk: %s" % self.disk)
+        a.append("disk: %s" % bytes_to_human(self.disk))
         a.append("gitignore: %s" % bool_to_yes_no(self.gitignore_exists))
         a.append("files: %s" % self.total_files)
         a.append("license: %s" % self.license)
@@ -1620,6 +2634,38 @@ class Project(Config):
             a.append("langauges: None")
         return "\n".join(a)
 
+    @property
+    def total_directories(self):
+        """The number of directories in the project, counted the same way as the ``tree`` command.
+
+        :rtype: int | None
+
+        .. versionchanged:: 0.36.0-d
+            Calculated on first access along with ``total_files``.
+
+        """
+        return self._get_lazy("total_directories")
+
+    @total_directories.setter
+    def total_directories(self, value):
+        self._lazy['total_directories'] = value
+
+    @property
+    def total_files(self):
+        """The number of files in the project, counted the same way as the ``tree`` command.
+
+        :rtype: int | None
+
+        .. versionchanged:: 0.36.0-d
+            Calculated on first access along with ``total_directories``.
+
+        """
+        return self._get_lazy("total_files")
+
+    @total_files.setter
+    def total_files(self, value):
+        self._lazy['total_files'] = value
+
     def truncated_title(self, limit=30, string="..."):
         """Get the project title, truncating if over the limit.
 
@@ -1644,19 +2690,81 @@ class Project(Config):
         return self.title[:limit] + string
 
     def _get_disk(self):
-        """Return the result of the du command (cleaned up).
+        """Get the disk space used by the project.
+
+        :rtype: int | None
+        :returns: The number of bytes or ``None`` if the disk space could not be determined.
+
+        .. versionchanged:: 0.36.0-d
+            Disk space is now calculated in process and returned as a number of bytes. Use ``bytes_to_human()`` for
+            display.
+
+        """
+        return get_disk_usage(self.root, jobs=self._disk_jobs)
+
+    def _get_languages(self):
+        """Get lines of code by language. When the project index is used, the counts of each file are stored in a
+        ``LineIndex`` and files that have not changed are not read again.
 
-        :rtype str
+        :rtype: OrderedDict
+        :returns: A ``(files, code, blank, comment)`` tuple for each language, keyed by language.
+
+        .. versionadded:: 0.36.0-d
 
         """
-        # Throws a key error because of "print".
-        # command = Command("du -hs %s | awk -F ' ' '{print $1}'", path=self.root)
+        if not self._use_index:
+            return count_lines_of_code(self.root)
+
+        index = LineIndex(self.root)
+        index.load()
+
+        languages = count_lines_of_code(self.root, index=index)
+
+        if index.has_changes:
+            index.save()
+
+        return languages
+
+    def _get_lazy(self, name):
+        """Get the value of a lazy attribute, calculating it if it has not already been calculated.
 
-        command = Command("du -hs", path=self.root)
-        if command.run():
-            return command.output.split("\t")[0].strip()
+        :param name: The name of the attribute. See ``LAZY_ATTRIBUTES``.
+        :type name: str
+
+        .. versionadded:: 0.36.0-d
+
+        """
+        if name in self._lazy:
+            return self._lazy[name]
+
+        if name in ("branch", "is_dirty", "scm"):
+            self._lazy['branch'] = None
+            self._lazy['is_dirty'] = None
+            with trace("scm", project=self.name):
+                self._lazy['scm'] = self._get_scm()
+        elif name == "disk":
+            if self._include_disk:
+                with trace("du", project=self.name):
+                    self._lazy['disk'] = self._get_disk()
+            else:
+                self._lazy['disk'] = None
+        elif name == "languages":
+            if self._include_cloc:
+                with trace("cloc", project=self.name):
+                    self._lazy['languages'] = self._get_languages()
+            else:
+                self._lazy['languages'] = dict()
+        elif name in ("total_directories", "total_files"):
+            if self.exists:
+                with trace("tree", project=self.name):
+                    self._lazy['total_directories'], self._lazy['total_files'] = count_files(self.root)
+            else:
+                self._lazy['total_directories'] = None
+                self._lazy['total_files'] = None
         else:
-            return "UNKNOWN"
+            raise AttributeError(name)
+
+        return self._lazy[name]
 
     def _get_org(self):
         """Get the organization identifier.
@@ -1683,18 +2791,75 @@ class Project(Config):
         :rtype: str | None
         :returns: Returns the type of SCM in use or ``None`` if no SCM is recognized.
 
+        .. versionchanged:: 0.36.0-d
+            The git branch is read from ``HEAD`` rather than the repo. The state of Mercurial and Subversion repos is
+            probed with a timeout, possibly at the same time as other projects. See ``probes.ProbePool``. The dirty
+            state of a git repo is determined according to the ``dirty_mode`` given to ``load()``, and the state
+            from the project index is re-used while the working tree has not changed. The GitPython repo is closed
+            once its state is known; see ``probes.get_git_state()``.
+
         """
         if self.path_exists(".git"):
 
-            # Determine whether the repo is dirty and get the current branch name.
-            try:
-                repo = GitRepo(self.root)
-                self.branch = repo.active_branch
-                self.is_dirty = repo.is_dirty(untracked_files=True)
-            except InvalidGitRepositoryError:
-                self.branch = "unknown"
-                self._error = "Invalid git repository."
-                self.is_dirty = None
+            indexed = self._indexed_scm
+            self._indexed_scm = None
+
+            # The fingerprint is only of use when the state may be re-used, from the project index or the memory
+            # cache.
+            use_fingerprint = self._use_index or memory_cache.enabled or indexed is not None
+
+            # The git index is read once for both the fingerprint and the dirty check.
+            entries = None
+            if use_fingerprint or self._dirty_mode == DIRTY_INDEX:
+                try:
+                    entries = read_git_index(self.root)
+                except ValueError:
+                    pass
+
+            # The fingerprint is taken first so that changes made while the state is determined are seen next time.
+            fingerprint = None
+            if use_fingerprint and entries is not None:
+                fingerprint = (
+                    self._dirty_mode,
+                    get_git_fingerprint(self.root, untracked=self._dirty_mode == DIRTY_FULL, entries=entries)
+                )
+
+            if fingerprint is not None and indexed is not None and indexed['_dirty_fingerprint'] == fingerprint:
+                self.branch = indexed['branch']
+                self.is_dirty = indexed['is_dirty']
+                self._lazy['_dirty_fingerprint'] = fingerprint
+                return "git"
+
+            # Reading HEAD directly is much faster than asking the repo for the active branch. The repo is only used
+            # for the branch name if HEAD could not be read.
+            self.branch = get_git_branch(self.root)
+
+            if self._dirty_mode == DIRTY_INDEX and entries is not None:
+                self.is_dirty = is_git_dirty(self.root, entries=entries)
+
+            # Determine whether the repo is dirty and get the current branch name. Only plain values are kept, so the
+            # repo is released as soon as they are known.
+            if self.branch is None or self.is_dirty is None:
+                try:
+                    branch, is_dirty = get_git_state(
+                        self.root,
+                        branch=self.branch is None,
+                        dirty=self.is_dirty is None,
+                        untracked_files=self._dirty_mode == DIRTY_FULL
+                    )
+
+                    if self.branch is None:
+                        self.branch = branch
+
+                    if self.is_dirty is None:
+                        self.is_dirty = is_dirty
+                except InvalidGitRepositoryError:
+                    self.branch = "unknown"
+                    self._error = "Invalid git repository."
+                    self.is_dirty = None
+                    fingerprint = None
+
+            self._lazy['_dirty_fingerprint'] = fingerprint
 
             # See http://stackoverflow.com/a/5737794/241720
             # BUG: Command does not work with && or with path=.
@@ -1717,41 +2882,31 @@ class Project(Config):
 
             return "git"
         elif self.path_exists(".hg"):
+            self.branch, self.is_dirty = self._get_scm_state("hg")
+            return "hg"
+        elif self.path_exists(".svn"):
+            self.branch, self.is_dirty = self._get_scm_state("svn")
+            return "svn"
+        else:
+            return None
 
-            # TODO: Capturing the status of a Mercurial repo will probably fail for the same reasons as git above.
-
-            # Determine whether the repo is dirty.
-            # See http://stackoverflow.com/a/11012582/241720
-            command = Command("hg identify --id | grep --quiet + ; echo $?)", path=self.root)
-            command.run()
-            if command.status >= 1:
-                self.is_dirty = True
-            else:
-                self.is_dirty = False
+    def _get_scm_state(self, scm):
+        """Get the current branch and whether there are uncommitted changes by running the ``hg`` or ``svn`` commands.
 
-            # Get the current branch name.
-            Command("hg branch", path=self.root)
-            if command.run():
-                self.branch = command.output
-            else:
-                self.branch = "UNKNOWN"
+        :param scm: The type of SCM; ``hg`` or ``svn``.
+        :type scm: str
 
-            return "hg"
-        elif self.path_exists(".svn"):
-            # TODO: Capturing the status of a Subversion repo will probably fail for the same reasons as git above.
+        :rtype: tuple(str | None, bool | None)
 
-            command = Command("test -z svn status", path=self.root)
-            command.run()
-            if command.status >= 1:
-                self.is_dirty = True
-            else:
-                self.is_dirty = False
+        .. versionadded:: 0.36.0-d
 
-            # TODO: Parse output of svn info to get the current branch if possible.
+        """
+        if self._probes is not None:
+            state = self._probes.get(self.root)
+            if state is not None:
+                return state
 
-            return "svn"
-        else:
-            return None
+        return get_scm_state(self.root, scm, cache=self._command_index)
 
     def _get_status(self):
         """Get the current status of the project.
@@ -1766,8 +2921,46 @@ class Project(Config):
         else:
             return "active"
 
+    def _load_index(self, values):
+        """Load the project from the values returned by the project index.
+
+        :param values: The values as produced by ``to_index()``.
+        :type values: dict
+
+        """
+        for name, section_values in values['sections']:
+            self._load_section(name, dict(section_values))
+
+        for name in INDEXED_ATTRIBUTES:
+            setattr(self, name, values[name])
+
+        self._lazy.update(values.get('lazy', dict()))
+
+        # The index entry is not updated when a file in the working tree changes. Entries written before hg and svn
+        # state was excluded from the index may also include it.
+        self._release_scm()
+
+    def _release_scm(self):
+        """Forget the SCM state so that it is checked again when next accessed.
+
+        The state of a git repo is held back until ``_get_scm()`` has checked that the working tree is the same. The
+        state of Mercurial and Subversion repos is simply discarded.
+
+        """
+        if self._lazy.get('scm') == "git":
+            self._indexed_scm = dict()
+            for name in ("_dirty_fingerprint", "branch", "is_dirty", "scm"):
+                self._indexed_scm[name] = self._lazy.pop(name, None)
+        else:
+            for name in ("_dirty_fingerprint", "branch", "is_dirty", "scm"):
+                self._lazy.pop(name, None)
+
     def _load_section(self, name, values):
         """Overridden to add business, client, and project section values to the current instance."""
+
+        # Remember the original values so the section may be restored from the project index.
+        self._section_values.append((name, dict(values)))
+
         if name == "business":
             try:
                 organization_name = values.pop("name")
@@ -14,9 +14,11 @@ import urllib2
 from git import Repo as GitRepo
 # noinspection PyPackageRequirements
 from github import Github
+from .caches import get_fingerprint, memory_cache
 from .config import Config
 from .constants import BITBUCKET_SCM, DEFAULT_SCM, GITHUB_SCM
 from .exceptions import CommandFailed, InputError, ResourceUnavailable
+from .probes import close_git_repo
 from .shell import Command
 from .variables import BITBUCKET_PASSWORD, BITBUCKET_USER, GITHUB_PASSWORD, GITHUB_USER, PROJECT_ARCHIVE, \
     PROJECT_HOME, PROJECTS_ON_HOLD, REPO_META_PATH
@@ -235,6 +237,10 @@ def get_repos(criteria=None, path=REPO_META_PATH, show_all=False):
         Changed ``all`` to ``show_all`` to avoid shadowing a built-in name. The instances returned are also the
         appropriate class, or :py:class:`BaseRepo` if not specific host is available.
 
+    .. versionchanged:: 0.36.0-d
+        Repos loaded from meta data are re-used from the ``memory_cache``, when it is enabled, until the INI file
+        changes.
+
     """
     errors = list()
     names = list()
@@ -286,9 +292,14 @@ def get_repos(criteria=None, path=REPO_META_PATH, show_all=False):
         if repo_name in names:
             continue
 
-        # Load the repo.
-        repo = BaseRepo(repo_name, path=full_path)
-        repo.load()
+        # Load the repo, unless it is already in memory.
+        fingerprint = get_fingerprint(full_path)
+        repo = memory_cache.get(("repo", full_path), fingerprint)
+        if repo is None:
+            repo = BaseRepo(repo_name, path=full_path)
+            repo.load()
+            memory_cache.set(("repo", full_path), fingerprint, repo)
+
         repos.append(repo)
         # print(repo)
 
@@ -574,10 +585,11 @@ class BaseRepo(Config):
         """
         if self.cli == "git":
             path = os.path.join(path, self.name)
-            GitRepo.clone_from(self.get_url(), path)
+            repo = GitRepo.clone_from(self.get_url(), path)
+            close_git_repo(repo)
             return True
         elif self.cli == "hg":
-            command = Command("hg clone %s" % self.get_url(), path=path)
+            command = Command(["hg", "clone", self.get_url()], path=path)
             return command.run()
         else:
             raise ValueError("Unsupported repo type: %s" % self.cli)
@@ -659,26 +671,28 @@ class BaseRepo(Config):
         # Attempt to initialize the repo.
         if self.cli == "git":
             repo = GitRepo.init(self.project.root)
+            try:
+                if add:
+                    repo.git.add(".")
 
-            if add:
-                repo.git.add(".")
-
-            if commit:
-                repo.index.commit(message)
+                if commit:
+                    repo.index.commit(message)
+            finally:
+                close_git_repo(repo)
 
             return True
         elif self.cli == "hg":
-            command = Command("hg init", path=self.project.root)
+            command = Command(["hg", "init"], path=self.project.root)
             if not command.run():
                 raise CommandFailed("Command failed: %s" % command.preview())
 
             if add:
-                command = Command("hg add .", path=self.project.root)
+                command = Command(["hg", "add", "."], path=self.project.root)
                 if not command.run():
                     raise CommandFailed("Command failed: %s" % command.preview())
 
             if commit:
-                command = Command('hg commit -m "%s"' % message)
+                command = Command(["hg", "commit", "-m", message], path=self.project.root)
                 if not command.run():
                     raise CommandFailed("Command failed: %s" % command.preview())
 
@@ -805,17 +819,17 @@ class BitbucketRepo(BaseRepo):
             raise InputError("Local repo path does not exist: %s" % self.project.root)
 
         if self.cli == "git":
-            command = Command("git init", path=self.project.root)
+            command = Command(["git", "init"], path=self.project.root)
             if not command.run():
                 raise CommandFailed("Failed to run git init: %s" % command.output)
 
             if add:
-                command = Command("git add .", path=self.project.root)
+                command = Command(["git", "add", "."], path=self.project.root)
                 if not command.run():
                     raise CommandFailed("Failed to run git add: %s" % command.output)
 
             if commit:
-                command = Command('git commit -m "%s"' % message)
+                command = Command(["git", "commit", "-m", message], path=self.project.root)
                 if not command.run():
                     raise CommandFailed("Failed to run git commit: %s" % command.output)
         else:
@@ -983,17 +997,17 @@ class GitHubRepo(BaseRepo):
         if not os.path.exists(self.path):
             raise InputError("Local repo path does not exist: %s" % self.project.root)
 
-        command = Command("git init", path=self.project.root)
+        command = Command(["git", "init"], path=self.project.root)
         if not command.run():
             raise CommandFailed("Failed to run git init: %s" % command.output)
 
         if add:
-            command = Command("git add .", path=self.project.root)
+            command = Command(["git", "add", "."], path=self.project.root)
             if not command.run():
                 raise CommandFailed("Failed to run git add: %s" % command.output)
 
         if commit:
-            command = Command('git commit -m "%s"' % message)
+            command = Command(["git", "commit", "-m", message], path=self.project.root)
             if not command.run():
                 raise CommandFailed("Failed to run git commit: %s" % command.output)
 
@@ -0,0 +1,916 @@
+"""
+.. versionadded:: 0.36.0-d
+
+Read source code management meta data directly from disk. These functions do not run any commands, so they are much
+faster than the command line tools (or libraries that wrap them) when all that is needed is a simple value.
+
+The git index (``.git/index``) may also be read to find out whether any tracked file has changed, by comparing the size
+and modification time recorded for each file with the working tree, as ``git status`` does before it reads any files.
+The same is done for Mercurial with ``.hg/dirstate`` and for Subversion with ``.svn/wc.db``. When the meta data alone
+is not enough to be sure, these functions return ``None`` so that the caller may fall back to the command line tool.
+
+.. note::
+    This module intentionally depends only upon the standard library.
+
+"""
+# Imports
+
+from collections import namedtuple
+# noinspection PyCompatibility
+from ConfigParser import Error as ConfigParserError, RawConfigParser
+from fnmatch import fnmatchcase
+from hashlib import md5, sha1, sha256
+import os
+import re
+import sqlite3
+from stat import S_IFMT, S_ISDIR, S_ISLNK, S_ISREG
+import struct
+
+# Exports
+
+__all__ = (
+    "get_git_branch",
+    "get_git_dir",
+    "get_git_fingerprint",
+    "get_hg_branch",
+    "get_svn_branch",
+    "is_git_dirty",
+    "is_hg_dirty",
+    "is_svn_dirty",
+    "read_git_index",
+    "GitIndexEntry",
+)
+
+# Constants
+
+SHA_PATTERN = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+"""Matches a full SHA-1 or SHA-256 commit identifier."""
+
+GIT_INDEX_ASSUME_VALID = 0x8000
+GIT_INDEX_EXTENDED = 0x4000
+GIT_INDEX_STAGE = 0x3000
+GIT_INDEX_INTENT_TO_ADD = 0x2000
+GIT_INDEX_SKIP_WORKTREE = 0x4000
+GIT_INDEX_GITLINK = 0o160000
+
+GIT_INDEX_HEADER = struct.Struct(">4sII")
+"""The signature, version, and number of entries of the git index."""
+
+GIT_INDEX_STAT = struct.Struct(">10I")
+"""The ctime, ctime nanoseconds, mtime, mtime nanoseconds, device, inode, mode, uid, gid, and size of an entry."""
+
+HG_DIRSTATE_ENTRY = struct.Struct(">cllll")
+"""The state, mode, size, modification time, and name length of an entry of the Mercurial dirstate."""
+
+HG_NULL_ID = "\0" * 20
+"""The identifier of the null revision in the Mercurial dirstate."""
+
+SVN_GLOBAL_IGNORES = "*.o *.lo *.la *.al .libs *.so *.so.[0-9]* *.a *.pyc *.pyo __pycache__ *.rej *~ #*# .#* .*.swp " \
+                     ".DS_Store [Tt]humbs.db"
+"""The patterns of unversioned files that Subversion ignores unless ``global-ignores`` is configured."""
+
+SVN_MIN_FORMAT = 29
+"""The oldest working copy format that may be read (Subversion 1.7)."""
+
+SVN_MAX_FORMAT = 31
+"""The newest working copy format that may be read (Subversion 1.8 to 1.14)."""
+
+SVN_TRANSLATED_PROPERTIES = ("svn:eol-style", "svn:keywords", "svn:special")
+"""Properties that cause the content of a file to differ from the pristine copy."""
+
+GitIndexEntry = namedtuple("GitIndexEntry", ("path", "mtime", "size", "mode", "sha", "flags", "extended_flags"))
+"""An entry of the git index. The ``mtime`` is the whole number of seconds and ``size`` is truncated to 32 bits."""
+
+# Functions
+
+
+def get_git_branch(path):
+    """Get the name of the current branch of a git working tree by reading ``HEAD``.
+
+    :param path: The path to the working tree.
+    :type path: str
+
+    :rtype: str | None
+    :returns: The branch name, ``HEAD detached at <commit>`` when the HEAD is detached, or ``None`` if the HEAD could
+              not be read.
+
+    """
+    git_dir = get_git_dir(path)
+    if git_dir is None:
+        return None
+
+    try:
+        with open(os.path.join(git_dir, "HEAD"), "rb") as f:
+            head = f.read().strip()
+            f.close()
+    except EnvironmentError:
+        return None
+
+    if head.startswith("ref:"):
+        ref = head[4:].strip()
+
+        if ref.startswith("refs/heads/"):
+            return ref[11:]
+
+        return ref
+
+    if SHA_PATTERN.match(head):
+        return "HEAD detached at %s" % head[:7]
+
+    return None
+
+
+def get_git_dir(path):
+    """Get the git directory of a working tree.
+
+    :param path: The path to the working tree.
+    :type path: str
+
+    :rtype: str | None
+    :returns: The path to the git directory or ``None`` if one could not be found.
+
+    .. note::
+        Worktrees and submodules use a ``.git`` *file* with a ``gitdir:`` line that points to the actual git directory.
+        The path may be relative to the working tree.
+
+    """
+    git_path = os.path.join(path, ".git")
+
+    if os.path.isdir(git_path):
+        return git_path
+
+    if not os.path.isfile(git_path):
+        return None
+
+    try:
+        with open(git_path, "rb") as f:
+            content = f.read().strip()
+            f.close()
+    except EnvironmentError:
+        return None
+
+    if not content.startswith("gitdir:"):
+        return None
+
+    git_dir = content[7:].strip()
+    if not os.path.isabs(git_dir):
+        git_dir = os.path.normpath(os.path.join(path, git_dir))
+
+    if os.path.isdir(git_dir):
+        return git_dir
+
+    return None
+
+
+def get_git_fingerprint(path, untracked=False, entries=None):
+    """Get a fingerprint of a git working tree that changes whenever the state of the working tree may have changed.
+
+    :param path: The path to the working tree.
+    :type path: str
+
+    :param untracked: Also include the modification times of the working tree and every directory above a tracked
+                      file, which change when an untracked file is added to or removed from one of them.
+    :type untracked: bool
+
+    :param entries: The entries already returned by ``read_git_index()``, if any. The index is read when ``None``.
+    :type entries: list[GitIndexEntry]
+
+    :rtype: str | None
+    :returns: The fingerprint or ``None`` if the git index could not be read.
+
+    .. note::
+        This requires a ``stat()`` of every tracked file, but does not read any files other than the index and
+        ``HEAD``.
+
+    """
+    if entries is None:
+        try:
+            entries = read_git_index(path)
+        except ValueError:
+            return None
+
+        if entries is None:
+            return None
+
+    git_dir = get_git_dir(path)
+
+    fingerprint = md5()
+    for name in ("index", "HEAD"):
+        try:
+            info = os.stat(os.path.join(git_dir, name))
+            fingerprint.update("%s %r %s\n" % (name, info.st_mtime, info.st_size))
+        except OSError:
+            fingerprint.update("%s\n" % name)
+
+    directories = set()
+    for entry in entries:
+        try:
+            info = os.lstat(os.path.join(path, entry.path))
+            fingerprint.update("%r %s %s\n" % (info.st_mtime, info.st_size, info.st_mode))
+        except OSError:
+            fingerprint.update("-\n")
+
+        # Every directory above a tracked file is included, up to the working tree itself, because an untracked file
+        # or directory may be added to any of them.
+        if untracked:
+            directory = os.path.dirname(entry.path)
+            while directory not in directories:
+                directories.add(directory)
+                if not directory:
+                    break
+
+                directory = os.path.dirname(directory)
+
+    # The working tree itself is always included, even when nothing is tracked, because an untracked file or directory
+    # may be added to it.
+    if untracked:
+        directories.add("")
+
+    for directory in sorted(directories):
+        try:
+            fingerprint.update("%s %r\n" % (directory, os.stat(os.path.join(path, directory)).st_mtime))
+        except OSError:
+            fingerprint.update("%s\n" % directory)
+
+    return fingerprint.hexdigest()
+
+
+def get_hg_branch(path):
+    """Get the name of the current branch of a Mercurial working copy by reading ``.hg/branch``.
+
+    :param path: The path to the working copy.
+    :type path: str
+
+    :rtype: str | None
+    :returns: The branch name or ``None`` if the path is not a Mercurial working copy.
+
+    """
+    hg_dir = os.path.join(path, ".hg")
+    if not os.path.isdir(hg_dir):
+        return None
+
+    # Mercurial only writes the file for branches other than the default.
+    try:
+        with open(os.path.join(hg_dir, "branch"), "rb") as f:
+            branch = f.read().strip()
+    except EnvironmentError:
+        branch = ""
+
+    return branch or "default"
+
+
+def get_svn_branch(path):
+    """Get the name of the current branch of a Subversion working copy from the repository path of its root in
+    ``.svn/wc.db``.
+
+    :param path: The path to the root of the working copy.
+    :type path: str
+
+    :rtype: str | None
+    :returns: ``trunk``, or the name of the branch or tag when the repository uses the standard ``trunk/``,
+              ``branches/``, and ``tags/`` layout, or ``None`` if the branch could not be determined.
+
+    """
+    db_path = os.path.join(path, ".svn", "wc.db")
+    if not os.path.isfile(db_path):
+        return None
+
+    try:
+        connection = sqlite3.connect(db_path, timeout=1)
+    except sqlite3.Error:
+        return None
+
+    try:
+        wc_format = connection.execute("PRAGMA user_version").fetchone()[0]
+        if not SVN_MIN_FORMAT <= wc_format <= SVN_MAX_FORMAT:
+            return None
+
+        row = connection.execute(
+            "SELECT nodes.repos_path FROM nodes JOIN wcroot ON nodes.wc_id = wcroot.id "
+            "WHERE wcroot.local_abspath IS NULL AND nodes.local_relpath = '' AND nodes.op_depth = 0"
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    finally:
+        connection.close()
+
+    if row is None or row[0] is None:
+        return None
+
+    parts = row[0].split("/")
+    for i, part in enumerate(parts):
+        if part == "trunk":
+            return part
+
+        if part in ("branches", "tags") and i + 1 < len(parts):
+            return parts[i + 1]
+
+    return None
+
+
+def is_git_dirty(path, entries=None):
+    """Determine whether any tracked file of a git working tree has been modified or removed by comparing each file with
+    the git index.
+
+    :param path: The path to the working tree.
+    :type path: str
+
+    :param entries: The entries already returned by ``read_git_index()``, if any. The index is read when ``None``.
+    :type entries: list[GitIndexEntry]
+
+    :rtype: bool | None
+    :returns: ``True`` if a tracked file has changed or there is an unresolved merge conflict, or ``None`` if the
+              index could not be read.
+
+    .. note::
+        Untracked files and changes that have been staged but not committed are not considered. A file is only read
+        when its size is the same but its modification time is not, in which case its content is compared with the
+        index. Files that are changed by git's filters, such as line endings with ``core.autocrlf``, are reported as
+        modified.
+
+    """
+    if entries is None:
+        try:
+            entries = read_git_index(path)
+        except ValueError:
+            return None
+
+        if entries is None:
+            return None
+
+    git_dir = get_git_dir(path)
+
+    # A file modified in the same second that the index was written can't be distinguished by its modification time.
+    try:
+        index_mtime = int(os.stat(os.path.join(git_dir, "index")).st_mtime)
+    except OSError:
+        return None
+
+    for entry in entries:
+        if entry.flags & GIT_INDEX_STAGE:
+            return True
+
+        if entry.flags & GIT_INDEX_ASSUME_VALID or entry.extended_flags & GIT_INDEX_SKIP_WORKTREE:
+            continue
+
+        # Submodules have a state of their own.
+        if entry.mode & 0o170000 == GIT_INDEX_GITLINK:
+            continue
+
+        if entry.extended_flags & GIT_INDEX_INTENT_TO_ADD:
+            return True
+
+        file_path = os.path.join(path, entry.path)
+        try:
+            info = os.lstat(file_path)
+        except OSError:
+            return True
+
+        if S_ISLNK(entry.mode) != S_ISLNK(info.st_mode) or S_ISDIR(info.st_mode):
+            return True
+
+        if S_ISREG(info.st_mode) and (entry.mode & 0o100) != (info.st_mode & 0o100):
+            return True
+
+        if info.st_size & 0xFFFFFFFF != entry.size:
+            return True
+
+        mtime = int(info.st_mtime)
+        if mtime == entry.mtime and mtime < index_mtime:
+            continue
+
+        if _get_blob_id(file_path, info, len(entry.sha)) != entry.sha:
+            return True
+
+    return False
+
+
+def is_hg_dirty(path):
+    """Determine whether a Mercurial working copy has uncommitted changes by comparing each file with the dirstate.
+
+    :param path: The path to the working copy.
+    :type path: str
+
+    :rtype: bool | None
+    :returns: ``True`` if a file has been added, removed, copied, modified, or deleted or a merge is in progress, or
+              ``None`` if this can't be determined without reading the content of a file (or the dirstate could not be
+              read).
+
+    .. note::
+        Like ``hg identify``, untracked files are not considered. Only version 1 of the dirstate format is supported.
+
+    """
+    hg_dir = os.path.join(path, ".hg")
+    if not os.path.isdir(hg_dir):
+        return None
+
+    try:
+        with open(os.path.join(hg_dir, "requires"), "rb") as f:
+            requirements = f.read().split()
+    except EnvironmentError:
+        requirements = list()
+
+    if "dirstate-v2" in requirements:
+        return None
+
+    try:
+        with open(os.path.join(hg_dir, "dirstate"), "rb") as f:
+            data = f.read()
+    except EnvironmentError:
+        # A new repo has no dirstate until something has been added.
+        return False
+
+    if len(data) < 40:
+        return None
+
+    # The second parent is only set while a merge is in progress.
+    if data[20:40] != HG_NULL_ID:
+        return True
+
+    unknown = False
+    offset = 40
+    try:
+        while offset < len(data):
+            state, mode, size, mtime, length = HG_DIRSTATE_ENTRY.unpack_from(data, offset)
+            offset += HG_DIRSTATE_ENTRY.size
+
+            name = data[offset:offset + length]
+            offset += length
+
+            if state != "n" or "\0" in name:
+                # The file has been added, removed, merged, or copied.
+                return True
+
+            # A size of -2 means the file came from the other parent of a merge.
+            if size == -2:
+                return True
+
+            try:
+                info = os.lstat(os.path.join(path, name))
+            except OSError:
+                return True
+
+            if S_ISDIR(info.st_mode):
+                return True
+
+            # A size or time of -1 means the file must be compared with the repo.
+            if size == -1 or mtime == -1:
+                unknown = True
+                continue
+
+            if S_IFMT(mode) != S_IFMT(info.st_mode):
+                return True
+
+            if S_ISREG(info.st_mode) and (mode ^ info.st_mode) & 0o100:
+                return True
+
+            if size != info.st_size & 0x7FFFFFFF:
+                return True
+
+            if mtime != int(info.st_mtime) & 0x7FFFFFFF:
+                unknown = True
+    except struct.error:
+        return None
+
+    if unknown:
+        return None
+
+    return False
+
+
+def is_svn_dirty(path, untracked=True):
+    """Determine whether a Subversion working copy has local changes by reading ``.svn/wc.db``.
+
+    :param path: The path to the root of the working copy.
+    :type path: str
+
+    :param untracked: Also consider unversioned files that are not ignored, as ``svn status`` does.
+    :type untracked: bool
+
+    :rtype: bool | None
+    :returns: ``True`` if a node has been added, deleted, copied, moved, modified, or is missing or in conflict, or
+              ``None`` if the working copy could not be read or needs to be cleaned up.
+
+    .. note::
+        The working copy formats of Subversion 1.7 to 1.14 are supported. A file whose size is the same but whose
+        modification time is not is compared with its pristine copy, unless its content is translated by
+        ``svn:eol-style``, ``svn:keywords``, or ``svn:special``, in which case the result is ``None``.
+
+    """
+    svn_dir = os.path.join(path, ".svn")
+    db_path = os.path.join(svn_dir, "wc.db")
+    if not os.path.isfile(db_path):
+        return None
+
+    try:
+        connection = sqlite3.connect(db_path, timeout=1)
+    except sqlite3.Error:
+        return None
+
+    try:
+        wc_format = connection.execute("PRAGMA user_version").fetchone()[0]
+        if not SVN_MIN_FORMAT <= wc_format <= SVN_MAX_FORMAT:
+            return None
+
+        # Unfinished work means that the working copy is locked or must be cleaned up.
+        if connection.execute("SELECT 1 FROM work_queue LIMIT 1").fetchone():
+            return None
+
+        row = connection.execute("SELECT id FROM wcroot WHERE local_abspath IS NULL").fetchone()
+        if row is None:
+            return None
+
+        wc_id = row[0]
+
+        # Nodes with an op_depth greater than zero have been added, deleted, copied, or moved.
+        if connection.execute("SELECT 1 FROM nodes WHERE wc_id = ? AND op_depth > 0 LIMIT 1", (wc_id,)).fetchone():
+            return True
+
+        # Local property changes and conflicts are kept with the actual nodes.
+        cursor = connection.execute("SELECT * FROM actual_node WHERE wc_id = ?", (wc_id,))
+        columns = [description[0].lower() for description in cursor.description]
+        for values in cursor:
+            actual = dict(zip(columns, values))
+            for name in ("properties", "conflict_data", "conflict_old", "conflict_new", "conflict_working",
+                         "prop_reject", "tree_conflict_data"):
+                if actual.get(name) is not None:
+                    return True
+
+        nodes = connection.execute(
+            "SELECT local_relpath, presence, kind, properties, checksum, translated_size, last_mod_time FROM nodes "
+            "WHERE wc_id = ? AND op_depth = 0",
+            (wc_id,)
+        ).fetchall()
+    except sqlite3.Error:
+        return None
+    finally:
+        connection.close()
+
+    directories = dict()
+    versioned = set()
+    unknown = False
+    for relpath, presence, kind, properties, checksum, size, mtime in nodes:
+        versioned.add(relpath)
+
+        if presence == "incomplete":
+            return True
+
+        if presence != "normal":
+            continue
+
+        try:
+            properties = _read_svn_properties(properties)
+        except ValueError:
+            return None
+
+        node_path = os.path.join(path, relpath)
+        try:
+            info = os.lstat(node_path)
+        except OSError:
+            return True
+
+        if kind == "dir":
+            if not S_ISDIR(info.st_mode):
+                return True
+
+            directories[relpath] = properties
+            continue
+
+        if S_ISDIR(info.st_mode):
+            return True
+
+        if size is None or mtime is None:
+            unknown = True
+            continue
+
+        if "svn:special" not in properties and info.st_size != size:
+            return True
+
+        # Subversion records the modification time in microseconds.
+        if int(round(info.st_mtime * 1000000)) == mtime:
+            continue
+
+        if any(name in properties for name in SVN_TRANSLATED_PROPERTIES):
+            unknown = True
+            continue
+
+        pristine = _is_pristine(svn_dir, node_path, checksum)
+        if pristine is False:
+            return True
+
+        if pristine is None:
+            unknown = True
+
+    if untracked:
+        global_ignores = _get_svn_global_ignores()
+        for relpath, properties in directories.items():
+            patterns = list(global_ignores)
+            patterns += properties.get("svn:ignore", "").split("\n")
+
+            # Global ignores set on a directory also apply to every directory below it.
+            parent = relpath
+            while True:
+                patterns += directories.get(parent, dict()).get("svn:global-ignores", "").split("\n")
+                if not parent:
+                    break
+
+                parent = os.path.dirname(parent)
+
+            patterns = [pattern.strip() for pattern in patterns if pattern.strip()]
+
+            try:
+                names = os.listdir(os.path.join(path, relpath))
+            except OSError:
+                return None
+
+            for name in names:
+                if not relpath and name == ".svn":
+                    continue
+
+                if relpath:
+                    child = relpath + "/" + name
+                else:
+                    child = name
+
+                if child in versioned:
+                    continue
+
+                if not any(fnmatchcase(name, pattern) for pattern in patterns):
+                    return True
+
+    if unknown:
+        return None
+
+    return False
+
+
+def read_git_index(path):
+    """Read the entries of the git index of a working tree.
+
+    :param path: The path to the working tree.
+    :type path: str
+
+    :rtype: list[GitIndexEntry] | None
+    :returns: The entries in the order they appear in the index, or ``None`` if there is no index.
+    :raises: ValueError
+
+    .. note::
+        Versions 2, 3, and 4 of the index format are supported.
+
+    """
+    git_dir = get_git_dir(path)
+    if git_dir is None:
+        return None
+
+    index_path = os.path.join(git_dir, "index")
+    try:
+        with open(index_path, "rb") as f:
+            data = f.read()
+    except EnvironmentError:
+        return None
+
+    if len(data) < GIT_INDEX_HEADER.size:
+        raise ValueError("Invalid git index: %s" % index_path)
+
+    signature, version, count = GIT_INDEX_HEADER.unpack_from(data)
+    if signature != "DIRC" or version not in (2, 3, 4):
+        raise ValueError("Unsupported git index: %s" % index_path)
+
+    hash_size = _get_hash_size(git_dir)
+
+    entries = list()
+    offset = GIT_INDEX_HEADER.size
+    previous = ""
+    try:
+        for _ in range(count):
+            start = offset
+
+            values = GIT_INDEX_STAT.unpack_from(data, offset)
+            offset += GIT_INDEX_STAT.size
+
+            sha = data[offset:offset + hash_size]
+            offset += hash_size
+
+            flags = struct.unpack_from(">H", data, offset)[0]
+            offset += 2
+
+            extended_flags = 0
+            if flags & GIT_INDEX_EXTENDED:
+                extended_flags = struct.unpack_from(">H", data, offset)[0]
+                offset += 2
+
+            if version == 4:
+                # The path is stored as the number of bytes to remove from the end of the previous path, followed by
+                # the bytes to append.
+                strip, offset = _read_varint(data, offset)
+                end = data.index("\0", offset)
+                name = previous[:len(previous) - strip] + data[offset:end]
+                offset = end + 1
+            else:
+                # Entries are padded with one to eight NUL bytes to a multiple of eight bytes.
+                end = data.index("\0", offset)
+                name = data[offset:end]
+                offset = start + ((end - start + 8) // 8) * 8
+
+            previous = name
+
+            entries.append(GitIndexEntry(name, values[2], values[9], values[6], sha, flags, extended_flags))
+    except (IndexError, struct.error):
+        raise ValueError("Invalid git index: %s" % index_path)
+
+    return entries
+
+
+def _get_blob_id(path, info, hash_size=20):
+    """Get the object identifier that git would give a file.
+
+    :param path: The path to the file.
+    :type path: str
+
+    :param info: The result of ``lstat()`` for the file.
+
+    :param hash_size: The number of bytes in an object identifier; 20 for SHA-1 or 32 for SHA-256.
+    :type hash_size: int
+
+    :rtype: str | None
+    :returns: The identifier in binary form or ``None`` if the file could not be read.
+
+    """
+    try:
+        if S_ISLNK(info.st_mode):
+            content = os.readlink(path)
+        else:
+            with open(path, "rb") as f:
+                content = f.read()
+    except EnvironmentError:
+        return None
+
+    if hash_size == 32:
+        blob = sha256()
+    else:
+        blob = sha1()
+
+    blob.update("blob %s\0" % len(content))
+    blob.update(content)
+
+    return blob.digest()
+
+
+def _get_hash_size(git_dir):
+    """Get the size of the object identifiers used by a repo.
+
+    :param git_dir: The git directory.
+    :type git_dir: str
+
+    :rtype: int
+
+    """
+    try:
+        with open(os.path.join(git_dir, "config"), "rb") as f:
+            config = f.read()
+    except EnvironmentError:
+        return 20
+
+    if re.search(r"objectformat\s*=\s*sha256", config, re.IGNORECASE):
+        return 32
+
+    return 20
+
+
+def _get_svn_global_ignores():
+    """Get the patterns of unversioned files that Subversion ignores everywhere.
+
+    :rtype: list[str]
+
+    """
+    config = RawConfigParser()
+    try:
+        config.read(["/etc/subversion/config", os.path.expanduser("~/.subversion/config")])
+    except ConfigParserError:
+        return SVN_GLOBAL_IGNORES.split()
+
+    if config.has_option("miscellany", "global-ignores"):
+        return config.get("miscellany", "global-ignores").split()
+
+    return SVN_GLOBAL_IGNORES.split()
+
+
+def _is_pristine(svn_dir, path, checksum):
+    """Determine whether a file is the same as its pristine copy in a Subversion working copy.
+
+    :param svn_dir: The path to the ``.svn`` directory.
+    :type svn_dir: str
+
+    :param path: The path to the file.
+    :type path: str
+
+    :param checksum: The checksum of the pristine copy as recorded in ``wc.db``, such as ``$sha1$<hex>``.
+    :type checksum: str
+
+    :rtype: bool | None
+    :returns: ``None`` if either file could not be read.
+
+    """
+    if not checksum or not checksum.startswith("$sha1$"):
+        return None
+
+    digest = checksum[6:]
+    pristine_path = os.path.join(svn_dir, "pristine", digest[:2], digest + ".svn-base")
+
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+
+        with open(pristine_path, "rb") as f:
+            pristine = f.read()
+    except EnvironmentError:
+        return None
+
+    return content == pristine
+
+
+def _read_svn_properties(data):
+    """Read the properties of a Subversion node, which are stored as a skel, for example
+    ``(svn:ignore 6 build\\n svn:eol-style 6 native)``.
+
+    :param data: The skel as stored in ``wc.db``.
+    :type data: str | None
+
+    :rtype: dict
+    :raises: ValueError
+
+    """
+    if not data:
+        return dict()
+
+    data = str(data)
+
+    # A skel is made up of lists in parentheses and atoms. An atom is either a name that ends with white space or a
+    # parenthesis, or a length and a single space followed by that many bytes.
+    stack = [list()]
+    offset = 0
+    while offset < len(data):
+        character = data[offset]
+
+        if character.isspace():
+            offset += 1
+        elif character == "(":
+            stack.append(list())
+            offset += 1
+        elif character == ")":
+            if len(stack) < 2:
+                raise ValueError("Invalid skel.")
+
+            item = stack.pop()
+            stack[-1].append(item)
+            offset += 1
+        elif character.isdigit():
+            end = offset
+            while end < len(data) and data[end].isdigit():
+                end += 1
+
+            start = end + 1
+            end = start + int(data[offset:end])
+            if end > len(data):
+                raise ValueError("Invalid skel.")
+
+            stack[-1].append(data[start:end])
+            offset = end
+        else:
+            end = offset
+            while end < len(data) and not data[end].isspace() and data[end] not in "()":
+                end += 1
+
+            stack[-1].append(data[offset:end])
+            offset = end
+
+    if len(stack) != 1 or len(stack[0]) != 1 or not isinstance(stack[0][0], list):
+        raise ValueError("Invalid skel.")
+
+    items = stack[0][0]
+    return dict(zip(items[0::2], items[1::2]))
+
+
+def _read_varint(data, offset):
+    """Read a variable length integer as written by git.
+
+    :param data: The data.
+    :type data: str
+
+    :param offset: The position of the integer within the data.
+    :type offset: int
+
+    :rtype: tuple(int, int)
+    :returns: The integer and the position of the next byte.
+
+    """
+    byte = ord(data[offset])
+    offset += 1
+
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = ord(data[offset])
+        offset += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+
+    return value, offset
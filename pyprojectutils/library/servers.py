@@ -0,0 +1,375 @@
+"""
+.. versionadded:: 0.36.0-d
+
+A local server that runs commands in a long-lived process, and the client used to forward commands to it.
+
+Each command otherwise starts a new Python process that imports GitPython, jinja2, and PyGithub before it scans the
+disk. The server has already done both, so a forwarded command is able to answer from memory. Commands are only
+forwarded when the server is running; otherwise they run as usual.
+
+Communication takes place over a Unix domain socket located at ``PROJECT_SERVER_SOCKET``. The client sends a single
+line of JSON with the command, arguments, and working directory. The server responds with a series of frames, each of
+which is a one byte type followed by a four byte length and the data:
+
+- ``1``: Data written to standard output.
+- ``2``: Data written to standard error.
+- ``r``: The server refused the command. The client should run the command itself.
+- ``x``: The exit code of the command. This is always the last frame.
+
+.. note::
+    This module intentionally depends only upon the standard library, ``constants``, and ``variables`` so that the
+    client may be imported without the overhead of the other library modules.
+
+"""
+# Imports
+
+import json
+import os
+import socket
+# noinspection PyCompatibility
+from SocketServer import StreamRequestHandler, UnixStreamServer
+import struct
+import sys
+import traceback
+from .constants import EXIT_OK, EXIT_OTHER
+from .variables import PROJECT_SERVER_SOCKET
+
+# Exports
+
+__all__ = (
+    "ENVIRONMENT_VARIABLES",
+    "forward_command",
+    "is_server_running",
+    "CommandServer",
+)
+
+# Constants
+
+ENVIRONMENT_VARIABLES = (
+    "BITBUCKET_PASSWORD",
+    "BITBUCKET_USER",
+    "DEVELOPER_CODE",
+    "DEVELOPER_NAME",
+    "DOCUMENTATION_HOME",
+    "GITHUB_PASSWORD",
+    "GITHUB_USER",
+    "HOME",
+    "PROBE_JOBS",
+    "PROBE_TIMEOUT",
+    "PROJECT_ARCHIVE",
+    "PROJECT_HOME",
+    "PROJECT_INDEX",
+    "PROJECT_TRACE",
+    "PROJECTS_ON_HOLD",
+    "PYROJECTUTILS_DISABLE_COLORS",
+    "REPO_META_PATH",
+)
+"""The environment variables that must be the same for the client and the server. The server refuses commands from a
+client with a different environment, because the results would not be the same as running the command directly."""
+
+FRAME_HEADER = struct.Struct(">cI")
+"""The type and length of a frame."""
+
+# Functions
+
+
+def forward_command(name, arguments=None, path=PROJECT_SERVER_SOCKET):
+    """Run a command on the server, if it is running.
+
+    :param name: The name of the command, such as ``lsprojects``.
+    :type name: str
+
+    :param arguments: The command line arguments. Defaults to ``sys.argv[1:]``.
+    :type arguments: list[str]
+
+    :param path: The path to the server's socket.
+    :type path: str
+
+    :rtype: int | None
+    :returns: The exit code of the command or ``None`` if the server is not running or refused the command. The output
+              of the command is written to standard output and standard error as it is received.
+
+    """
+    if not os.path.exists(path):
+        return None
+
+    if arguments is None:
+        arguments = sys.argv[1:]
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(path)
+    except socket.error:
+        connection.close()
+        return None
+
+    request = {
+        'arguments': arguments,
+        'command': name,
+        'cwd': os.getcwd(),
+        'environment': _get_environment(),
+    }
+
+    try:
+        connection.sendall(json.dumps(request) + "\n")
+
+        stream = connection.makefile("rb")
+        while True:
+            frame_type, data = _read_frame(stream)
+
+            if frame_type == "1":
+                sys.stdout.write(data)
+                sys.stdout.flush()
+            elif frame_type == "2":
+                sys.stderr.write(data)
+                sys.stderr.flush()
+            elif frame_type == "x":
+                return int(data)
+            else:
+                return None
+    except (EOFError, ValueError, socket.error):
+        # The server stopped before the command finished. The command may have produced partial output, but running
+        # it again is better than producing nothing.
+        return None
+    finally:
+        connection.close()
+
+
+def is_server_running(path=PROJECT_SERVER_SOCKET):
+    """Determine whether the server is accepting connections.
+
+    :param path: The path to the server's socket.
+    :type path: str
+
+    :rtype: bool
+
+    """
+    if not os.path.exists(path):
+        return False
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(path)
+        return True
+    except socket.error:
+        return False
+    finally:
+        connection.close()
+
+
+def _get_environment():
+    """Get the values of the ``ENVIRONMENT_VARIABLES``.
+
+    :rtype: dict
+
+    """
+    return dict((name, os.environ.get(name)) for name in ENVIRONMENT_VARIABLES)
+
+
+def _read_frame(stream):
+    """Read a frame.
+
+    :param stream: The file-like object from which the frame is read.
+
+    :rtype: tuple(str, str)
+    :returns: The frame type and data.
+    :raises: EOFError
+
+    """
+    header = stream.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        raise EOFError()
+
+    frame_type, length = FRAME_HEADER.unpack(header)
+
+    data = stream.read(length)
+    if len(data) < length:
+        raise EOFError()
+
+    return frame_type, data
+
+
+def _write_frame(stream, frame_type, data):
+    """Write a frame.
+
+    :param stream: The file-like object to which the frame is written.
+
+    :param frame_type: The frame type.
+    :type frame_type: str
+
+    :param data: The data.
+    :type data: str
+
+    """
+    if isinstance(data, unicode):
+        data = data.encode("utf-8")
+
+    stream.write(FRAME_HEADER.pack(frame_type, len(data)) + data)
+    stream.flush()
+
+# Classes
+
+
+class CommandServer(UnixStreamServer):
+    """Run commands on behalf of clients.
+
+    Commands are run one at a time in the server process, with standard output and standard error sent to the client.
+    Only commands that do not prompt for input should be served.
+
+    .. code-block:: python
+
+        server = CommandServer({'lsprojects': list_projects_command})
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+
+    """
+
+    def __init__(self, commands, path=PROJECT_SERVER_SOCKET):
+        """Initialize the server and start listening.
+
+        :param commands: The commands that may be run, keyed by name. Each command is a callable that takes no
+                         arguments and reads ``sys.argv``, as the functions in ``cli.py`` do.
+        :type commands: dict
+
+        :param path: The path to the server's socket. An existing socket is replaced unless a server is using it.
+        :type path: str
+
+        :raises: socket.error
+
+        """
+        self.commands = commands
+        self.path = path
+
+        if is_server_running(path):
+            raise socket.error("A server is already running at: %s" % path)
+
+        if os.path.exists(path):
+            os.remove(path)
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        UnixStreamServer.__init__(self, path, CommandRequestHandler)
+
+        # Only the current user may connect.
+        os.chmod(path, 0o600)
+
+    def run(self, name, arguments, cwd, stdout, stderr):
+        """Run a command.
+
+        :param name: The name of the command.
+        :type name: str
+
+        :param arguments: The command line arguments.
+        :type arguments: list[str]
+
+        :param cwd: The working directory of the client.
+        :type cwd: str
+
+        :param stdout: Standard output of the command.
+
+        :param stderr: Standard error of the command.
+
+        :rtype: int
+        :returns: The exit code.
+
+        """
+        original_argv = sys.argv
+        original_cwd = os.getcwd()
+        original_stderr = sys.stderr
+        original_stdout = sys.stdout
+
+        sys.argv = [name] + list(arguments)
+        sys.stderr = stderr
+        sys.stdout = stdout
+
+        try:
+            os.chdir(cwd)
+            self.commands[name]()
+            exit_code = EXIT_OK
+        except SystemExit as e:
+            if e.code is None:
+                exit_code = EXIT_OK
+            elif isinstance(e.code, int):
+                exit_code = e.code
+            else:
+                stderr.write("%s\n" % e.code)
+                exit_code = EXIT_OTHER
+        except Exception:
+            traceback.print_exc(file=stderr)
+            exit_code = EXIT_OTHER
+        finally:
+            sys.argv = original_argv
+            sys.stderr = original_stderr
+            sys.stdout = original_stdout
+            os.chdir(original_cwd)
+
+        return exit_code
+
+    def server_close(self):
+        """Stop listening and remove the socket."""
+        UnixStreamServer.server_close(self)
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class CommandRequestHandler(StreamRequestHandler):
+    """Handle a single command sent by ``forward_command()``."""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            name = request['command']
+            arguments = request['arguments']
+            cwd = request['cwd']
+            environment = request['environment']
+        except (KeyError, TypeError, ValueError):
+            _write_frame(self.wfile, "r", "Invalid request.")
+            return
+
+        if name not in self.server.commands:
+            _write_frame(self.wfile, "r", "Command is not served: %s" % name)
+            return
+
+        if environment != _get_environment():
+            _write_frame(self.wfile, "r", "The environment of the client does not match the server.")
+            return
+
+        try:
+            exit_code = self.server.run(
+                name,
+                arguments,
+                cwd,
+                stdout=FrameWriter(self.wfile, "1"),
+                stderr=FrameWriter(self.wfile, "2")
+            )
+            _write_frame(self.wfile, "x", str(exit_code))
+        except socket.error:
+            # The client has gone away.
+            pass
+
+
+class FrameWriter(object):
+    """A file-like object that sends whatever is written to it as frames of the given type."""
+
+    def __init__(self, stream, frame_type):
+        self.frame_type = frame_type
+        self.stream = stream
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+    def write(self, data):
+        if data:
+            _write_frame(self.stream, self.frame_type, data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
@@ -5,44 +5,164 @@
 """
 # Imports
 
-from subprocess import CalledProcessError, check_output
+# noinspection PyCompatibility
+import commands
+from multiprocessing.pool import ThreadPool
+import os
+import re
+import shlex
+import signal
+from subprocess import list2cmdline, PIPE, Popen
+from threading import Timer
+import time
+from .tracing import tracer
 
 # Exports
 
 __all__ = (
+    "getstatusoutput",
+    "run_many",
     "Command",
 )
 
+# Constants
+
+SHELL_PATTERN = re.compile(r"[|&;<>()$`*?\[\]{}~\n]")
+"""Matches the characters that require a command string to be run by the shell. Quotes are handled without a shell."""
+
 # Functions
 
 
+def getstatusoutput(cmd):
+    """Run a command with the shell, recording it when tracing is enabled. Otherwise the same as
+    ``commands.getstatusoutput()``.
+
+    :param cmd: The command.
+    :type cmd: str
+
+    :rtype: tuple(int, str)
+
+    .. versionadded:: 0.36.0-d
+
+    """
+    if not tracer.enabled:
+        return commands.getstatusoutput(cmd)
+
+    started = time.time()
+    status, output = commands.getstatusoutput(cmd)
+
+    if os.WIFEXITED(status):
+        exit_status = os.WEXITSTATUS(status)
+    else:
+        exit_status = None
+
+    tracer.record_command(cmd, time.time() - started, exit_status)
+
+    return status, output
+
+
+def run_many(commands, jobs=None):
+    """Run several commands, some of them at the same time.
+
+    :param commands: The commands to run.
+    :type commands: list[Command]
+
+    :param jobs: The maximum number of commands to run at the same time. Defaults to the number of commands.
+    :type jobs: int
+
+    :rtype: list[str | None]
+    :returns: The output of each command, in the same order as the commands. The ``status`` and ``error`` of each
+              command are set as though ``run()`` had been called.
+
+    .. versionadded:: 0.36.0-d
+
+    """
+    commands = list(commands)
+    if not commands:
+        return list()
+
+    if jobs is None:
+        jobs = len(commands)
+
+    if jobs > 1 and len(commands) > 1:
+        pool = ThreadPool(min(jobs, len(commands)))
+        try:
+            pool.map(_run, commands)
+        finally:
+            # All of the commands have finished, so there is no need to wait for the pool's threads to stop.
+            pool.close()
+    else:
+        for command in commands:
+            command.run()
+
+    return [command.output for command in commands]
+
+
+def _run(command):
+    """Run a command. This is a module-level function so that it may be handed to a worker pool."""
+    return command.run()
+
+# Classes
+
+
 class Command(object):
     """Represents a base shell command.,
 
     .. versionadded:: 0.27.0-d
 
-    .. note::
-        We are using ``shell=True`` to support piping and (possibly other) shell features. This is not advised due to
-        security concerns, but all commands are processed internally without user input, so we feel the risk is low.
-        See http://stackoverflow.com/a/13332300/241720
+    .. versionchanged:: 0.36.0-d
+        The command is executed directly rather than by the shell, unless the command string includes characters such
+        as pipes or redirection that only the shell can handle. Added ``cache``, ``fingerprint``, ``quiet``, and
+        ``timeout`` parameters.
 
     """
 
-    def __init__(self, string, path=None):
+    def __init__(self, string, path=None, cache=None, fingerprint=None, quiet=False, timeout=None):
         """Prepare the command.
 
-        :param string: The command to be executed.
-        :type string: str
+        :param string: The command to be executed. Given as a list, the first item is the program and the others are
+                       its arguments, which are passed as is. Given as a string, the command is split like the shell
+                       would split it.
+        :type string: str | list[str]
 
         :param path: The path from which the command should be executed.
         :type path: str
 
+        :param cache: The index in which the result of the command is cached. The result is re-used while the
+                      fingerprint of ``path`` remains the same. Only use a cache for commands that change nothing.
+        :type cache: CommandIndex
+
+        :param fingerprint: The current fingerprint of ``path``. Defaults to the index's ``get_fingerprint()``.
+        :type fingerprint: tuple
+
+        :param quiet: Discard anything the command writes to standard error.
+        :type quiet: bool
+
+        :param timeout: The number of seconds after which the command is stopped. ``None`` waits indefinitely.
+        :type timeout: float
+
         """
+        self.cache = cache
         self.error = None
+        self.fingerprint = fingerprint
         self.output = None
+        self.quiet = quiet
         self.status = None
-        self.string = string
-        self._tokens = string.split(" ")
+        self.timeout = timeout
+        self.timed_out = False
+
+        if isinstance(string, (list, tuple)):
+            self.string = list2cmdline(string)
+            self._shell = False
+            self._tokens = list(string)
+        elif SHELL_PATTERN.search(string):
+            self.string = string
+            self._shell = True
+            self._tokens = string
+        else:
+            self.string = string
+            self._shell = False
+            self._tokens = shlex.split(string)
 
         if path:
             self.path = r'%s' % path
@@ -65,21 +185,135 @@ class Command(object):
             return self.string
 
     def raw(self):
-        """Run the command without exception handling. Useful for debugging."""
-        self.output = check_output(self._tokens, cwd=self.path, shell=True)
+        """Run the command without exception handling. Useful for debugging.
+
+        :raises: OSError
+
+        """
+        self.status, self.output = self._execute()
 
     def run(self):
         """Run the command.
 
         :rtype: bool
 
+        .. versionchanged:: 0.36.0-d
+            ``status`` is ``None`` if the command could not be started or did not finish before the timeout, in which
+            case ``timed_out`` is also ``True``.
+
         """
         try:
-            self.output = check_output(self._tokens, cwd=self.path, shell=True)
-            self.status = 0
-            return True
-        except CalledProcessError as e:
-            self.error = e.message
-            self.output = e.output
-            self.status = e.returncode
+            self.status, self.output = self._execute()
+        except OSError as e:
+            self.error = "Could not run %s: %s" % (self.string, e.strerror)
+            self.output = None
+            self.status = None
             return False
+
+        if self.timed_out:
+            self.error = "Command timed out after %s seconds: %s" % (self.timeout, self.string)
+            self.status = None
+            return False
+
+        if self.status != 0:
+            self.error = "Command '%s' returned non-zero exit status %s" % (self.string, self.status)
+            return False
+
+        return True
+
+    def _execute(self):
+        """Execute the command or get its result from the cache, recording it when tracing is enabled.
+
+        :rtype: tuple(int, str)
+        :returns: The exit status and output.
+        :raises: OSError
+
+        """
+        self.error = None
+        self.timed_out = False
+
+        # The fingerprint is taken before the command runs so that changes made while it runs are seen next time.
+        use_cache = self.cache is not None and self.path is not None
+        if use_cache:
+            fingerprint = self.fingerprint
+            if fingerprint is None:
+                fingerprint = self.cache.get_fingerprint(self.path)
+
+            result = self.cache.get(self.string, self.path, fingerprint=fingerprint)
+            if result is not None:
+                if tracer.enabled:
+                    tracer.record_command("%s (cached)" % self.string, 0.0, result[0], path=self.path)
+
+                return result
+
+        if not tracer.enabled:
+            status, output = self._communicate()
+        else:
+            started = time.time()
+            status = None
+            try:
+                status, output = self._communicate()
+            finally:
+                tracer.record_command(self.string, time.time() - started, None if self.timed_out else status,
+                                      path=self.path)
+
+        if use_cache and not self.timed_out:
+            # noinspection PyUnboundLocalVariable
+            self.cache.set(self.string, self.path, status, output, fingerprint=fingerprint)
+
+        return status, output
+
+    def _communicate(self):
+        """Start the command and wait for it to finish, stopping it if the timeout expires.
+
+        :rtype: tuple(int, str)
+        :raises: OSError
+
+        """
+
+        # The command is placed in its own process group so that the shell and anything it has started may be stopped
+        # together.
+        if self.timeout is not None and hasattr(os, "setsid"):
+            preexec_fn = os.setsid
+        else:
+            preexec_fn = None
+
+        if self.quiet:
+            stderr = open(os.devnull, "wb")
+        else:
+            stderr = None
+
+        try:
+            process = Popen(self._tokens, cwd=self.path, preexec_fn=preexec_fn, shell=self._shell, stderr=stderr,
+                            stdout=PIPE)
+
+            if self.timeout is None:
+                output = process.communicate()[0]
+                return process.returncode, output
+
+            timer = Timer(self.timeout, self._kill, (process, preexec_fn is not None))
+            timer.start()
+            try:
+                output = process.communicate()[0]
+            finally:
+                timer.cancel()
+
+            return process.returncode, output
+        finally:
+            if stderr is not None:
+                stderr.close()
+
+    def _kill(self, process, group=False):
+        """Stop a command that has run for too long."""
+        if process.poll() is not None:
+            return
+
+        self.timed_out = True
+
+        try:
+            if group:
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except OSError:
+            pass
@@ -11,6 +11,7 @@ from .exceptions import OutputError
 
 __all__ = (
     "bool_to_yes_no",
+    "bytes_to_human",
     "debug",
     "find_file",
     "get_input",
@@ -22,6 +23,7 @@ __all__ = (
     "print_warning",
     "read_file",
     "write_file",
+    "write_lines",
 )
 
 # Functions
@@ -59,6 +61,39 @@ def bool_to_yes_no(value, color_enabled=False, color_no=None, color_yes=None):
             return "no"
 
 
+def bytes_to_human(value, default="TBD"):
+    """Convert a number of bytes to a human readable size in the style of ``du -h``.
+
+    :param value: The number of bytes.
+    :type value: int
+
+    :param default: Returned when ``value`` is ``None``.
+    :type default: str
+
+    :rtype: str
+
+    .. versionadded:: 0.36.0-d
+
+    """
+    if value is None:
+        return default
+
+    if value < 1024:
+        return "%sB" % value
+
+    size = float(value)
+    for unit in ("K", "M", "G", "T", "P"):
+        size /= 1024
+
+        if size < 1024 or unit == "P":
+            break
+
+    if size < 10:
+        return "%.1f%s" % (size, unit)
+
+    return "%d%s" % (round(size), unit)
+
+
 def debug(location, message, line=None):
     """Print a debug message.
 
@@ -350,3 +385,28 @@ def write_file(path, content):
         return True
     except IOError as e:
         raise OutputError(e.message)
+
+
+def write_lines(path, lines):
+    """Write lines to a file as they are produced.
+
+    :param path: Path to the file.
+    :type path: str
+
+    :param lines: The lines to write. A line ending is added to each line.
+    :type lines: collections.Iterable[str]
+
+    :rtype: bool
+    :returns: ``True`` if the file could be written.
+
+    .. versionadded:: 0.36.0-d
+
+    """
+    try:
+        with open(path, "wb") as f:
+            for line in lines:
+                f.write(line + "\n")
+            f.close()
+        return True
+    except IOError as e:
+        raise OutputError(e.message)
@@ -0,0 +1,328 @@
+"""
+.. versionadded:: 0.36.0-d
+
+Record where a command spends its time. Tracing is enabled by the ``PROJECT_TRACE`` environment variable or the
+``--trace`` option, in which case a summary is written to standard error when the command exits.
+
+Two kinds of records are kept:
+
+- Phases, such as parsing ``project.ini`` or getting the state of the repo. A phase is timed with :py:func:`trace`.
+  The time of a phase does not include the time of any phase nested within it, so the times may be added together.
+- Commands run through ``shell.Command`` or ``shell.getstatusoutput()``, with the wall time, exit status, and project.
+
+.. code-block:: python
+
+    from library.tracing import trace
+
+    with trace("scm", project="example"):
+        scm = get_scm()
+
+Tracing adds next to nothing when it is disabled.
+
+.. note::
+    This module intentionally depends only upon the standard library and ``variables``.
+
+"""
+# Imports
+
+import atexit
+import os
+import sys
+from threading import local, Lock
+import time
+from .variables import PROJECT_TRACE
+
+# Exports
+
+__all__ = (
+    "PHASES",
+    "trace",
+    "trace_iter",
+    "tracer",
+    "Tracer",
+)
+
+# Constants
+
+PHASES = (
+    ("load", "Finding and loading projects, other than the phases below."),
+    ("ini", "Parsing project.ini and other meta files."),
+    ("scm", "Getting the SCM, branch, and dirty state."),
+    ("tree", "Counting or listing directories and files."),
+    ("du", "Calculating disk usage."),
+    ("cloc", "Counting lines of code."),
+    ("format", "Producing the output."),
+)
+"""The phases reported in the summary, in order, with a description of each."""
+
+# Functions
+
+
+def trace(phase, project=None):
+    """Time a phase of the current command.
+
+    :param phase: The name of the phase. See ``PHASES``.
+    :type phase: str
+
+    :param project: The name of the project to which the phase applies, if any.
+    :type project: str
+
+    :returns: A context manager.
+
+    """
+    if not tracer.enabled:
+        return _NULL_PHASE
+
+    return _Phase(tracer, phase, project)
+
+
+def trace_iter(phase, iterable):
+    """Time the production of each item of an iterable as a phase.
+
+    :param phase: The name of the phase.
+    :type phase: str
+
+    :param iterable: The iterable, typically a generator that does its work as items are requested.
+
+    :returns: A generator that yields the same items.
+
+    """
+    iterator = iter(iterable)
+    while True:
+        with trace(phase):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+
+        yield item
+
+# Classes
+
+
+class Tracer(object):
+    """Collect phases and commands, and summarize them."""
+
+    def __init__(self, enabled=False, stream=None):
+        """Initialize the tracer.
+
+        :param enabled: Indicates whether tracing is enabled.
+        :type enabled: bool
+
+        :param stream: The stream to which the summary is written. Defaults to standard error.
+
+        """
+        self.commands = list()
+        self.enabled = False
+        self.phases = dict()
+        self.started = None
+        self.stream = stream
+
+        self._local = local()
+        self._lock = Lock()
+        self._registered = False
+
+        if enabled:
+            self.enable(stream=stream)
+
+    def enable(self, stream=None):
+        """Enable tracing and write the summary when the process exits.
+
+        :param stream: The stream to which the summary is written. Defaults to standard error.
+
+        """
+        if stream is not None:
+            self.stream = stream
+
+        if self.enabled:
+            return
+
+        self.enabled = True
+        self.started = time.time()
+
+        if not self._registered:
+            atexit.register(self.write_summary)
+            self._registered = True
+
+    def get_project(self):
+        """Get the project of the innermost phase of the current thread.
+
+        :rtype: str | None
+
+        """
+        for phase in reversed(self._get_stack()):
+            if phase.project:
+                return phase.project
+
+        return None
+
+    def get_summary(self):
+        """Get the summary of phases and commands.
+
+        :rtype: list[str]
+
+        """
+        lines = list()
+
+        elapsed = time.time() - (self.started or time.time())
+        lines.append("Trace summary: %.3fs in total" % elapsed)
+        lines.append("")
+
+        with self._lock:
+            phases = dict(self.phases)
+            commands = list(self.commands)
+
+        names = [name for name, description in PHASES if name in phases]
+        names += sorted(name for name in phases if name not in names)
+
+        lines.append("%-8s %8s %10s  %s" % ("Phase", "Calls", "Time", "Slowest"))
+        for name in names:
+            calls, total, slowest, project = phases[name]
+
+            if project:
+                lines.append("%-8s %8s %9.3fs  %s (%.3fs)" % (name, calls, total, project, slowest))
+            else:
+                lines.append("%-8s %8s %9.3fs  %.3fs" % (name, calls, total, slowest))
+
+        lines.append("")
+
+        total = sum([command[1] for command in commands])
+        lines.append("Commands: %s (%.3fs)" % (len(commands), total))
+        for string, duration, status, project in sorted(commands, key=lambda c: c[1], reverse=True):
+            if status is None:
+                status = "-"
+
+            lines.append("%9.3fs %4s  %s: %s" % (duration, status, project or "-", string))
+
+        return lines
+
+    def record_command(self, string, duration, status, path=None, project=None):
+        """Record a command that has finished.
+
+        :param string: The command.
+        :type string: str
+
+        :param duration: The wall time of the command in seconds.
+        :type duration: float
+
+        :param status: The exit status or ``None`` if the command could not be run or was stopped.
+        :type status: int | None
+
+        :param path: The directory in which the command was run, if any.
+        :type path: str
+
+        :param project: The name of the project for which the command was run. Defaults to the project of the current
+                        phase or the name of the directory in which the command was run.
+        :type project: str
+
+        """
+        if not self.enabled:
+            return
+
+        if project is None:
+            project = self.get_project()
+
+        if project is None and path:
+            project = os.path.basename(os.path.normpath(path))
+
+        with self._lock:
+            self.commands.append((string, duration, status, project))
+
+    def record_phase(self, name, duration, project=None):
+        """Record the time of a phase.
+
+        :param name: The name of the phase.
+        :type name: str
+
+        :param duration: The time in seconds, not including nested phases.
+        :type duration: float
+
+        :param project: The name of the project, if any.
+        :type project: str
+
+        """
+        with self._lock:
+            calls, total, slowest, slowest_project = self.phases.get(name, (0, 0.0, 0.0, None))
+
+            if duration >= slowest:
+                slowest = duration
+                slowest_project = project
+
+            self.phases[name] = (calls + 1, total + duration, slowest, slowest_project)
+
+    def reset(self):
+        """Discard the phases and commands recorded so far."""
+        with self._lock:
+            self.commands = list()
+            self.phases = dict()
+            self.started = time.time()
+
+    def write_summary(self):
+        """Write the summary, if tracing is enabled."""
+        if not self.enabled:
+            return
+
+        stream = self.stream or sys.stderr
+        try:
+            stream.write("\n".join(self.get_summary()) + "\n")
+            stream.flush()
+        except (IOError, ValueError):
+            # The stream has already been closed.
+            pass
+
+    def _get_stack(self):
+        """Get the phases of the current thread that have not yet finished.
+
+        :rtype: list[_Phase]
+
+        """
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = list()
+            return self._local.stack
+
+
+class _NullPhase(object):
+    """Stands in for a phase when tracing is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class _Phase(object):
+    """Time a phase, less the time of the phases nested within it."""
+
+    def __init__(self, tracer, name, project=None):
+        self.name = name
+        self.project = project
+        self.tracer = tracer
+
+        self._nested = 0.0
+        self._started = None
+
+    def __enter__(self):
+        self.tracer._get_stack().append(self)
+        self._started = time.time()
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        elapsed = time.time() - self._started
+
+        stack = self.tracer._get_stack()
+        stack.pop()
+        if stack:
+            stack[-1]._nested += elapsed
+
+        self.tracer.record_phase(self.name, elapsed - self._nested, project=self.project or self.tracer.get_project())
+
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+tracer = Tracer(enabled=bool(PROJECT_TRACE))
+"""The tracer used by the library. Call ``tracer.enable()`` to enable tracing."""
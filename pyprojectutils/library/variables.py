@@ -68,6 +68,27 @@ Default: ``None``
 
 The GitHub user name.
 
+``PROBE_JOBS``
+--------------
+
+Default: ``8``
+
+The maximum number of ``hg`` and ``svn`` commands that are run at the same time to get the state of Mercurial and
+Subversion repos. This also limits the number of git repos that are inspected through GitPython at the same time.
+The default is used if the value is not a whole number.
+
+.. versionadded:: 0.36.0-d
+
+``PROBE_TIMEOUT``
+-----------------
+
+Default: ``10``
+
+The number of seconds after which an ``hg`` or ``svn`` command is stopped. The state of the repo is then unknown. The
+default is used if the value is not a number.
+
+.. versionadded:: 0.36.0-d
+
 ``PROJECT_ARCHIVE``
 -------------------
 
@@ -82,6 +103,24 @@ Default: ``~/Work``
 
 Where active projects are stored.
 
+``PROJECT_INDEX``
+-----------------
+
+Default: ``$PROJECT_HOME/.index``
+
+Where indexes of project information are stored. The contents of this directory may be safely removed at any time.
+
+.. versionadded:: 0.36.0-d
+
+``PROJECT_SERVER_SOCKET``
+-------------------------
+
+Default: ``$PROJECT_INDEX/server.sock``
+
+The Unix domain socket used by the ``projectserver`` command. Commands are forwarded to the server when it is running.
+
+.. versionadded:: 0.36.0-d
+
 ``PROJECTS_ON_HOLD``
 --------------------
 
@@ -133,9 +172,14 @@ __all__ = (
     "GITHUB_USER",
     "GITIGNORE_TEMPLATE",
     "MANIFEST_TEMPLATE",
+    "PROBE_JOBS",
+    "PROBE_TIMEOUT",
     "PROJECT_ARCHIVE",
     "PROJECT_HOME",
+    "PROJECT_INDEX",
     "PROJECT_INI_TEMPLATE",
+    "PROJECT_SERVER_SOCKET",
+    "PROJECT_TRACE",
     "PROJECTS_ON_HOLD",
     "README_TEMPLATE",
     "REQUIREMENTS_TEMPLATE",
@@ -169,12 +213,33 @@ if GITHUB_USER and GITHUB_PASSWORD:
 else:
     GITHUB_ENABLED = False
 
+# Limits on the commands run to get the state of Mercurial and Subversion repos. Malformed values are ignored so that
+# they do not prevent every command from starting.
+try:
+    PROBE_JOBS = int(os.environ.get("PROBE_JOBS", 8))
+except ValueError:
+    PROBE_JOBS = 8
+
+try:
+    PROBE_TIMEOUT = float(os.environ.get("PROBE_TIMEOUT", 10))
+except ValueError:
+    PROBE_TIMEOUT = 10.0
+
 # Location of projects. User home is automatically expanded.
 PROJECT_HOME = os.environ.get("PROJECT_HOME", os.path.expanduser("~/Work"))
 
 # Location of archived projects.
 PROJECT_ARCHIVE = os.environ.get("PROJECT_ARCHIVE", os.path.join(PROJECT_HOME, ".archive"))
 
+# Location of project indexes.
+PROJECT_INDEX = os.environ.get("PROJECT_INDEX", os.path.join(PROJECT_HOME, ".index"))
+
+# Location of the project server's socket.
+PROJECT_SERVER_SOCKET = os.environ.get("PROJECT_SERVER_SOCKET", os.path.join(PROJECT_INDEX, "server.sock"))
+
+# Write a summary of where each command spends its time when it exits.
+PROJECT_TRACE = os.environ.get("PROJECT_TRACE", None)
+
 # Location of projects on hold.
 PROJECTS_ON_HOLD = os.environ.get("PROJECTS_ON_HOLD", os.path.join(PROJECT_HOME, ".hold"))
 
@@ -0,0 +1,368 @@
+"""
+.. versionadded:: 0.36.0-d
+
+Watch project files for changes using the Linux inotify API, which is accessed through ``ctypes``.
+
+Directories are watched rather than the files themselves. Tools such as git replace a file by renaming a temporary
+file over it, which would remove a watch placed on the original file.
+
+.. note::
+    This module intentionally depends only upon the standard library and ``scm``. Waiting for changes uses no CPU
+    because the watcher blocks until the kernel has something to report.
+
+"""
+# Imports
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+from .exceptions import ResourceUnavailable
+from .scm import get_git_dir
+
+# Exports
+
+__all__ = (
+    "GIT_FILES",
+    "PROJECT_FILES",
+    "Inotify",
+    "ProjectWatcher",
+)
+
+# Constants
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+EVENT_HEADER = struct.Struct("iIII")
+"""The fixed part of an inotify event: watch descriptor, mask, cookie, and the length of the name."""
+
+FILE_EVENTS = IN_ATTRIB | IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_ONLYDIR
+"""The events watched on project and git directories."""
+
+LOCATION_EVENTS = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+"""The events watched on the directories where projects are stored."""
+
+GIT_FILES = ("HEAD", "index")
+"""The files in a project's git directory that are watched. These correspond to ``indexes.INDEXED_FILES``."""
+
+PROJECT_FILES = ("project.ini", "VERSION.txt")
+"""The files in a project's root that are watched. These correspond to ``indexes.INDEXED_FILES``."""
+
+# Classes
+
+
+class Inotify(object):
+    """A thin wrapper around an inotify instance."""
+
+    def __init__(self):
+        """Initialize the instance.
+
+        :raises: ResourceUnavailable
+
+        """
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            self._add_watch = libc.inotify_add_watch
+            self._rm_watch = libc.inotify_rm_watch
+            init = libc.inotify_init1
+        except (AttributeError, OSError):
+            raise ResourceUnavailable("Watching for changes requires inotify, which is only available on Linux.")
+
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self._rm_watch.argtypes = (ctypes.c_int, ctypes.c_int)
+
+        self.fd = init(IN_CLOEXEC | IN_NONBLOCK)
+        if self.fd < 0:
+            raise ResourceUnavailable("Could not start inotify: %s" % os.strerror(ctypes.get_errno()))
+
+    def add_watch(self, path, mask):
+        """Watch a path.
+
+        :param path: The path to watch.
+        :type path: str
+
+        :param mask: The events to watch.
+        :type mask: int
+
+        :rtype: int | None
+        :returns: The watch descriptor or ``None`` if the path does not exist (or is not a directory when
+                  ``IN_ONLYDIR`` is given).
+        :raises: ResourceUnavailable
+
+        """
+        if isinstance(path, unicode):
+            path = path.encode("utf-8")
+
+        wd = self._add_watch(self.fd, path, mask)
+        if wd >= 0:
+            return wd
+
+        error = ctypes.get_errno()
+        if error in (errno.EACCES, errno.ENOENT, errno.ENOTDIR):
+            return None
+
+        if error == errno.ENOSPC:
+            raise ResourceUnavailable("The inotify watch limit has been reached. Increase "
+                                      "fs.inotify.max_user_watches to watch this many projects.")
+
+        raise ResourceUnavailable("Could not watch %s: %s" % (path, os.strerror(error)))
+
+    def close(self):
+        """Close the instance, which removes all watches."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def read(self, timeout=None):
+        """Read the events that are available, waiting for them if necessary.
+
+        :param timeout: The number of seconds to wait. ``None`` waits indefinitely.
+        :type timeout: float
+
+        :rtype: list[tuple(int, int, int, str)]
+        :returns: The watch descriptor, mask, cookie, and name of each event. The list is empty if the timeout expires.
+
+        """
+        try:
+            readable = select.select([self.fd], [], [], timeout)[0]
+        except select.error as e:
+            if e.args[0] == errno.EINTR:
+                return list()
+
+            raise
+
+        if not readable:
+            return list()
+
+        try:
+            data = os.read(self.fd, 65536)
+        except OSError as e:
+            if e.errno in (errno.EAGAIN, errno.EINTR):
+                return list()
+
+            raise
+
+        events = list()
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+
+            name = data[offset:offset + length].rstrip("\0")
+            offset += length
+
+            events.append((wd, mask, cookie, name))
+
+        return events
+
+    def remove_watch(self, wd):
+        """Stop watching.
+
+        :param wd: The watch descriptor returned by ``add_watch()``.
+        :type wd: int
+
+        """
+        self._rm_watch(self.fd, wd)
+
+
+class ProjectWatcher(object):
+    """Watch the directories where projects are stored for projects that are added or removed, and watch each project
+    for changes to the files that determine whether its index entry is current.
+
+    .. code-block:: python
+
+        watcher = ProjectWatcher([PROJECT_HOME])
+        try:
+            while True:
+                for root in watcher.wait():
+                    print("Changed: %s" % root)
+        finally:
+            watcher.close()
+
+    """
+
+    def __init__(self, locations):
+        """Initialize the watcher and place the watches.
+
+        :param locations: The directories where projects are stored.
+        :type locations: list[str] | tuple[str]
+
+        :raises: ResourceUnavailable
+
+        """
+        self.locations = [os.path.abspath(location) for location in locations]
+
+        self._inotify = Inotify()
+        self._projects = dict()
+        self._watches = dict()
+
+        try:
+            for location in self.locations:
+                self._watch_location(location)
+        except ResourceUnavailable:
+            self.close()
+            raise
+
+    def close(self):
+        """Stop watching."""
+        self._inotify.close()
+        self._projects = dict()
+        self._watches = dict()
+
+    def get_roots(self):
+        """Get the projects being watched.
+
+        :rtype: list[str]
+
+        """
+        return sorted(self._projects.keys())
+
+    def wait(self, delay=0.25, timeout=None):
+        """Wait for projects to change.
+
+        :param delay: Once a change has been seen, the number of seconds to wait for further changes. A single git
+                      command or edit often writes several files, which are reported together.
+        :type delay: float
+
+        :param timeout: The number of seconds to wait for the first change. ``None`` waits indefinitely.
+        :type timeout: float
+
+        :rtype: list[str]
+        :returns: The roots of projects that have changed, been added, or been removed. The list is empty if the timeout
+                  expires.
+
+        """
+        changed = set()
+
+        events = self._inotify.read(timeout)
+        while events:
+            for event in events:
+                changed.update(self._handle(*event))
+
+            events = self._inotify.read(delay)
+
+            # Changes that are ignored do not end the wait.
+            if not events and not changed and timeout is None:
+                events = self._inotify.read(timeout)
+
+        return sorted(changed)
+
+    def _handle(self, wd, mask, cookie, name):
+        """Handle a single event.
+
+        :rtype: list[str]
+        :returns: The roots of the projects affected by the event.
+
+        """
+        if mask & IN_Q_OVERFLOW:
+            # Events have been lost, so everything is assumed to have changed.
+            return self.get_roots()
+
+        try:
+            root, kind = self._watches[wd]
+        except KeyError:
+            return list()
+
+        if mask & IN_IGNORED:
+            del self._watches[wd]
+            return list()
+
+        if kind == "location":
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                return list()
+
+            if not mask & IN_ISDIR or name.startswith("."):
+                return list()
+
+            project_root = os.path.join(root, name)
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                self._watch_project(project_root)
+            else:
+                self._unwatch_project(project_root)
+
+            return [project_root]
+
+        if kind == "project":
+            if name == ".git":
+                self._watch_git(root)
+                return [root]
+
+            if name in PROJECT_FILES:
+                return [root]
+
+            return list()
+
+        if name in GIT_FILES:
+            return [root]
+
+        return list()
+
+    def _watch(self, path, mask, root, kind):
+        """Add a watch and remember what it is for.
+
+        :rtype: int | None
+
+        """
+        wd = self._inotify.add_watch(path, mask)
+        if wd is not None:
+            self._watches[wd] = (root, kind)
+
+        return wd
+
+    def _watch_git(self, root):
+        """Watch the git directory of a project, if it has one."""
+        git_dir = get_git_dir(root)
+        if git_dir is None:
+            return
+
+        wd = self._watch(git_dir, FILE_EVENTS, root, "git")
+        if wd is not None:
+            self._projects.setdefault(root, set()).add(wd)
+
+    def _watch_location(self, location):
+        """Watch a directory where projects are stored, along with each of the projects."""
+        if self._watch(location, LOCATION_EVENTS, location, "location") is None:
+            return
+
+        try:
+            names = sorted(os.listdir(location))
+        except OSError:
+            return
+
+        for name in names:
+            if name.startswith("."):
+                continue
+
+            self._watch_project(os.path.join(location, name))
+
+    def _watch_project(self, root):
+        """Watch a project root and its git directory."""
+        wd = self._watch(root, FILE_EVENTS, root, "project")
+        if wd is None:
+            return
+
+        self._projects.setdefault(root, set()).add(wd)
+        self._watch_git(root)
+
+    def _unwatch_project(self, root):
+        """Stop watching a project that has been removed or moved away."""
+        for wd in self._projects.pop(root, set()):
+            if self._watches.pop(wd, None) is not None:
+                self._inotify.remove_watch(wd)
@@ -53,21 +53,23 @@ setup(
           'archiveproject = pyprojectutils.cli:archive_project_command',
           'bumpversion = pyprojectutils.cli:bump_version_command',
           'checkoutproject = pyprojectutils.cli:checkout_project_command',
+          'completeproject = pyprojectutils.completions:complete_project_command',
           'createrepo = pyprojectutils.cli:create_repo_command',
           'enableproject = pyprojectutils.cli:enable_project_command',
           'exportgithub = pyprojectutils.cli:export_github_command',
           'holdproject = pyprojectutils.cli:hold_project_command',
           'initproject = pyprojectutils.cli:init_project_command',
           'lsdependencies = pyprojectutils.cli:list_dependencies_command',
-          'lsdocumentation = pyprojectutils.cli:list_documentation_command',
-          'lsprojects = pyprojectutils.cli:list_projects_command',
-          'lsrepos = pyprojectutils.cli:list_repos_command',
+          'lsdocumentation = pyprojectutils.clients:list_documentation_command',
+          'lsprojects = pyprojectutils.clients:list_projects_command',
+          'lsrepos = pyprojectutils.clients:list_repos_command',
           'loremimage = pyprojectutils.cli:lorem_image_command',
           'loremtext = pyprojectutils.cli:lorem_text_command',
           'projecthelp = pyprojectutils.cli:project_help_command',
+          'projectserver = pyprojectutils.cli:project_server_command',
           'randompassword = pyprojectutils.cli:random_password_command',
-          'statdocumentation = pyprojectutils.cli:stat_documentation_command',
-          'statproject = pyprojectutils.cli:stat_project_command',
+          'statdocumentation = pyprojectutils.clients:stat_documentation_command',
+          'statproject = pyprojectutils.clients:stat_project_command',
       ],
     },
 )